@@ -5,14 +5,14 @@
 """Library classes and functions to handle client authorization."""
 
 import logging
-import re
 
-from pydantic import BaseModel, field_serializer
+from pydantic import BaseModel, TypeAdapter, field_serializer
 
 from nmtfast.auth.v1.exceptions import AuthorizationError
 from nmtfast.settings.v1.schemas import SectionACL
 
 logger = logging.getLogger(__name__)
+_SECTION_ACLS_ADAPTER: TypeAdapter[list[SectionACL]] = TypeAdapter(list[SectionACL])
 
 
 class AuthSuccess(BaseModel):
@@ -35,7 +35,9 @@ class AuthSuccess(BaseModel):
         """
         Custom serializer for converting objects to JSON objects.
         """
-        return [acl.model_dump() for acl in acls]
+        # NOTE: dump the whole list in one pydantic-core call, instead of one
+        #   model_dump call per ACL
+        return _SECTION_ACLS_ADAPTER.dump_python(acls)
 
 
 async def check_acl(
@@ -67,29 +69,37 @@ async def check_acl(
     """
     for acl in acls:
         section_regex = acl.section_regex
-        permissions = acl.permissions
+        permissions = acl.permission_set
         filters: list = []  # TODO: implement filters later
 
         # continue if the section does not apply
-        if section_regex and not re.match(section_regex, section):
+        if section_regex and not acl.section_matcher(section):
             continue
 
         user_label = acl.resolved_user_label or acl.principal_name
 
+        allow_all = acl.allow_all
+
         # allow if the section matched, and * is in the and filters is empty
-        if "*" in permissions and not filters:
+        if allow_all and not filters:
             logger.info(
-                f"Allow '*' and empty filter list principal: "
-                f"{acl.principal_name} (user: {user_label} ; memo: {acl.memo})"
+                "Allow '*' and empty filter list principal: %s (user: %s ; memo: %s)",
+                acl.principal_name,
+                user_label,
+                acl.memo,
             )
             return True
 
         # allow if the specific permission is granted
-        if "*" not in permissions and method in permissions:
+        if not allow_all and method in permissions:
             logger.info(
-                f"Allow method '{method}': permissions: {permissions} "
-                f"principal: {acl.principal_name} (user: {user_label} ; "
-                f"memo: {acl.memo})"
+                "Allow method '%s': permissions: %s principal: %s (user: %s ; "
+                "memo: %s)",
+                method,
+                acl.permissions,
+                acl.principal_name,
+                user_label,
+                acl.memo,
             )
             return True
 
@@ -114,9 +124,13 @@ async def check_acl(
         #         return False  # filter specified a field that does not exist in the payload.
 
         logger.debug(
-            f"ACL '{acl.principal_name}' (user: {user_label} ; "
-            f"memo: {acl.memo}) did not grant "
-            f"'{method}' permission for '{section}' section, trying next ACL"
+            "ACL '%s' (user: %s ; memo: %s) did not grant '%s' permission for "
+            "'%s' section, trying next ACL",
+            acl.principal_name,
+            user_label,
+            acl.memo,
+            method,
+            section,
         )
 
     logger.debug("No ACLs granted access")
@@ -4,45 +4,90 @@
 
 """Library functions to process JSON Web Tokens and authenticate API keys."""
 
+import asyncio
+import hmac
 import logging
 
 from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
+from argon2.exceptions import InvalidHashError, VerificationError
 
 from nmtfast.auth.v1.acl import AuthSuccess
-from nmtfast.settings.v1.schemas import AuthSettings
+from nmtfast.auth.v1.hash import secure_hash
+from nmtfast.settings.v1.schemas import AuthSettings, IncomingAuthApiKey
 
 from .exceptions import AuthenticationError, AuthorizationError
 
 logger = logging.getLogger(__name__)
 ph = PasswordHasher()  # create a single PasswordHasher instance for reuse
 
+SUPPORTED_API_KEY_ALGOS: frozenset[str] = frozenset({"argon2", "hmac-sha256"})
 
-async def verify_api_key(algo: str, api_key: str, hashed_key: str) -> bool:
+
+def api_key_fingerprint(api_key: str, secret: str) -> str:
+    """
+    Compute the lookup fingerprint for an API key.
+
+    The fingerprint is stored next to the API key hash when the key is provisioned,
+    so that authentication can go straight to the matching key instead of running
+    the (deliberately slow) hash verification against every configured key.
+
+    Args:
+        api_key: The plain API key.
+        secret: The auth.incoming.api_key_fingerprint_secret setting.
+
+    Returns:
+        str: A hexadecimal HMAC-SHA256 fingerprint of the API key.
+    """
+    return secure_hash(api_key.encode("utf-8"), secret.encode("utf-8"))
+
+
+async def verify_api_key(
+    algo: str,
+    api_key: str,
+    hashed_key: str,
+    secret: str = "",
+) -> bool:
     """
     Verify an API key against the stored hash.
 
+    Supported algorithms are "argon2" and "hmac-sha256". The latter takes
+    microseconds instead of tens of milliseconds, and is only appropriate for
+    randomly generated keys with at least 128 bits of entropy, which do not need
+    the brute-force resistance of a password hash. Its stored hash is the same
+    value as api_key_fingerprint(api_key, secret).
+
     Args:
         algo: The hashing algorithm used.
         api_key: The API key provided by the client.
         hashed_key: The stored hash for comparison.
+        secret: The HMAC secret (required by "hmac-sha256", unused otherwise).
 
     Returns:
         bool: True if the API key matches the stored hash, False otherwise.
 
     Raises:
         AuthenticationError: If an unsupported algorithm is specified.
+        ValueError: If "hmac-sha256" is used without a secret.
     """
-    if algo == "argon2":
-        try:
-            result = ph.verify(hashed_key, api_key)
-            return result
-        except VerifyMismatchError:
-            return False
-    # elif algo == "something_else_here":
-    else:
+    if algo not in SUPPORTED_API_KEY_ALGOS:
         raise AuthenticationError(f"Unknown password algorithm: {algo}")
 
+    if algo == "hmac-sha256":
+        # NOTE: an HMAC with an empty key is just an unkeyed hash of the API key
+        if not secret:
+            raise ValueError("hmac-sha256 API keys require a non-empty secret")
+        return hmac.compare_digest(api_key_fingerprint(api_key, secret), hashed_key)
+
+    try:
+        # NOTE: argon2 is deliberately slow and CPU-bound, so run it in a
+        #   worker thread instead of blocking the event loop
+        return await asyncio.to_thread(ph.verify, hashed_key, api_key)
+    except VerificationError:
+        return False
+    except InvalidHashError:
+        logger.warning("Stored argon2 hash is malformed, rejecting API key")
+        return False
+
 
 async def authenticate_api_key(
     api_key: str, auth_settings: AuthSettings
@@ -50,6 +95,9 @@ async def authenticate_api_key(
     """
     Authenticate an API key and retrieve associated ACLs.
 
+    A ValueError from verify_api_key is propagated if an "hmac-sha256" key has to
+    be verified while auth.incoming.api_key_fingerprint_secret is not set.
+
     Args:
         api_key: The API key provided by the client.
         auth_settings: The authentication settings containing valid API keys.
@@ -61,8 +109,32 @@ async def authenticate_api_key(
         AuthenticationError: If the API key is unknown.
         AuthorizationError: If the API key is valid but has no assigned ACLs.
     """
-    for keyname, eval_key_conf in auth_settings.incoming.api_keys.items():
-        if await verify_api_key(eval_key_conf.algo, api_key, eval_key_conf.hash):
+    incoming = auth_settings.incoming
+    candidates: dict[str, IncomingAuthApiKey]
+    fingerprint = api_key_fingerprint(api_key, incoming.api_key_fingerprint_secret)
+
+    indexed_name = incoming.api_keys_by_fingerprint.get(fingerprint, "")
+    indexed_conf = incoming.api_keys.get(indexed_name)
+
+    if indexed_conf and indexed_conf.fingerprint == fingerprint:
+        candidates = {indexed_name: indexed_conf}
+    else:
+        # NOTE: a key whose fingerprint differs from this one cannot match, so only
+        #   keys without a fingerprint (or added since the index was built) need
+        #   to be verified one by one
+        candidates = {
+            keyname: key_conf
+            for keyname, key_conf in incoming.api_keys.items()
+            if key_conf.fingerprint in (None, "", fingerprint)
+        }
+
+    for keyname, eval_key_conf in candidates.items():
+        if await verify_api_key(
+            eval_key_conf.algo,
+            api_key,
+            eval_key_conf.hash,
+            incoming.api_key_fingerprint_secret,
+        ):
             if eval_key_conf.acls:
                 stamped_acls = [
                     # NOTE: stamp each ACL with the principal_name for logging
@@ -116,7 +116,9 @@ async def exchange_code_for_tokens(
         )
 
     if response.status_code != 200:
-        logger.error(f"Token exchange failed: {response.status_code} {response.text}")
+        logger.error(
+            "Token exchange failed: %s %s", response.status_code, response.text
+        )
         raise AuthenticationError(
             f"Token exchange failed (HTTP {response.status_code})"
         )
@@ -167,7 +169,7 @@ async def refresh_access_token(
         )
 
     if response.status_code != 200:
-        logger.error(f"Token refresh failed: {response.status_code} {response.text}")
+        logger.error("Token refresh failed: %s %s", response.status_code, response.text)
         raise AuthenticationError(f"Token refresh failed (HTTP {response.status_code})")
 
     return response.json()
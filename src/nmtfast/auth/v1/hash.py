@@ -6,6 +6,7 @@
 
 import hashlib
 import hmac
+from typing import Iterable
 
 
 def secure_hash(value: bytes, secret_key: bytes, salt: bytes = b"") -> str:
@@ -24,7 +25,10 @@ def secure_hash(value: bytes, secret_key: bytes, salt: bytes = b"") -> str:
     Returns:
         str: A hexadecimal string representation of the HMAC-SHA256 hash.
     """
-    return hmac.new(secret_key, salt + value, hashlib.sha256).hexdigest()
+    # NOTE: hmac.digest is a one-shot C fast path that skips building an HMAC object
+    #   do not switch this to another construction (e.g. keyed blake2b): results
+    #   are persisted as API key fingerprints and "hmac-sha256" API key hashes
+    return hmac.digest(secret_key, salt + value, "sha256").hex()
 
 
 def fingerprint_hash(value: bytes, salt: bytes = b"") -> str:
@@ -42,4 +46,32 @@ def fingerprint_hash(value: bytes, salt: bytes = b"") -> str:
     Returns:
         str: A hexadecimal string representation of the SHA256 hash.
     """
-    return hashlib.sha256(salt + value).hexdigest()
+    # NOTE: OpenSSL's SHA-256 uses the SHA extensions on current CPUs, and there it
+    #   is faster than blake2s/blake2b for all but the smallest inputs
+    return hashlib.sha256(salt + value, usedforsecurity=False).hexdigest()
+
+
+def fingerprint_hash_many(values: Iterable[bytes], salt: bytes = b"") -> list[str]:
+    """
+    Compute salted SHA256 fingerprints for many byte strings at once.
+
+    The salt is absorbed into a single hash object which is then copied for each
+    value, so bulk callers (e.g. when building a lookup index) do not pay for hashing
+    the salt and initializing a new hash object every time.
+
+    Args:
+        values: The byte strings to be hashed.
+        salt: Optional salt to prepend to each value before hashing.
+
+    Returns:
+        list[str]: Hexadecimal SHA256 hashes, in the same order as values.
+    """
+    salted = hashlib.sha256(salt, usedforsecurity=False)
+    hashes: list[str] = []
+
+    for value in values:
+        hasher = salted.copy()
+        hasher.update(value)
+        hashes.append(hasher.hexdigest())
+
+    return hashes
@@ -4,11 +4,15 @@
 
 """Library functions to process JSON Web Tokens."""
 
-import base64
+import asyncio
 import binascii
+import hashlib
+import hmac
 import json
 import logging
-import re
+import time
+from functools import lru_cache
+from itertools import islice
 
 import jwt
 from fastapi import HTTPException
@@ -25,14 +29,46 @@ from .exceptions import AuthenticationError, AuthorizationError
 
 logger = logging.getLogger(__name__)
 
+CLAIMS_CACHE_TTL: float = 5.0
+CLAIMS_CACHE_SIZE: int = 2048
+JWT_LEEWAY: int = 15
 
-def decode_jwt_part(token: str, part_name: str) -> dict:
+# NOTE: verified claims keyed by (sha256 of the token, jwks_url, issuer_regex,
+#   audience); values are (expires_at, claims) and entries never outlive the
+#   token itself
+_ClaimsCacheKey = tuple[bytes, str, str | None, str | None]
+_VERIFIED_CLAIMS: dict[_ClaimsCacheKey, tuple[float, dict]] = {}
+
+_URLSAFE_TO_STANDARD_B64: bytes = bytes.maketrans(b"-_", b"+/")
+
+
+def _decode_jwt_segment(encoded_part: str, part_name: str) -> dict:
     """
-    Decodes a base64url-encoded JWT part (header or payload).
+    Decodes a single base64url-encoded JWT segment into a JSON object.
+
+    Decoded segments are cached, so the same token does not have to be decoded
+    again on every request; a shallow copy is returned to callers. A ValueError
+    raised by _decode_jwt_segment_cached (if base64 decoding or JSON parsing fails)
+    is propagated.
 
     Args:
-        token: base64url-encoded token (str).
-        part_name: The name of the part ("header" or "payload").
+        encoded_part: The base64url-encoded segment, without padding.
+        part_name: The name of the part ("header" or "payload"), used in errors.
+
+    Returns:
+        dict: The decoded JSON object (dict).
+    """
+    return dict(_decode_jwt_segment_cached(encoded_part, part_name))
+
+
+@lru_cache(maxsize=1024)
+def _decode_jwt_segment_cached(encoded_part: str, part_name: str) -> dict:
+    """
+    Decodes a single base64url-encoded JWT segment; the result must not be modified.
+
+    Args:
+        encoded_part: The base64url-encoded segment, without padding.
+        part_name: The name of the part ("header" or "payload"), used in errors.
 
     Returns:
         dict: The decoded JSON object (dict).
@@ -40,22 +76,19 @@ def decode_jwt_part(token: str, part_name: str) -> dict:
     Raises:
         ValueError: If base64 decoding or JSON parsing fails.
     """
-    encoded_parts = token.split(".")
-    if part_name == "header":
-        encoded_part = encoded_parts[0]
-    elif part_name == "payload":
-        encoded_part = encoded_parts[1]
-    else:
-        raise ValueError(f"Unknown index for part_name '{part_name}'")
-
     try:
-        padding = len(encoded_part) % 4
-        if padding > 0:
-            encoded_part += "=" * (4 - padding)
-        decoded_bytes = base64.urlsafe_b64decode(encoded_part)
-        decoded_json = decoded_bytes.decode("utf-8")
-        decoded_object = json.loads(decoded_json)
+        # NOTE: restore the stripped base64 padding without branching, and call
+        #   binascii directly instead of going through base64.urlsafe_b64decode
+        decoded_bytes = binascii.a2b_base64(
+            (encoded_part + "==="[: -len(encoded_part) & 3])
+            .encode("ascii")
+            .translate(_URLSAFE_TO_STANDARD_B64)
+        )
+        # NOTE: json.loads accepts UTF-8 bytes, which avoids an extra str copy
+        decoded_object = json.loads(decoded_bytes)
         # logger.debug(f"{part_name}: {decoded_object}")
+        if not isinstance(decoded_object, dict):
+            raise ValueError("not a JSON object")
         return decoded_object
     except (
         ValueError,
@@ -68,19 +101,81 @@ def decode_jwt_part(token: str, part_name: str) -> dict:
         raise ValueError(f"{part_name.capitalize()} decoding error: {e}")
 
 
+def decode_jwt_part(token: str, part_name: str) -> dict:
+    """
+    Decodes a base64url-encoded JWT part (header or payload).
+
+    Args:
+        token: base64url-encoded token (str).
+        part_name: The name of the part ("header" or "payload").
+
+    Returns:
+        dict: The decoded JSON object (dict).
+
+    Raises:
+        ValueError: If base64 decoding or JSON parsing fails.
+    """
+    encoded_parts = token.split(".")
+    if part_name == "header":
+        encoded_part = encoded_parts[0]
+    elif part_name == "payload":
+        encoded_part = encoded_parts[1]
+    else:
+        raise ValueError(f"Unknown index for part_name '{part_name}'")
+
+    return _decode_jwt_segment(encoded_part, part_name)
+
+
+@lru_cache(maxsize=16)
+def _get_jwks_client(jwks_url: str) -> PyJWKClient:
+    """
+    Return a long-lived PyJWKClient for a JWKS endpoint.
+
+    Reusing the client lets PyJWT's JWK set and signing key caches survive between
+    requests, instead of fetching the JWKS document for every token.
+
+    Args:
+        jwks_url: The JWKS endpoint to retrieve public keys.
+
+    Returns:
+        PyJWKClient: The shared client for this JWKS endpoint.
+    """
+    return PyJWKClient(jwks_url, cache_keys=True)
+
+
+def clear_verified_claims_cache() -> None:
+    """
+    Forget all verified claims, so every token is verified again on its next use.
+
+    Call this e.g. after rotating signing keys or changing ID provider settings.
+    """
+    _VERIFIED_CLAIMS.clear()
+
+
 async def get_claims_jwks(
     token: str,
     jwks_url: str,
     audience: str | None = None,
+    issuer_regex: str | None = None,
+    cache_claims: bool = True,
 ) -> dict[str, str]:
     """
     Parses and verifies a JWT using JWKS.
 
+    Verified claims are cached for up to CLAIMS_CACHE_TTL seconds (never past the
+    token expiry), so a token that is sent again does not have to be verified
+    again. Cached claims are only reused for the same JWKS endpoint, issuer regex
+    and audience; see also clear_verified_claims_cache.
+
     Args:
         token: The JWT token string.
         jwks_url: The JWKS endpoint to retrieve public keys.
         audience: Optional expected audience claim. When provided, the aud claim
             is validated against this value.
+        issuer_regex: Optional issuer regex of the ID provider the token belongs
+            to; it is only part of the cache key, so claims verified for one
+            provider are never reused for another.
+        cache_claims: Whether to cache verified claims, and reuse cached ones.
 
     Returns:
         dict[str, str]: Decoded JWT claims.
@@ -88,14 +183,31 @@ async def get_claims_jwks(
     Raises:
         AuthenticationError: If the token is invalid.
     """
+    cache_key: _ClaimsCacheKey | None = None
+    if cache_claims:
+        cache_key = (
+            hashlib.sha256(token.encode()).digest(),
+            jwks_url,
+            issuer_regex,
+            audience,
+        )
+        if cached := _VERIFIED_CLAIMS.get(cache_key):
+            if cached[0] > time.time():
+                return dict(cached[1])
+            del _VERIFIED_CLAIMS[cache_key]
+
     try:
-        jwks_client = PyJWKClient(jwks_url)
-        signing_key = jwks_client.get_signing_key_from_jwt(token)
+        jwks_client = _get_jwks_client(jwks_url)
+        # NOTE: this may fetch the JWKS document over HTTP on a cache miss, so
+        #   keep it off the event loop
+        signing_key = await asyncio.to_thread(
+            jwks_client.get_signing_key_from_jwt, token
+        )
         decode_options: dict = {"require": ["exp", "iss"]}
         decode_kwargs: dict = {
             "algorithms": ["RS256"],
             "options": decode_options,
-            "leeway": 15,
+            "leeway": JWT_LEEWAY,
         }
         if audience:
             decode_kwargs["audience"] = audience
@@ -104,10 +216,32 @@ async def get_claims_jwks(
             signing_key.key,
             **decode_kwargs,
         )
-        return claims
     except (DecodeError, jwt.ExpiredSignatureError, jwt.InvalidTokenError) as exc:
         raise AuthenticationError(f"{exc}")
 
+    if cache_key is not None:
+        _cache_verified_claims(cache_key, claims)
+    return claims
+
+
+def _cache_verified_claims(cache_key: _ClaimsCacheKey, claims: dict) -> None:
+    """
+    Remember verified claims for a short time, but never past the token expiry.
+
+    Args:
+        cache_key: The (token digest, jwks_url, issuer_regex, audience) cache key.
+        claims: The verified claims.
+    """
+    expires_at = time.time() + CLAIMS_CACHE_TTL
+    if isinstance(claims.get("exp"), (int, float)):
+        expires_at = min(expires_at, claims["exp"] + JWT_LEEWAY)
+
+    if len(_VERIFIED_CLAIMS) >= CLAIMS_CACHE_SIZE:
+        # NOTE: dicts keep insertion order, so this evicts the oldest entry
+        del _VERIFIED_CLAIMS[next(iter(_VERIFIED_CLAIMS))]
+
+    _VERIFIED_CLAIMS[cache_key] = (expires_at, dict(claims))
+
 
 async def get_idp_provider(token: str, auth_settings: AuthSettings) -> str:
     """
@@ -127,14 +261,27 @@ async def get_idp_provider(token: str, auth_settings: AuthSettings) -> str:
     if token.startswith("Bearer "):
         token = token[7:]  # Remove "Bearer " (7 characters)
 
-    if len(token.split(".")) != 3:
+    # NOTE: split once and decode the payload segment directly, instead of
+    #   letting decode_jwt_part split the token a second time
+    encoded_parts = token.split(".")
+    if len(encoded_parts) != 3:
         raise HTTPException(status_code=403, detail="Invalid token")
 
-    jwt_payload: dict = decode_jwt_part(token, "payload")
+    jwt_payload: dict = _decode_jwt_segment(encoded_parts[1], "payload")
+    issuer = jwt_payload["iss"]
     provider: str = ""
 
-    for idp, idp_conf in auth_settings.id_providers.items():
-        if not re.search(idp_conf.issuer_regex, jwt_payload["iss"]):
+    # NOTE: the last matching provider wins; when the issuer is in the index, only
+    #   the providers configured after the indexed one still have to be checked,
+    #   unless the indexed provider was changed and no longer accepts the issuer
+    start = 0
+    if isinstance(issuer, str) and (hit := auth_settings.issuer_index.get(issuer)):
+        indexed_conf = auth_settings.id_providers.get(hit[1])
+        if indexed_conf is not None and issuer in indexed_conf.literal_issuers:
+            start, provider = hit[0] + 1, hit[1]
+
+    for idp, idp_conf in islice(auth_settings.id_providers.items(), start, None):
+        if not idp_conf.issuer_pattern.search(issuer):
             continue
         provider = idp
 
@@ -144,6 +291,97 @@ async def get_idp_provider(token: str, auth_settings: AuthSettings) -> str:
     return provider
 
 
+def _claim_matches(value: object, expected: str) -> bool:
+    """
+    Compare a JWT claim value with a configured claim value in constant time.
+
+    Args:
+        value: The claim value from the JWT (may be missing or not a string).
+        expected: The configured claim value.
+
+    Returns:
+        bool: True if the claim value is a string equal to the expected value.
+    """
+    if not isinstance(value, str):
+        return False
+
+    # NOTE: compare_digest only accepts ASCII str, so compare UTF-8 bytes instead
+    return hmac.compare_digest(value.encode("utf-8"), expected.encode("utf-8"))
+
+
+def _find_client(
+    claims: dict,
+    auth_settings: AuthSettings,
+    provider: str,
+) -> str | None:
+    """
+    Find the configured client whose required claims all match the JWT claims.
+
+    Instead of comparing the claims of every configured client, this looks up the
+    JWT claim values in the client claims index once per distinct set of required
+    claim names. When several clients match, the one configured first wins. Since
+    clients may have been changed in place after the index was built, a stale hit
+    or a miss falls back to comparing the claims of every client.
+
+    Args:
+        claims: Decoded JWT claims.
+        auth_settings: The auth section of app configuration.
+        provider: The matched identity provider name.
+
+    Returns:
+        str | None: The name of the matching client, or None if no client matches.
+    """
+    best_match: tuple[int, str] | None = None
+    auth_clients = auth_settings.incoming.clients
+
+    index = auth_settings.incoming.client_claims_index.get(provider, {})
+    for claim_names, by_values in index.items():
+        values = [claims.get(name) for name in claim_names]
+        claim_values = tuple(value for value in values if isinstance(value, str))
+        # NOTE: configured claims are strings, so any other value cannot match
+        if len(claim_values) != len(claim_names):
+            continue
+        match = by_values.get(claim_values)
+        if match and (best_match is None or match < best_match):
+            best_match = match
+
+    if best_match and _client_matches(
+        claims, auth_clients.get(best_match[1]), provider
+    ):
+        return best_match[1]
+
+    for keyname, client_conf in auth_clients.items():
+        if _client_matches(claims, client_conf, provider):
+            return keyname
+
+    return None
+
+
+def _client_matches(
+    claims: dict,
+    client_conf: IncomingAuthClient | None,
+    provider: str,
+) -> bool:
+    """
+    Check whether a configured client belongs to the provider and matches the JWT.
+
+    Args:
+        claims: Decoded JWT claims.
+        client_conf: The client configuration, or None if the client is unknown.
+        provider: The matched identity provider name.
+
+    Returns:
+        bool: True if every claim required by the client matches the JWT claims.
+    """
+    if client_conf is None or client_conf.provider != provider:
+        return False
+
+    return all(
+        _claim_matches(claims.get(claim_name), claim_value)
+        for claim_name, claim_value in client_conf.claims.items()
+    )
+
+
 def _resolve_user_acls(
     claims: dict,
     auth_settings: AuthSettings,
@@ -168,10 +406,10 @@ def _resolve_user_acls(
         if user_conf.provider != provider:
             continue
         for claim_name, claim_value in user_conf.claims.items():
-            if claims.get(claim_name) != claim_value:
+            if not _claim_matches(claims.get(claim_name), claim_value):
                 break
         else:
-            logger.debug(f"Matched static user '{user_name}'")
+            logger.debug("Matched static user '%s'", user_name)
             return user_name, [
                 acl.model_copy(update={"principal_name": user_name})
                 for acl in user_conf.acls
@@ -219,7 +457,7 @@ def _resolve_group_acls(
         group_conf = auth_settings.incoming.groups.get(group_name)
         if group_conf is None or group_conf.provider != provider:
             continue
-        logger.debug(f"Matched static group '{group_name}'")
+        logger.debug("Matched static group '%s'", group_name)
         group_acls.extend(
             acl.model_copy(
                 update={
@@ -285,32 +523,29 @@ async def authenticate_token(
 
     idp_conf = auth_settings.id_providers[provider]
     if idp_conf.type == "jwks":
-        claims = await get_claims_jwks(token, idp_conf.jwks_endpoint, audience)
+        claims = await get_claims_jwks(
+            token,
+            idp_conf.jwks_endpoint,
+            audience,
+            issuer_regex=idp_conf.issuer_regex,
+            cache_claims=idp_conf.claims_cache_enabled,
+        )
     # elif idp_conf.type == "some_other_type":
     # elif idp_conf.type == "some_other_type2":
 
     if claims == {}:
         raise AuthenticationError("no claims found")
 
-    for keyname, eval_client_conf in auth_clients.items():
-        if eval_client_conf.provider != provider:
-            continue
-        for claim_name, claim_value in eval_client_conf.claims.items():
-            # NOTE: claims in config must match ALL specified values; abort if
-            #   a single claim does not match or is missing from the token
-            if claims.get(claim_name) != claim_value:
-                break
-        else:
-            # NOTE: if the all of the claims match then the client is valid
-            auth_info = {
-                "name": keyname,
-                "acls": [
-                    # NOTE: stamp each ACL with the principal_name for logging
-                    acl.model_copy(update={"principal_name": keyname})
-                    for acl in eval_client_conf.acls
-                ],
-            }
-            break
+    keyname = _find_client(claims, auth_settings, provider)
+    if keyname and (client_conf := auth_clients.get(keyname)):
+        auth_info = {
+            "name": keyname,
+            "acls": [
+                # NOTE: stamp each ACL with the principal_name for logging
+                acl.model_copy(update={"principal_name": keyname})
+                for acl in client_conf.acls
+            ],
+        }
 
     if not auth_info:
         raise AuthorizationError("Invalid client (no permissions)")
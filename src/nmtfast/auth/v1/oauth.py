@@ -4,11 +4,29 @@
 
 """OAuth classes and utility functions for nmtfast apps."""
 
+from functools import lru_cache
 from typing import Optional
 
+from fastapi.openapi.models import OAuthFlowClientCredentials, OAuthFlows
 from fastapi.security import OAuth2
 
 
+@lru_cache(maxsize=32)
+def _client_credentials_flows(tokenUrl: str) -> OAuthFlows:
+    """
+    Build the OpenAPI flows model for a client credentials token URL.
+
+    Args:
+        tokenUrl: The URL for obtaining OAuth2 tokens.
+
+    Returns:
+        OAuthFlows: The flows model, shared by every scheme using the same URL.
+    """
+    return OAuthFlows(
+        clientCredentials=OAuthFlowClientCredentials(tokenUrl=tokenUrl, scopes={})
+    )
+
+
 class OAuth2AuthorizationCode(OAuth2):
     """
     Custom OAuth2 scheme to enforce authorization code flow.
@@ -81,13 +99,11 @@ class OAuth2ClientCredentials(OAuth2):
         scheme_name: Optional[str] = None,
         auto_error: bool = True,
     ) -> None:
+        # NOTE: the flows model is only read when building the OpenAPI schema; the
+        #   shallow copy keeps each scheme's top-level model separate while the
+        #   validated clientCredentials flow is built once per token URL
         super().__init__(
-            flows={
-                "clientCredentials": {
-                    "tokenUrl": tokenUrl,
-                    "scopes": {},
-                }
-            },
+            flows=_client_credentials_flows(tokenUrl).model_copy(),
             scheme_name=scheme_name or "OAuth2ClientCredentials",
         )
         self.auto_error = auto_error
@@ -83,7 +83,7 @@ class SessionManager:
         key = self._session_key(session_id)
         serialized = data.model_dump_json()
         self.cache.store_app_cache(key, serialized, self.settings.session_ttl)
-        logger.info(f"Session created for user ID '{data.user_id}'")
+        logger.info("Session created for user ID '%s'", data.user_id)
         return session_id
 
     def get_session(self, session_id: str) -> Optional[SessionData]:
@@ -104,7 +104,7 @@ class SessionManager:
         try:
             return SessionData.model_validate_json(raw)
         except Exception:
-            logger.warning(f"Failed to deserialize session '{session_id}'")
+            logger.warning("Failed to deserialize session '%s'", session_id)
             return None
 
     def destroy_session(self, session_id: str) -> bool:
@@ -118,7 +118,7 @@ class SessionManager:
             bool: True if the session was removed.
         """
         key = self._session_key(session_id)
-        logger.info(f"Session destroyed for session ID '{session_id}'")
+        logger.info("Session destroyed for session ID '%s'", session_id)
         return self.cache.clear_app_cache(key)
 
     @staticmethod
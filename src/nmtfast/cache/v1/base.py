@@ -4,7 +4,49 @@
 
 """Base classes which can be used for app cache implementations."""
 
-from typing import Any, Optional
+from typing import Any, Optional, Protocol
+
+
+class AppCacheProtocol(Protocol):
+    """Structural type for app cache implementations."""
+
+    def store_app_cache(self, key: str, value: Any, ttl: int = -1) -> bool:
+        """
+        Store/replace cache data in backend storage.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+            ttl: Time-to-live override (in seconds).
+
+        Returns:
+            bool: True if the operation was successful.
+        """
+        ...
+
+    def fetch_app_cache(self, key: str) -> Optional[Any]:
+        """
+        Fetch cache data from backend storage.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Optional[Any]: The cached value, or None if not found.
+        """
+        ...
+
+    def clear_app_cache(self, key: str) -> bool:
+        """
+        Clear cached data from backend storage.
+
+        Args:
+            key: The cache key to clear.
+
+        Returns:
+            bool: True if the operation was successful.
+        """
+        ...
 
 
 class AppCacheBase:
@@ -42,6 +84,42 @@ class AppCacheBase:
         """
         raise NotImplementedError
 
+    def fetch_many_app_cache(self, keys: list[str]) -> list[Optional[Any]]:
+        """
+        Fetch cache data for several keys from backend storage.
+
+        Subclasses should override this to fetch all keys in a single round trip;
+        by default, each key is fetched with fetch_app_cache.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            list[Optional[Any]]: The cached values (or None if not found), in the
+                same order as keys.
+        """
+        return [self.fetch_app_cache(key) for key in keys]
+
+    def store_many_app_cache(self, items: dict[str, Any], ttl: int = -1) -> bool:
+        """
+        Store/replace cache data for several keys in backend storage.
+
+        Subclasses should override this to store all items in a single round trip;
+        by default, each item is stored with store_app_cache.
+
+        Args:
+            items: The values to cache, by cache key.
+            ttl: Time-to-live override (in seconds), applied to every item.
+
+        Returns:
+            bool: True if every item was stored successfully.
+        """
+        # NOTE: store every item, even after one of them fails
+        results = [
+            self.store_app_cache(key, value, ttl) for key, value in items.items()
+        ]
+        return all(results)
+
     def clear_app_cache(self, key: str) -> bool:
         """
         Clear cached data from backend storage.
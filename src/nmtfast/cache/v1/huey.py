@@ -10,14 +10,41 @@ import zlib
 from typing import Any, Optional
 
 from huey import Huey
-from huey.storage import RedisStorage
-from tenacity import retry, stop_after_attempt, wait_fixed
+from huey.storage import RedisExpireStorage, RedisStorage
+from redis.exceptions import RedisError
 
 from nmtfast.cache.v1.base import AppCacheBase
-from nmtfast.retry.v1.tenacity import tenacity_retry_log
+from nmtfast.retry.v1.tenacity import redis_retry
 
 logger = logging.getLogger(__name__)
 
+# NOTE: errors from the backend itself, which reads treat as cache misses; any
+#   other exception (e.g. corrupted data or a bug) is raised to the caller
+_BACKEND_ERRORS: tuple[type[Exception], ...] = (
+    RedisError,
+    ConnectionError,
+    TimeoutError,
+)
+
+# NOTE: zstandard is an optional dependency, only needed for compression="zstd"
+#   or to read values written that way
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None  # type: ignore[assignment]
+
+# NOTE: compact separators shrink every cached JSON payload (less to encode,
+#   compress and store); json.dumps would build a new encoder per call for any
+#   non-default options, so share a single one instead
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def _json_dumps(value: Any) -> bytes:
+    """
+    Serialize a value to compact JSON bytes.
+    """
+    return _JSON_ENCODER.encode(value).encode("utf-8")
+
 
 class HueyAppCache(AppCacheBase):
     """
@@ -28,12 +55,32 @@ class HueyAppCache(AppCacheBase):
         name: Prefix for all keys stored in the cache
         default_ttl: Default TTL for cached items, in seconds
         compress_threshold: Minimum size in bytes to compress (default: 4096)
+        compress_level: Compression level; 0-9 for zlib or 1-22 for zstd (default:
+            1, the fastest)
+        compression: Compression algorithm for new values, "zlib" (default) or
+            "zstd"; zstd needs the optional zstandard package. Values compressed
+            with either algorithm can always be read, as long as the package
+            needed to decompress them is installed.
+
+    Raises:
+        ValueError: If compression is not "zlib" or "zstd".
+        ImportError: If compression is "zstd" but zstandard is not installed.
 
     Attributes:
-        COMPRESSION_HEADER: Byte string identifying compressed data (default: b'zlib1:')
+        COMPRESSION_HEADER: Byte string identifying zlib compressed data (default:
+            b'zlib1:')
+        ZSTD_COMPRESSION_HEADER: Byte string identifying zstd compressed data
+            (default: b'zstd1:')
+        COMPRESSION_SAMPLE_SIZE: Bytes sampled from large payloads to estimate
+            whether they are worth compressing (default: 4096)
+        INCOMPRESSIBLE_RATIO: Sample compression ratio above which payloads are
+            stored uncompressed (default: 0.95)
     """
 
     COMPRESSION_HEADER = b"zlib1:"
+    ZSTD_COMPRESSION_HEADER = b"zstd1:"
+    COMPRESSION_SAMPLE_SIZE = 4096
+    INCOMPRESSIBLE_RATIO = 0.95
 
     def __init__(
         self,
@@ -41,21 +88,40 @@ class HueyAppCache(AppCacheBase):
         name: str,
         default_ttl: int,
         compress_threshold: int = 4096,
+        compress_level: int = 1,
+        compression: str = "zlib",
     ) -> None:
+        if compression not in ("zlib", "zstd"):
+            raise ValueError(f"Unsupported cache compression: {compression}")
+        if compression == "zstd" and _zstd is None:
+            raise ImportError("zstd cache compression requires the zstandard package")
+
         self.huey_app: Huey = huey_app
         self.name: str = name
         self.default_ttl: int = default_ttl
         self.compress_threshold: int = compress_threshold
+        self.compress_level: int = compress_level
+        self.compression: str = compression
+        # NOTE: every storage key starts with the same prefix, so build it once
+        self._key_prefix: str = f"app_cache_{name}_"
+
+        # NOTE: the storage backend never changes, so resolve the Redis-specific
+        #   details once instead of on every store
+        self._redis_storage: Optional[RedisStorage] = None
+        self._redis_key_prefix: str = ""
+        if isinstance(huey_app.storage, RedisStorage):
+            self._redis_storage = huey_app.storage
+            self._redis_key_prefix = f"huey.r.{huey_app.storage.name}."
         logger.debug(
-            "Initialized HueyAppCache with compression "
-            f"threshold of {compress_threshold} bytes"
+            "Initialized HueyAppCache with compression threshold of %d bytes",
+            compress_threshold,
         )
 
     def _get_storage_keyname(self, key: str) -> str:
         """
         Construct the full key name used in backend storage.
         """
-        return f"app_cache_{self.name}_{key}"
+        return self._key_prefix + key
 
     def _prepare_data(self, data: bytes) -> bytes:
         """
@@ -65,7 +131,8 @@ class HueyAppCache(AppCacheBase):
             data: Input data (must be bytes)
 
         Returns:
-            bytes: Prepared bytes data (compressed if over threshold)
+            bytes: Prepared bytes data (compressed if over threshold, unless
+                compression would not make it smaller)
 
         Raises:
             TypeError: Raised if the input data is not bytes
@@ -73,17 +140,45 @@ class HueyAppCache(AppCacheBase):
         if not isinstance(data, bytes):
             raise TypeError("Input data must be bytes, got {}".format(type(data)))
 
-        logger.debug(f"Preparing data for storage. Original size: {len(data)} bytes")
+        logger.debug("Preparing data for storage. Original size: %d bytes", len(data))
 
         # only compress if over threshold
         if len(data) >= self.compress_threshold:
-            compressed = zlib.compress(data)
-            compression_ratio = len(data) / len(compressed)
+            # NOTE: already compressed (high entropy) payloads do not shrink any
+            #   further; probe a sample at the fastest level before paying for the
+            #   whole payload
+            if len(data) > 2 * self.COMPRESSION_SAMPLE_SIZE:
+                sample = data[: self.COMPRESSION_SAMPLE_SIZE]
+                sample_ratio = len(zlib.compress(sample, 1)) / len(sample)
+                if sample_ratio > self.INCOMPRESSIBLE_RATIO:
+                    logger.debug(
+                        "Data looks incompressible (sample ratio: %.2f), "
+                        "storing uncompressed",
+                        sample_ratio,
+                    )
+                    return data
+
+            if self.compression == "zstd":
+                # NOTE: the module-level helper uses a fresh context per call, so it
+                #   is safe to use from several threads at once
+                compressed = _zstd.compress(  # type: ignore[union-attr]
+                    data, self.compress_level
+                )
+                header = self.ZSTD_COMPRESSION_HEADER
+            else:
+                compressed = zlib.compress(data, self.compress_level)
+                header = self.COMPRESSION_HEADER
             logger.debug(
-                f"Compressing data (threshold: {self.compress_threshold} bytes). "
-                f"Compressed size: {len(compressed)} bytes (ratio: {compression_ratio:.1f}x)"
+                "Compressing data (threshold: %d bytes). "
+                "Compressed size: %d bytes (ratio: %.1fx)",
+                self.compress_threshold,
+                len(compressed),
+                len(data) / len(compressed),
             )
-            return self.COMPRESSION_HEADER + compressed
+            if len(header) + len(compressed) >= len(data):
+                logger.debug("Compression did not reduce size, storing uncompressed")
+                return data
+            return header + compressed
 
         logger.debug("Data below compression threshold, storing uncompressed")
         return data
@@ -100,7 +195,9 @@ class HueyAppCache(AppCacheBase):
 
         Raises:
             TypeError: If input is not bytes
-            zlib.error: If compressed data is corrupted
+            ValueError: If data is zstd compressed but zstandard is not installed
+            zlib.error: If zlib compressed data is corrupted
+            _zstd.ZstdError: If zstd compressed data is corrupted
         """
         if not isinstance(data, bytes):
             raise TypeError(f"Cache data must be bytes, got {type(data)}")
@@ -108,31 +205,114 @@ class HueyAppCache(AppCacheBase):
         if data.startswith(self.COMPRESSION_HEADER):
             original_size = len(data)
             try:
-                decompressed = zlib.decompress(data[len(self.COMPRESSION_HEADER) :])
+                # NOTE: a memoryview skips the header without copying the payload
+                payload = memoryview(data)[len(self.COMPRESSION_HEADER) :]
+                decompressed = zlib.decompress(payload)
                 logger.debug(
-                    f"Decompressed data. Original size: {original_size} bytes, "
-                    f"Decompressed size: {len(decompressed)} bytes"
+                    "Decompressed data. Original size: %d bytes, "
+                    "Decompressed size: %d bytes",
+                    original_size,
+                    len(decompressed),
                 )
                 return decompressed
             except zlib.error as exc:
-                logger.warning(f"Decompression failed: {exc}")
+                logger.warning("Decompression failed: %s", exc)
+                raise  # re-raise to let caller handle corrupted data
+
+        if data.startswith(self.ZSTD_COMPRESSION_HEADER):
+            if _zstd is None:
+                raise ValueError(
+                    "Cache data is zstd compressed, but zstandard is not installed"
+                )
+            try:
+                decompressed = _zstd.decompress(
+                    memoryview(data)[len(self.ZSTD_COMPRESSION_HEADER) :]
+                )
+                logger.debug(
+                    "Decompressed zstd data. Original size: %d bytes, "
+                    "Decompressed size: %d bytes",
+                    len(data),
+                    len(decompressed),
+                )
+                return decompressed
+            except _zstd.ZstdError as exc:
+                logger.warning("Decompression failed: %s", exc)
                 raise  # re-raise to let caller handle corrupted data
 
         logger.debug("Data was not compressed, returning as-is")
         return data
 
-    @retry(
-        reraise=True,
-        stop=stop_after_attempt(5),
-        wait=wait_fixed(0.001),
-        after=tenacity_retry_log(logger),
-    )
+    def _serialize_value(self, key: str, value: Any) -> bytes:
+        """
+        Convert a value to bytes for storage.
+
+        Binary values are stored as-is and text is UTF-8 encoded; anything else is
+        JSON-encoded.
+
+        Args:
+            key: Cache key identifier, used for logging.
+            value: Data to store. Can be any JSON-serializable object, or raw bytes
+                (bytes, bytearray or memoryview).
+
+        Returns:
+            bytes: The serialized value (not yet compressed).
+
+        Raises:
+            ValueError: If value cannot be JSON-serialized (for non-bytes input).
+        """
+        if isinstance(value, bytes):
+            return value
+        if isinstance(value, (bytearray, memoryview)):
+            # NOTE: binary buffers are stored as-is too, never JSON-encoded
+            return bytes(value)
+        if isinstance(value, str):
+            return value.encode("utf-8")
+        try:
+            return _json_dumps(value)
+        except (TypeError, ValueError) as exc:
+            logger.error("Failed to serialize value for key '%s': %s", key, exc)
+            raise ValueError("Value must be JSON-serializable or bytes type") from exc
+
+    def _queue_redis_store(
+        self,
+        storage: RedisStorage,
+        target: Any,
+        storage_keyname: str,
+        prepared_value: bytes,
+        ttl: int,
+    ) -> None:
+        """
+        Send (or queue, for a pipeline) the Redis commands writing a single value.
+
+        The key and serialization match what huey_app.put would use, so that
+        huey_app.get can still read the value back.
+
+        Args:
+            storage: The Redis storage backend of the Huey instance.
+            target: The Redis connection or pipeline to send the commands to.
+            storage_keyname: Full key name used in backend storage.
+            prepared_value: Prepared (optionally compressed) bytes to store.
+            ttl: Time-to-live in seconds; must be positive.
+        """
+        serialized = self.huey_app.serializer.serialize(prepared_value)
+
+        if isinstance(storage, RedisExpireStorage):
+            # NOTE: RedisExpireStorage keeps each value under its own key, so
+            #   write it with SET ... EX and save the EXPIRE command
+            target.set(storage.result_key(storage_keyname), serialized, ex=ttl)
+        else:
+            # NOTE: RedisStorage keeps values in a single hash; send the HSET that
+            #   huey_app.put would send, followed by the EXPIRE
+            target.hset(storage.result_key, storage_keyname, serialized)
+            target.expire(self._redis_key_prefix + storage_keyname, ttl)
+
     def store_app_cache(self, key: str, value: Any, ttl: int = -1) -> bool:
         """
         Store or replace cache data in the Huey backend.
 
         Automatically serializes non-bytes values to JSON-encoded bytes. For bytes input,
-        stores directly with optional compression based on size thresholds.
+        stores directly with optional compression based on size thresholds. A
+        ValueError is propagated if value cannot be JSON-serialized.
 
         Args:
             key: Cache key identifier as string.
@@ -143,78 +323,189 @@ class HueyAppCache(AppCacheBase):
             bool: True if storage was successful.
 
         Raises:
-            ValueError: If value cannot be JSON-serialized (for non-bytes input).
             RuntimeError: If underlying storage operation fails after retries.
         """
         ttl = ttl if ttl > 0 else self.default_ttl
-        logger.debug(f"Storing key '{key}' (TTL: {ttl}s)")
+        logger.debug("Storing key '%s' (TTL: %ds)", key, ttl)
         storage_keyname = self._get_storage_keyname(key)
-
-        # convert value to bytes if not already
-        if isinstance(value, bytes):
-            prepared_value = value
-        elif isinstance(value, str):
-            prepared_value = value.encode("utf-8")
-        else:
-            try:
-                prepared_value = json.dumps(value).encode("utf-8")
-            except (TypeError, ValueError) as exc:
-                logger.error(f"Failed to serialize value for key '{key}': {exc}")
-                raise ValueError(
-                    "Value must be JSON-serializable or bytes type"
-                ) from exc
+        prepared_value = self._serialize_value(key, value)
 
         try:
             prepared_value = self._prepare_data(prepared_value)
-            self.huey_app.put(storage_keyname, prepared_value)
+            self._write_app_cache(storage_keyname, prepared_value, ttl)
+            return True
+        except Exception as exc:
+            logger.error("Failed to store value for key '%s': %s", key, exc)
+            raise RuntimeError("Cache storage operation failed") from exc
 
-            if isinstance(self.huey_app.storage, RedisStorage):
-                app_name = self.huey_app.storage.name
-                redis_key = f"huey.r.{app_name}.{storage_keyname}"
-                self.huey_app.storage.conn.expire(redis_key, ttl)
+    @redis_retry
+    def _write_app_cache(
+        self, storage_keyname: str, prepared_value: bytes, ttl: int
+    ) -> None:
+        """
+        Write a prepared value to the Huey backend, retrying on connection errors.
+
+        Args:
+            storage_keyname: Full key name used in backend storage.
+            prepared_value: Prepared (optionally compressed) bytes to store.
+            ttl: Time-to-live in seconds.
+        """
+        storage = self._redis_storage
+        if isinstance(storage, RedisExpireStorage) and ttl > 0:
+            # NOTE: a single SET ... EX, no pipeline needed
+            self._queue_redis_store(
+                storage, storage.conn, storage_keyname, prepared_value, ttl
+            )
+            return
+
+        if storage is not None and ttl > 0:
+            # NOTE: pipeline the HSET and EXPIRE, so a store costs one round trip
+            #   instead of two
+            with storage.conn.pipeline(transaction=False) as pipe:
+                self._queue_redis_store(
+                    storage, pipe, storage_keyname, prepared_value, ttl
+                )
+                pipe.execute()
+            return
+
+        self.huey_app.put(storage_keyname, prepared_value)
+
+        if storage is not None:
+            storage.conn.expire(self._redis_key_prefix + storage_keyname, ttl)
+
+    def store_many_app_cache(self, items: dict[str, Any], ttl: int = -1) -> bool:
+        """
+        Store or replace cache data for several keys in the Huey backend.
+
+        With Redis storage, all items are written in a single pipelined round trip;
+        other backends store each item with store_app_cache. A ValueError is
+        propagated if a value cannot be JSON-serialized.
+
+        Args:
+            items: Data to store, by cache key identifier.
+            ttl: Time-to-live in seconds, for every item. Uses default TTL if <= 0.
+
+        Returns:
+            bool: True if storage was successful.
+
+        Raises:
+            RuntimeError: If underlying storage operation fails after retries.
+        """
+        ttl = ttl if ttl > 0 else self.default_ttl
+        storage = self._redis_storage
+        if storage is None or ttl <= 0:
+            return super().store_many_app_cache(items, ttl)
+
+        logger.debug("Storing %d keys (TTL: %ds)", len(items), ttl)
+        prepared_values = {
+            self._get_storage_keyname(key): self._prepare_data(
+                self._serialize_value(key, value)
+            )
+            for key, value in items.items()
+        }
 
+        try:
+            self._store_many_redis(storage, prepared_values, ttl)
             return True
         except Exception as exc:
-            logger.error(f"Failed to store value for key '{key}': {exc}")
+            logger.error("Failed to store values for %s keys: %s", len(items), exc)
             raise RuntimeError("Cache storage operation failed") from exc
 
-    @retry(
-        reraise=True,
-        stop=stop_after_attempt(5),
-        wait=wait_fixed(0.001),
-        after=tenacity_retry_log(logger),
-    )
+    @redis_retry
+    def _store_many_redis(
+        self, storage: RedisStorage, prepared_values: dict[str, bytes], ttl: int
+    ) -> None:
+        """
+        Write prepared values to Redis storage in a single pipeline.
+
+        Args:
+            storage: The Redis storage backend of the Huey instance.
+            prepared_values: Prepared (optionally compressed) bytes, by storage key.
+            ttl: Time-to-live in seconds; must be positive.
+        """
+        with storage.conn.pipeline(transaction=False) as pipe:
+            for storage_keyname, prepared_value in prepared_values.items():
+                self._queue_redis_store(
+                    storage, pipe, storage_keyname, prepared_value, ttl
+                )
+            pipe.execute()
+
     def fetch_app_cache(self, key: str) -> Optional[Any]:
         """
         Fetch cached data from the Huey backend.
+
+        Reads are not retried: if the backend fails, this is treated as a cache miss
+        so that callers fall back to the source of truth right away.
         """
-        logger.debug(f"Fetching data for key '{key}'")
+        logger.debug("Fetching data for key '%s'", key)
         storage_keyname = self._get_storage_keyname(key)
 
-        cache_value = self.huey_app.get(key=storage_keyname, peek=True)
+        try:
+            cache_value = self.huey_app.get(key=storage_keyname, peek=True)
+        except _BACKEND_ERRORS as exc:
+            logger.warning("Failed to fetch storage key '%s': %s", storage_keyname, exc)
+            return None
+
         if not cache_value:
-            logger.warning(f"No cache entry found for storage key '{storage_keyname}'")
+            logger.warning("No cache entry found for storage key '%s'", storage_keyname)
             return None
 
         return self._restore_data(cache_value)
 
-    @retry(
-        reraise=True,
-        stop=stop_after_attempt(5),
-        wait=wait_fixed(0.001),
-        after=tenacity_retry_log(logger),
-    )
+    def fetch_many_app_cache(self, keys: list[str]) -> list[Optional[Any]]:
+        """
+        Fetch cached data for several keys from the Huey backend.
+
+        With Redis storage, all keys are fetched in a single round trip (MGET for
+        RedisExpireStorage, HMGET for RedisStorage). Like fetch_app_cache, reads are
+        not retried and backend failures are treated as cache misses.
+        """
+        if self._redis_storage is None:
+            return super().fetch_many_app_cache(keys)
+
+        logger.debug("Fetching data for %d keys", len(keys))
+        storage = self._redis_storage
+        storage_keynames = [self._get_storage_keyname(key) for key in keys]
+
+        try:
+            if isinstance(storage, RedisExpireStorage):
+                raw_values = storage.conn.mget(
+                    [storage.result_key(keyname) for keyname in storage_keynames]
+                )
+            else:
+                raw_values = storage.conn.hmget(storage.result_key, storage_keynames)
+        except _BACKEND_ERRORS as exc:
+            logger.warning("Failed to fetch %s storage keys: %s", len(keys), exc)
+            return [None] * len(keys)
+
+        cache_values: list[Optional[Any]] = []
+        for storage_keyname, raw_value in zip(storage_keynames, raw_values):
+            if raw_value is None:
+                logger.warning(
+                    "No cache entry found for storage key '%s'", storage_keyname
+                )
+                cache_values.append(None)
+                continue
+
+            cache_value = self.huey_app.serializer.deserialize(raw_value)
+            cache_values.append(
+                self._restore_data(cache_value) if cache_value else None
+            )
+
+        return cache_values
+
+    @redis_retry
     def clear_app_cache(self, key: str) -> bool:
         """
         Clear cached data from the Huey backend.
         """
-        logger.debug(f"Clearing data for key '{key}'")
+        logger.debug("Clearing data for key '%s'", key)
         storage_keyname = self._get_storage_keyname(key)
 
         if not self.huey_app.delete(key=storage_keyname):
-            logger.warning(f"Failed to delete storage key '{storage_keyname}'")
+            logger.warning("Failed to delete storage key '%s'", storage_keyname)
             return False
 
-        logger.debug(f"Cleared data for key '{key}'")
+        logger.debug("Cleared data for key '%s'", key)
 
         return True
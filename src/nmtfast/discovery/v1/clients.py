@@ -4,14 +4,24 @@
 
 """Library functions to handle OAuth for connecting to discovered services."""
 
+import asyncio
+import base64
+import hashlib
 import json
 import logging
-from typing import Any, Dict, Optional
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, Optional
 
 import httpx
-from authlib.integrations.httpx_client import AsyncOAuth2Client
-from authlib.oauth2.rfc6749.errors import OAuth2Error
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from nmtfast.cache.v1.base import AppCacheBase
 from nmtfast.discovery.v1.exceptions import ServiceConnectionError
@@ -25,22 +35,392 @@ from nmtfast.settings.v1.schemas import (
     ServiceDiscoverySettings,
 )
 
+if TYPE_CHECKING:
+    from authlib.integrations.httpx_client import AsyncOAuth2Client
+    from authlib.oauth2.rfc6749.errors import OAuth2Error
+
 CACHE_KEY_PREFIX: str = ":api_client_token"
+STALE_BUFFER: int = 180
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+class _LoopClientPool:
+    """
+    Pooled API clients, and the locks and tasks guarding them, for one event loop.
+
+    Clients are pooled per service and client settings (see _client_pool_key), so
+    that connections (and TLS sessions) are kept alive and reused between calls
+    instead of being rebuilt every time. Clients, locks and tasks can only be used
+    on the event loop they were created on, so every event loop gets its own pool.
+    """
+
+    def __init__(self) -> None:
+        self.clients: dict[str, httpx.AsyncClient] = {}
+        self.client_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.refresh_tasks: dict[str, asyncio.Task] = {}
+        self.revoked_token_locks: defaultdict[str, asyncio.Lock] = defaultdict(
+            asyncio.Lock
+        )
+
+
+_LOOP_CLIENT_POOLS: dict[asyncio.AbstractEventLoop, _LoopClientPool] = {}
+
+
+def _running_loop_pool() -> _LoopClientPool:
+    """
+    Return the client pool of the running event loop, creating it if needed.
+
+    Pools of event loops that have been closed (e.g. by an earlier asyncio.run) are
+    dropped; their clients can no longer be used or closed.
+
+    Returns:
+        _LoopClientPool: The client pool of the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    if (pool := _LOOP_CLIENT_POOLS.get(loop)) is not None:
+        return pool
+
+    for closed_loop in [other for other in _LOOP_CLIENT_POOLS if other.is_closed()]:
+        del _LOOP_CLIENT_POOLS[closed_loop]
+
+    pool = _LOOP_CLIENT_POOLS[loop] = _LoopClientPool()
+    return pool
+
+
+def _client_pool_key(
+    auth: AuthSettings,
+    service_name: str,
+    service_config: DiscoveredService,
+) -> str:
+    """
+    Build the pool key of a service's client, from the settings it is built with.
+
+    Callers passing different service or outgoing auth settings for the same service
+    name (e.g. another client ID, secret or ID provider) get their own client,
+    instead of one built for somebody else's credentials.
+
+    Args:
+        auth: Application authentication settings.
+        service_name: The name of the service.
+        service_config: Configuration for the discovered service.
+
+    Returns:
+        str: The pool key of the service's client.
+    """
+    parts: list[str] = [service_name, service_config.model_dump_json()]
+    if service_config.auth_method == "client_credentials":
+        outgoing_client = auth.outgoing.clients.get(service_config.auth_principal)
+        if outgoing_client is not None:
+            parts.append(outgoing_client.model_dump_json())
+            if id_provider := auth.id_providers.get(outgoing_client.provider):
+                parts.append(id_provider.token_endpoint)
+    elif outgoing_headers := auth.outgoing.headers.get(service_config.auth_principal):
+        parts.append(outgoing_headers.model_dump_json())
+
+    return hashlib.blake2b("\0".join(parts).encode(), digest_size=16).hexdigest()
+
+
+TokenState = Literal["fresh", "stale", "expired"]
+
+
+class _AuthlibClasses(NamedTuple):
+    """
+    The Authlib classes used by this module.
+    """
+
+    AsyncOAuth2Client: type["AsyncOAuth2Client"]
+    OAuth2Error: type["OAuth2Error"]
+
+
+# NOTE: Authlib (and the JOSE/crypto modules it pulls in) is slow to import, so it
+#   is only loaded once a service actually needs OAuth; apps, workers and CLIs that
+#   never use client credentials skip that cost entirely
+@lru_cache(maxsize=1)
+def _authlib() -> _AuthlibClasses:
+    """
+    Import the Authlib classes used by this module, on first use.
+
+    Returns:
+        _AuthlibClasses: The Authlib classes.
+    """
+    from authlib.integrations.httpx_client import AsyncOAuth2Client
+    from authlib.oauth2.rfc6749.errors import OAuth2Error
+
+    return _AuthlibClasses(AsyncOAuth2Client, OAuth2Error)
+
+
+# NOTE: httpx Limits/Timeout objects are never mutated once built, so they can be
+#   shared by every client instead of being rebuilt on each call
+_HTTPX_LIMITS: httpx.Limits = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=25.0,
+)
+
+
+@lru_cache(maxsize=64)
+def _build_httpx_timeout(
+    timeout: float,
+    connect: float,
+    read: float,
+    write: float,
+    pool: float,
+) -> httpx.Timeout:
+    """
+    Build an httpx.Timeout once per distinct set of timeout values.
+
+    Args:
+        timeout: Default timeout, in seconds.
+        connect: Timeout for opening connections, in seconds.
+        read: Timeout for reading a response chunk, in seconds.
+        write: Timeout for writing a request chunk, in seconds.
+        pool: Timeout for acquiring a connection from the pool, in seconds.
+
+    Returns:
+        httpx.Timeout: The (shared) timeout configuration.
+    """
+    return httpx.Timeout(timeout, connect=connect, read=read, write=write, pool=pool)
+
+
+def _httpx_timeout(service_config: DiscoveredService) -> httpx.Timeout:
+    """
+    Return the httpx.Timeout for a service, with a timeout for each stage.
+
+    Stage timeouts that are not set inherit the service timeout; they are never
+    passed as None, which httpx would treat as "no timeout".
+
+    Args:
+        service_config: Configuration for the discovered service.
+
+    Returns:
+        httpx.Timeout: The (shared) timeout configuration.
+    """
+    timeout = service_config.timeout
+    read, write, pool = (
+        timeout if stage_timeout is None else stage_timeout
+        for stage_timeout in (
+            service_config.read_timeout,
+            service_config.write_timeout,
+            service_config.pool_timeout,
+        )
+    )
+
+    return _build_httpx_timeout(
+        timeout, service_config.connect_timeout, read, write, pool
+    )
+
+
+@lru_cache(maxsize=256)
+def token_cache_key(service_name: str, client_id: str) -> str:
+    """
+    Build the app cache key for a service's access token.
+
+    The service name and client ID are hashed into a short, fixed-length key, so
+    long client IDs do not bloat the cache key space.
+
+    Args:
+        service_name: The name of the service.
+        client_id: The client ID used to acquire tokens for the service.
+
+    Returns:
+        str: The cache key for the access token.
+    """
+    digest = hashlib.blake2b(
+        f"{service_name}|{client_id}".encode(), digest_size=16
+    ).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:{digest}"
+
+
+def _dump_token(token: dict) -> str:
+    """
+    Serialize an access token for the app cache, as compact JSON.
+
+    Args:
+        token: The token (or Authlib OAuth2Token) to serialize.
+
+    Returns:
+        str: The serialized token.
+    """
+    return json.dumps(token, separators=(",", ":"))
+
+
+@lru_cache(maxsize=64)
+def _client_secret_basic_encoder(
+    client_id: str, client_secret: str
+) -> Callable[..., tuple[str, dict, Any]]:
+    """
+    Build an Authlib client_secret_basic auth method with a pre-encoded header.
+
+    The header is encoded exactly like Authlib's own encode_client_secret_basic, but
+    only once per set of client credentials.
+
+    Args:
+        client_id: The client ID for the OAuth client.
+        client_secret: The client secret for the OAuth client.
+
+    Returns:
+        Callable[..., tuple[str, dict, Any]]: An auth method that can be registered
+            with AsyncOAuth2Client.register_client_auth_method.
+    """
+    credentials = f"{client_id}:{client_secret}".encode("latin1")
+    auth_header = f"Basic {base64.b64encode(credentials).decode('ascii')}"
+
+    def encode_client_secret_basic(
+        client_auth: Any, method: str, uri: str, headers: dict, body: Any
+    ) -> tuple[str, dict, Any]:
+        headers["Authorization"] = auth_header
+        return uri, headers, body
+
+    return encode_client_secret_basic
+
+
+class _UnauthorizedRetryTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper that retries a request once when its access token is rejected.
+
+    ID providers sometimes revoke tokens before they expire. When a request sent
+    with a bearer token gets a 401 response, on_unauthorized is called with the
+    rejected Authorization header; if it returns a new one, the request is sent
+    again exactly once with that header.
+
+    Args:
+        transport: The transport used to send requests.
+        on_unauthorized: Coroutine returning a new Authorization header, or None if
+            the request should not be retried.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        on_unauthorized: Callable[[str], Awaitable[Optional[str]]],
+    ) -> None:
+        self.transport: httpx.AsyncBaseTransport = transport
+        self.on_unauthorized = on_unauthorized
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send a request, retrying it once with a new token on a 401 response.
+
+        Args:
+            request: The request to send.
+
+        Returns:
+            httpx.Response: The response to the (possibly retried) request.
+        """
+        response = await self.transport.handle_async_request(request)
+
+        authorization: str = request.headers.get("Authorization", "")
+        if (
+            response.status_code != 401
+            or not authorization.lower().startswith("bearer ")
+            or not isinstance(request.stream, httpx.ByteStream)  # must be replayable
+        ):
+            return response
+
+        new_authorization = await self.on_unauthorized(authorization)
+        if not new_authorization:
+            return response
+
+        await response.aclose()
+        request.headers["Authorization"] = new_authorization
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """
+        Close the wrapped transport.
+        """
+        await self.transport.aclose()
+
+
+async def _refresh_revoked_token(
+    service_name: str,
+    client: httpx.AsyncClient,
+    cache: AppCacheBase,
+    token_key: str,
+    rejected_authorization: str,
+) -> Optional[str]:
+    """
+    Replace an access token that was rejected by a service, and cache the new one.
+
+    HTTP and OAuth errors while fetching the new token are logged, and the rejected
+    response is returned as-is; any other exception is raised.
+
+    Args:
+        service_name: The name of the service.
+        client: The OAuth client whose token was rejected.
+        cache: An instance of AppCacheBase for token caching.
+        token_key: The cache key of the service's access token.
+        rejected_authorization: The Authorization header that was rejected.
+
+    Returns:
+        Optional[str]: The new Authorization header, or None if no new token could
+            be fetched.
+    """
+    oauth_client: Any = client
+
+    async with _running_loop_pool().revoked_token_locks[service_name]:
+        # NOTE: concurrent requests may have been rejected with the same token;
+        #   only the first one fetches a new token, the others reuse it
+        current_token = oauth_client.token
+        if current_token and (
+            f"Bearer {current_token.get('access_token')}" != rejected_authorization
+        ):
+            return f"Bearer {current_token['access_token']}"
+
+        logger.warning(
+            "Access token for %s was rejected, fetching a new one", service_name
+        )
+        cache.clear_app_cache(token_key)
+
+        try:
+            token: dict = await oauth_client.fetch_token()
+        except (httpx.HTTPError, _authlib().OAuth2Error) as exc:
+            logger.warning("Failed to replace %s access token: %s", service_name, exc)
+            return None
+
+        if not token or not token.get("access_token"):
+            return None
+
+        cache.store_app_cache(token_key, _dump_token(oauth_client.token))
+
+    return f"Bearer {token['access_token']}"
+
+
+def _is_transient_connection_error(exc: BaseException) -> bool:
+    """
+    Determine if connecting to a service failed for a reason worth retrying.
+
+    Transport errors (including timeouts) and OAuth errors are transient, also when
+    they were wrapped in a ServiceConnectionError. A ServiceConnectionError without
+    such a cause (e.g. a missing service, client or ID provider in the settings) is
+    deterministic and will fail the same way on every attempt.
+
+    Args:
+        exc: The exception raised while connecting to the service.
+
+    Returns:
+        bool: True if the call should be retried, otherwise False.
+    """
+    if isinstance(exc, ServiceConnectionError):
+        exc = exc.__cause__  # type: ignore[assignment]
+
+    return isinstance(exc, (httpx.TransportError, _authlib().OAuth2Error))
+
+
 @retry(
     reraise=True,
     stop=stop_after_attempt(20),
-    wait=wait_fixed(15),
+    wait=wait_random_exponential(multiplier=1, max=60),
+    retry=retry_if_exception(_is_transient_connection_error),
     after=tenacity_retry_log(logger),
 )
 async def get_oauth_client(
     service_config: DiscoveredService,
     id_provider: IDProvider,
     client_settings: OutgoingAuthClient,
-    cached_token: Optional[Dict[str, Any]] = None,
-) -> AsyncOAuth2Client:
+    cached_token: Optional[dict[str, Any]] = None,
+    on_unauthorized: Optional[Callable[[str], Awaitable[Optional[str]]]] = None,
+) -> "AsyncOAuth2Client":
     """
     Retrieves or creates an Authlib AsyncOAuth2Client for a given provider.
 
@@ -57,11 +437,20 @@ async def get_oauth_client(
             client ID, secret, and authentication method.
         cached_token: An optional dictionary containing a previously cached
             access token. If provided, the client will attempt to use this token.
+        on_unauthorized: An optional coroutine that returns a new Authorization
+            header when a request's access token is rejected (401); the request is
+            then retried once with it.
 
     Returns:
         AsyncOAuth2Client: An initialized httpx OAuth 2 client.
     """
-    client: AsyncOAuth2Client = AsyncOAuth2Client(
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+        retries=service_config.retries,
+    )
+    if on_unauthorized is not None:
+        transport = _UnauthorizedRetryTransport(transport, on_unauthorized)
+
+    client: AsyncOAuth2Client = _authlib().AsyncOAuth2Client(
         client_id=client_settings.client_id,
         client_secret=client_settings.client_secret,
         token=cached_token,  # only if this was passed in from cache
@@ -71,25 +460,131 @@ async def get_oauth_client(
         base_url=service_config.base_url,
         compliance_hook={"refresh_token_request": lambda params: params},
         follow_redirects=True,
-        timeout=httpx.Timeout(
-            service_config.timeout,
-            connect=service_config.connect_timeout,
-        ),
-        limits=httpx.Limits(
-            max_keepalive_connections=1,
-        ),
-        transport=httpx.AsyncHTTPTransport(
-            retries=service_config.retries,
-        ),
+        timeout=_httpx_timeout(service_config),
+        limits=_HTTPX_LIMITS,
+        transport=transport,
         headers=service_config.headers,
     )
+
+    if client_settings.token_endpoint_auth_method == "client_secret_basic":
+        # NOTE: replace Authlib's encoder, which rebuilds the same Basic header for
+        #   every token request, with one that uses a pre-encoded header
+        client.register_client_auth_method(
+            (
+                "client_secret_basic",
+                _client_secret_basic_encoder(
+                    client_settings.client_id, client_settings.client_secret
+                ),
+            )
+        )
+
     return client
 
 
+def _pooled_client_state(
+    client: Optional[httpx.AsyncClient],
+    service_config: DiscoveredService,
+) -> TokenState:
+    """
+    Classify a pooled client as fresh, stale or expired.
+
+    A client credentials client is stale when its access token expires within
+    STALE_BUFFER seconds; it can still be used while a new token is fetched in the
+    background. Clients using other auth methods are fresh until they are closed.
+
+    Args:
+        client: The pooled client, if there is one.
+        service_config: Configuration for the discovered service.
+
+    Returns:
+        TokenState: "fresh", "stale" or "expired" (missing and closed clients are
+            also treated as expired).
+    """
+    if client is None or client.is_closed:
+        return "expired"
+
+    if service_config.auth_method != "client_credentials":
+        return "fresh"
+
+    token = getattr(client, "token", None)
+    if not token:
+        return "expired"
+
+    if (expires_at := token.get("expires_at")) is None:
+        return "fresh"
+
+    remaining: float = expires_at - time.time()
+    if remaining <= 0:
+        return "expired"
+    if remaining < STALE_BUFFER:
+        return "stale"
+
+    return "fresh"
+
+
+async def _background_refresh(
+    service_name: str,
+    client: httpx.AsyncClient,
+    cache: AppCacheBase,
+) -> None:
+    """
+    Fetch a new access token for a pooled client and cache it.
+
+    HTTP and OAuth errors are logged and swallowed; once the token expires, the
+    next call to create_api_client will build a new client and surface them. Any
+    other exception is a bug, and is left to fail the task.
+
+    Args:
+        service_name: The name of the service.
+        client: The pooled OAuth client to refresh the token for.
+        cache: An instance of AppCacheBase for token caching.
+    """
+    error: object = "Authlib failed to retrieve a token"
+    try:
+        token: dict = await client.fetch_token()  # type: ignore[attr-defined]
+        if token and token.get("access_token"):
+            oauth_client: Any = client
+            cache.store_app_cache(
+                token_cache_key(service_name, oauth_client.client_id),
+                _dump_token(oauth_client.token),
+            )
+            logger.debug("Refreshed %s access token in the background", service_name)
+            return
+    except (httpx.HTTPError, _authlib().OAuth2Error) as exc:
+        error = exc
+
+    logger.warning("Background token refresh failed for %s: %s", service_name, error)
+
+
+def _schedule_token_refresh(
+    pool_key: str,
+    service_name: str,
+    client: httpx.AsyncClient,
+    cache: AppCacheBase,
+) -> None:
+    """
+    Start a background token refresh for a client, unless one is already running.
+
+    Args:
+        pool_key: The pool key of the client.
+        service_name: The name of the service.
+        client: The pooled OAuth client to refresh the token for.
+        cache: An instance of AppCacheBase for token caching.
+    """
+    refresh_tasks = _running_loop_pool().refresh_tasks
+    if pool_key in refresh_tasks:
+        return
+
+    task = asyncio.create_task(_background_refresh(service_name, client, cache))
+    refresh_tasks[pool_key] = task
+    task.add_done_callback(lambda _: refresh_tasks.pop(pool_key, None))
+
+
 @retry(
     reraise=True,
     stop=stop_after_attempt(20),
-    wait=wait_fixed(15),
+    wait=wait_random_exponential(multiplier=1, max=60),
+    retry=retry_if_exception(_is_transient_connection_error),
     after=tenacity_retry_log(logger),
 )
 async def create_api_client(
@@ -105,6 +600,18 @@ async def create_api_client(
     client credentials authentication, it attempts to retrieve a token
     from cache or acquire a new one using Authlib.
 
+    Clients are pooled per event loop, service name and settings: later calls for
+    the same service with the same service and outgoing auth settings get the same
+    client back, until it is closed or (for client credentials) its access token
+    expires. When the token is within STALE_BUFFER seconds of expiring, the pooled
+    client is still returned and a new token is fetched in the background.
+
+    The returned client is shared with every other caller using the same settings,
+    so callers must not close it, directly (aclose) or by using it as an async
+    context manager; a closed client is replaced on the next call, but any other
+    caller still holding it is left with a closed client. Use close_api_clients()
+    to close all pooled clients on shutdown.
+
     Args:
         auth: Application authentication settings.
         discovery: Application service discovery settings.
@@ -125,35 +632,167 @@ async def create_api_client(
         )
 
     service_config: DiscoveredService = discovery.services[service_name]
+    pool_key = _client_pool_key(auth, service_name, service_config)
+    pool = _running_loop_pool()
+    pooled_client = pool.clients.get(pool_key)
+    state = _pooled_client_state(pooled_client, service_config)
+
+    if pooled_client is not None and state == "stale":
+        # NOTE: keep using the current token, and fetch a new one off the
+        #   critical path before it actually expires
+        _schedule_token_refresh(pool_key, service_name, pooled_client, cache)
+        return pooled_client
+    if pooled_client is not None and state == "fresh":
+        return pooled_client
+
+    # NOTE: only one caller per service builds the client (and fetches a token,
+    #   singleflight-style); concurrent callers wait for it and reuse the result,
+    #   instead of each sending their own token request to the ID provider
+    async with pool.client_locks[pool_key]:
+        # NOTE: a pending background refresh may still bring the token back in
+        #   time, and another caller may have built the client while we waited
+        if refresh_task := pool.refresh_tasks.get(pool_key):
+            await asyncio.shield(refresh_task)
+
+        pooled_client = pool.clients.get(pool_key)
+        if pooled_client is not None and (
+            _pooled_client_state(pooled_client, service_config) != "expired"
+        ):
+            return pooled_client
+
+        http_client = await _build_api_client(auth, discovery, service_name, cache)
+        pool.clients[pool_key] = http_client
 
-    # Initialize http_client with a default httpx.AsyncClient.
-    # This covers cases where no specific auth method is needed or for API keys.
-    http_client: httpx.AsyncClient = httpx.AsyncClient(
-        base_url=service_config.base_url,
-        follow_redirects=True,
-        timeout=httpx.Timeout(
-            service_config.timeout,
-            connect=service_config.connect_timeout,
-        ),
-        limits=httpx.Limits(
-            max_keepalive_connections=1,
-        ),
-        transport=httpx.AsyncHTTPTransport(
-            retries=service_config.retries,
-        ),
-        headers=service_config.headers,
+    return http_client
+
+
+class _PrefetchedTokenCache(AppCacheBase):
+    """
+    App cache wrapper that serves token lookups from values fetched in bulk.
+
+    Args:
+        cache: The app cache to delegate stores (and unknown keys) to.
+        prefetched: Cached values that were already fetched, by cache key.
+    """
+
+    def __init__(self, cache: AppCacheBase, prefetched: dict[str, Any]) -> None:
+        self.cache: AppCacheBase = cache
+        self.prefetched: dict[str, Any] = prefetched
+
+    def store_app_cache(self, key: str, value: Any, ttl: int = -1) -> bool:
+        """
+        Store/replace cache data in the wrapped cache.
+        """
+        return self.cache.store_app_cache(key, value, ttl)
+
+    def fetch_app_cache(self, key: str) -> Optional[Any]:
+        """
+        Fetch cache data, using the prefetched value if there is one.
+        """
+        if key in self.prefetched:
+            return self.prefetched[key]
+
+        return self.cache.fetch_app_cache(key)
+
+    def clear_app_cache(self, key: str) -> bool:
+        """
+        Clear cached data from the wrapped cache.
+        """
+        self.prefetched.pop(key, None)
+        return self.cache.clear_app_cache(key)
+
+
+async def create_api_clients(
+    auth: AuthSettings,
+    discovery: ServiceDiscoverySettings,
+    service_names: list[str],
+    cache: AppCacheBase,
+) -> dict[str, httpx.AsyncClient]:
+    """
+    Create (or reuse pooled) httpx.AsyncClients for several discovered services.
+
+    Cached access tokens for all client credentials services are fetched from the
+    app cache in one batch, instead of one round trip per service, and the clients
+    are then created concurrently (see create_api_client). A ServiceConnectionError
+    raised for any of the services is propagated to the caller.
+
+    Args:
+        auth: Application authentication settings.
+        discovery: Application service discovery settings.
+        service_names: The names of the services to create clients for.
+        cache: An instance of AppCacheBase for token caching.
+
+    Returns:
+        dict[str, httpx.AsyncClient]: The clients, by service name.
+    """
+    token_keys: list[str] = []
+    for service_name in service_names:
+        service_config = discovery.services.get(service_name)
+        if service_config is None or service_config.auth_method != "client_credentials":
+            continue
+
+        outgoing_client = auth.outgoing.clients.get(service_config.auth_principal)
+        if outgoing_client is not None:
+            token_keys.append(token_cache_key(service_name, outgoing_client.client_id))
+
+    prefetched: dict[str, Any] = {}
+    if token_keys:
+        prefetched = dict(zip(token_keys, cache.fetch_many_app_cache(token_keys)))
+
+    prefetched_cache = _PrefetchedTokenCache(cache, prefetched)
+    clients = await asyncio.gather(
+        *(
+            create_api_client(auth, discovery, service_name, prefetched_cache)
+            for service_name in service_names
+        )
     )
 
-    if service_config.auth_method == "client_credentials":
-        cached_token: Optional[Dict[str, Any]] = None
-        token_key: str = f"{CACHE_KEY_PREFIX}:{service_name}"
+    return dict(zip(service_names, clients))
 
-        # NOTE: look for a cached access token first, instead of always trying to
-        #   acquire one when an app starts
-        if raw_cached_token := cache.fetch_app_cache(token_key):
-            cached_token = json.loads(raw_cached_token.decode("utf-8"))
-            logger.debug(f"Found cached API client token for {service_name}")
 
+async def close_api_clients() -> None:
+    """
+    Close the API clients pooled on the running event loop, e.g. during shutdown.
+    """
+    pool = _running_loop_pool()
+    for task in list(pool.refresh_tasks.values()):
+        task.cancel()
+
+    clients = list(pool.clients.values())
+    pool.clients.clear()
+
+    for client in clients:
+        await client.aclose()
+
+
+async def _build_api_client(
+    auth: AuthSettings,
+    discovery: ServiceDiscoverySettings,
+    service_name: str,
+    cache: AppCacheBase,
+) -> httpx.AsyncClient:
+    """
+    Build a new httpx.AsyncClient for a discovered service (see create_api_client).
+
+    Args:
+        auth: Application authentication settings.
+        discovery: Application service discovery settings.
+        service_name: The name of the service to create a client for.
+        cache: An instance of AppCacheBase for token caching.
+
+    Returns:
+        httpx.AsyncClient: The newly built client.
+
+    Raises:
+        ServiceConnectionError: If there are issues with authentication
+            client/provider lookup or token acquisition.
+    """
+    service_config: DiscoveredService = discovery.services[service_name]
+
+    http_client: httpx.AsyncClient
+
+    if service_config.auth_method == "client_credentials":
+        cached_token: Optional[dict[str, Any]] = None
         outgoing_client_name: str = service_config.auth_principal
         outgoing_client = auth.outgoing.clients.get(outgoing_client_name)
 
@@ -162,6 +801,13 @@ async def create_api_client(
                 f"Outgoing client '{outgoing_client_name}' not found in auth settings."
             )
 
+        # NOTE: look for a cached access token first, instead of always trying to
+        #   acquire one when an app starts
+        token_key: str = token_cache_key(service_name, outgoing_client.client_id)
+        if raw_cached_token := cache.fetch_app_cache(token_key):
+            cached_token = json.loads(raw_cached_token)
+            logger.debug("Found cached API client token for %s", service_name)
+
         id_provider_name: str = outgoing_client.provider
         id_provider = auth.id_providers.get(id_provider_name)
 
@@ -170,17 +816,25 @@ async def create_api_client(
                 f"ID Provider '{id_provider_name}' not found in auth settings."
             )
 
+        # NOTE: oauth_client is only bound below, but always before this callback
+        #   can be called (i.e. before the client sends its first request)
+        async def on_unauthorized(rejected_authorization: str) -> Optional[str]:
+            return await _refresh_revoked_token(
+                service_name, oauth_client, cache, token_key, rejected_authorization
+            )
+
         try:
             oauth_client = await get_oauth_client(
                 service_config,
                 id_provider,
                 outgoing_client,
                 cached_token,
+                on_unauthorized,
             )
 
             # Check if existing token from cache is still valid
             if cached_token and not oauth_client.token.is_expired():
-                logger.debug(f"Returning cached API client for {service_name}")
+                logger.debug("Returning cached API client for %s", service_name)
                 http_client = oauth_client
                 return http_client
 
@@ -195,17 +849,18 @@ async def create_api_client(
 
             # Authlib token object is not directly JSON serializable,
             #   use its internal data dictionary
-            cache.store_app_cache(token_key, json.dumps(oauth_client.token))
+            cache.store_app_cache(token_key, _dump_token(oauth_client.token))
             logger.debug(
-                f"Cached {service_name} access token "
-                f"for {outgoing_client.cache_ttl} seconds"
+                "Cached %s access token for %s seconds",
+                service_name,
+                outgoing_client.cache_ttl,
             )
 
             # NOTE: no need to manually add "Authorization" header here, Authlib
             #   handles it
             http_client = oauth_client
 
-        except OAuth2Error as exc:
+        except _authlib().OAuth2Error as exc:
             raise ServiceConnectionError(
                 f"OAuth error while getting token for service '{service_name}': "
                 f"{exc.description}"
@@ -218,10 +873,21 @@ async def create_api_client(
 
     # NOTE: setting this to elif causes missing code coverage?!
     if service_config.auth_method == "headers":
+        http_client = httpx.AsyncClient(
+            base_url=service_config.base_url,
+            follow_redirects=True,
+            timeout=_httpx_timeout(service_config),
+            limits=_HTTPX_LIMITS,
+            transport=httpx.AsyncHTTPTransport(
+                retries=service_config.retries,
+            ),
+            headers=service_config.headers,
+        )
+
         # NOTE: auth headers can be blank if no authentication is required
         outgoing_auth_name: str = service_config.auth_principal
         outgoing_auth: OutgoingAuthHeaders = auth.outgoing.headers[outgoing_auth_name]
-        logger.debug(f"Using static auth headers for '{outgoing_auth_name}' client")
+        logger.debug("Using static auth headers for '%s' client", outgoing_auth_name)
         http_client.headers.update(outgoing_auth.headers)
 
     return http_client
@@ -6,23 +6,51 @@
 
 import logging
 import logging.config
+from functools import lru_cache
 
 from nmtfast.logging.v1.filters import RequestIDFilter
 from nmtfast.settings.v1.protocols import LoggingSettingsProtocol
 
+_LEVELS: dict[str, int] = {
+    name: getattr(logging, name)
+    for name in ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET")
+}
+
 
 def create_logging_config(logging_settings: LoggingSettingsProtocol) -> dict:
     """
     Set up a logger with a predefined configuration.
 
+    The configuration is built once per distinct level and format, and the same
+    dictionary is returned on later calls; it must be treated as read-only.
+
     Args:
         logging_settings: The LoggingSettings object.
 
     Returns:
         dict: A dictionary containing the logging configuration.
     """
-    log_level = getattr(logging, logging_settings.level.upper())
-    log_format = logging_settings.format
+    return _build_logging_config(
+        logging_settings.level.upper(), logging_settings.format
+    )
+
+
+# NOTE: the result is not wrapped in MappingProxyType, as logging.config.dictConfig
+#   only converts (and never mutates) real dict instances
+@lru_cache(maxsize=32)
+def _build_logging_config(level: str, log_format: str) -> dict:
+    """
+    Build the logging configuration for a log level and format.
+
+    Args:
+        level: The upper-cased name of the log level (e.g. INFO); unknown levels
+            fall back to INFO.
+        log_format: The log record format string.
+
+    Returns:
+        dict: A dictionary containing the logging configuration.
+    """
+    log_level = _LEVELS.get(level, logging.INFO)
     #
     # TODO: we need to decide what, if anything else, is customizable here
     #
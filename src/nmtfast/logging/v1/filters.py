@@ -12,6 +12,10 @@ from nmtfast.middleware.v1.request_id import REQUEST_ID_CONTEXTVAR
 class RequestIDFilter(logging.Filter):
     """Logging filter that adds the request ID to log records."""
 
+    # NOTE: the filter runs for every log record, so the bound ContextVar.get is
+    #   looked up once here instead of on every call
+    _get_request_id = staticmethod(REQUEST_ID_CONTEXTVAR.get)
+
     def filter(self, record: logging.LogRecord) -> bool:
         """
         Add the request ID to the log record.
@@ -22,5 +26,5 @@ class RequestIDFilter(logging.Filter):
         Returns:
             bool: True, indicating that the record should be included in the logs.
         """
-        record.request_id = REQUEST_ID_CONTEXTVAR.get()
+        record.request_id = self._get_request_id()
         return True
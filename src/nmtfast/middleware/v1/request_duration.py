@@ -6,59 +6,96 @@
 
 import logging
 import time
-from typing import Awaitable, Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+logger: logging.Logger = logging.getLogger(__name__)
 
-class RequestDurationMiddleware(BaseHTTPMiddleware):
+
+class RequestDurationMiddleware:
     """
     Middleware to measure and log the duration of HTTP requests.
+
+    NOTE: this is a pure ASGI middleware, rather than a BaseHTTPMiddleware, so that
+    requests are not wrapped in an extra task group and memory streams (which also
+    allows streaming responses to pass through untouched).
     """
 
     def __init__(
         self, app: ASGIApp, remote_headers: list[str] = ["X-Real-IP", "X-Forwarded-For"]
     ) -> None:
-        super().__init__(app)
-        self.header_names = remote_headers or []
+        self.app = app
+        self.header_names: tuple[str, ...] = tuple(remote_headers or [])
+
+        # NOTE: ASGI servers send header names lowercased, as bytes, so they can be
+        #   matched exactly against the raw scope headers (no case folding per
+        #   request, or building a Headers object)
+        self._raw_header_names: tuple[bytes, ...] = tuple(
+            header_name.lower().encode("latin-1") for header_name in self.header_names
+        )
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Measure and log the duration of a request in milliseconds.
 
+        The duration is measured up to the start of the response, and is added to
+        the response headers.
+
         Args:
-            request: The incoming request.
-            call_next: The next middleware or endpoint in the chain.
+            scope: The ASGI connection scope.
+            receive: The ASGI receive callable.
+            send: The ASGI send callable.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # NOTE: perf_counter is monotonic, so durations cannot be skewed (or go
+        #   negative) when the wall clock is adjusted during a request
+        start_time: float = time.perf_counter()
 
-        Returns:
-            Response: The response that will be returned to the client, or passed
-                to the next middleware.
+        async def send_with_duration(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                process_time_seconds: float = time.perf_counter() - start_time
+                process_time_ms: float = process_time_seconds * 1000  # convert to ms
+                response_headers = MutableHeaders(scope=message)
+                response_headers["x-nmtfast-request-time-ms"] = str(process_time_ms)
+                self.log_request(scope, process_time_ms)
+
+            await send(message)
+
+        await self.app(scope, receive, send_with_duration)
+
+    def log_request(self, scope: Scope, process_time_ms: float) -> None:
         """
-        start_time: float = time.time()
-        logger: logging.Logger = logging.getLogger(__name__)
-        response: Response = await call_next(request)
-        process_time_seconds: float = time.time() - start_time
-        process_time_ms: float = process_time_seconds * 1000  # convert to ms
-        response.headers["x-nmtfast-request-time-ms"] = str(process_time_ms)
+        Log the client, method, path and duration of a request.
 
-        remote_host: str = request.client.host if request.client else "0.0.0.0"
-        remote_port: int = request.client.port if request.client else 0
+        Args:
+            scope: The ASGI connection scope.
+            process_time_ms: The duration of the request, in milliseconds.
+        """
+        client = scope.get("client")
+        remote_host: str = client[0] if client else "0.0.0.0"
+        remote_port: int = client[1] if client else 0
 
         # Iterate over header names and use the first found value as remote_host
-        for header_name in self.header_names:
-            header_value: str | None = request.headers.get(header_name)
-            if header_value:
-                remote_host = header_value
-                break
+        if self._raw_header_names:
+            raw_headers: list[tuple[bytes, bytes]] = scope["headers"]
+            for raw_header_name in self._raw_header_names:
+                header_value: bytes | None = next(
+                    (value for name, value in raw_headers if name == raw_header_name),
+                    None,
+                )
+                if header_value:
+                    remote_host = header_value.decode("latin-1")
+                    break
 
-        client_info: str = f"{remote_host}:{remote_port}"
         logger.info(
-            f"{client_info} - {request.method}"
-            f" {request.url.path} - {process_time_ms:.2f}ms"
+            "%s:%d - %s %s - %.2fms",
+            remote_host,
+            remote_port,
+            scope["method"],
+            scope["path"],
+            process_time_ms,
         )
-
-        return response
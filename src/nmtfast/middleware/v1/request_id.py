@@ -6,36 +6,54 @@
 
 import contextvars
 import secrets
-from typing import Awaitable, Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 REQUEST_ID_CONTEXTVAR: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "request_id", default=None
 )
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to generate and manage request IDs for log correlation."""
+class RequestIDMiddleware:
+    """
+    Middleware to generate and manage request IDs for log correlation.
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    NOTE: this is a pure ASGI middleware, rather than a BaseHTTPMiddleware, so that
+    requests are not wrapped in an extra task group and memory streams (which also
+    allows streaming responses to pass through untouched).
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Generate a unique ID for short-lived log correlation and sets it in the context.
 
-        Args:
-            request: The incoming request.
-            call_next: The next middleware or endpoint in the chain.
+        The request ID is also added to the response headers.
 
-        Returns:
-            Response: The response from the next middleware or endpoint.
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive callable.
+            send: The ASGI send callable.
         """
-        request_id: str = str(f"R{secrets.token_hex(64)[:5]}")
-        REQUEST_ID_CONTEXTVAR.set(request_id)
-        response: Response = await call_next(request)
-        response.headers["x-nmtfast-request-id"] = request_id
-        return response
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # NOTE: 3 random bytes are enough for the 5 hex characters that are kept
+        request_id: str = "R" + secrets.token_hex(3)[:5]
+        token = REQUEST_ID_CONTEXTVAR.set(request_id)
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                response_headers["x-nmtfast-request-id"] = request_id
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            REQUEST_ID_CONTEXTVAR.reset(token)
@@ -8,7 +8,7 @@ import logging
 from typing import Literal
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import retry, stop_after_attempt, wait_random_exponential
 
 from nmtfast.htmx.v1.schemas import PaginationMeta
 from nmtfast.repositories.gadgets.v1.exceptions import GadgetApiException
@@ -19,7 +19,10 @@ from nmtfast.repositories.gadgets.v1.schemas import (
     GadgetZap,
     GadgetZapTask,
 )
-from nmtfast.retry.v1.tenacity import tenacity_retry_log
+from nmtfast.retry.v1.tenacity import (
+    retry_if_transient_upstream_error,
+    tenacity_retry_log,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +44,8 @@ class GadgetApiRepository:
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def gadget_create(self, gadget: GadgetCreate) -> GadgetRead:
@@ -58,22 +62,23 @@ class GadgetApiRepository:
             GadgetApiException: Raised when upstream API reports failure status code.
         """
         new_gadget = gadget.model_dump()
-        logger.debug(f"Adding gadget: {new_gadget}")
+        logger.debug("Adding gadget: %s", new_gadget)
         resp = await self.api_client.post("/v1/gadgets", json=new_gadget)
 
         if resp.status_code != 201:
-            logger.info(f"Failed to create gadget: {resp.status_code}: {resp.text}")
+            logger.info("Failed to create gadget: %s: %s", resp.status_code, resp.text)
             raise GadgetApiException(resp)
 
         resp_gadget = resp.json()
-        logger.info(f"Successfully created gadget: {resp_gadget}")
+        logger.info("Successfully created gadget: %s", resp_gadget)
 
         return GadgetRead(**resp_gadget)
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def get_by_id(self, gadget_id: str) -> GadgetRead:
@@ -89,22 +94,23 @@ class GadgetApiRepository:
         Raises:
             GadgetApiException: Raised when upstream API reports failure status code.
         """
-        logger.debug(f"Fetching gadget by ID: {gadget_id}")
+        logger.debug("Fetching gadget by ID: %s", gadget_id)
         resp = await self.api_client.get(f"/v1/gadgets/{gadget_id}")
 
         if resp.status_code != 200:
-            logger.info(f"Failed to find gadget: {resp.status_code}: {resp.text}")
+            logger.info("Failed to find gadget: %s: %s", resp.status_code, resp.text)
             raise GadgetApiException(resp)
 
         api_gadget = GadgetRead(**resp.json())
-        logger.debug(f"Retrieved gadget: {api_gadget}")
+        logger.debug("Retrieved gadget: %s", api_gadget)
 
         return api_gadget
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def get_all(
@@ -147,7 +153,7 @@ class GadgetApiRepository:
         )
 
         if resp.status_code != 200:
-            logger.info(f"Failed to list gadgets: {resp.status_code}: {resp.text}")
+            logger.info("Failed to list gadgets: %s: %s", resp.status_code, resp.text)
             raise GadgetApiException(resp)
 
         gadgets = [GadgetRead(**g) for g in resp.json()]
@@ -160,14 +166,15 @@ class GadgetApiRepository:
             sort_order=sort_order,
             search=search,
         )
-        logger.debug(f"Retrieved {len(gadgets)} gadgets (total: {total})")
+        logger.debug("Retrieved %s gadgets (total: %s)", len(gadgets), total)
 
         return gadgets, pagination
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def gadget_update(
@@ -188,25 +195,26 @@ class GadgetApiRepository:
         Raises:
             GadgetApiException: Raised when upstream API reports failure status code.
         """
-        logger.debug(f"Updating gadget ID {gadget_id}")
+        logger.debug("Updating gadget ID %s", gadget_id)
         resp = await self.api_client.patch(
             f"/v1/gadgets/{gadget_id}",
             json=data.model_dump(exclude_unset=True),
         )
 
         if resp.status_code != 200:
-            logger.info(f"Failed to update gadget: {resp.status_code}: {resp.text}")
+            logger.info("Failed to update gadget: %s: %s", resp.status_code, resp.text)
             raise GadgetApiException(resp)
 
         updated = GadgetRead(**resp.json())
-        logger.debug(f"Updated gadget: {updated}")
+        logger.debug("Updated gadget: %s", updated)
 
         return updated
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def gadget_delete(self, gadget_id: str) -> None:
@@ -219,19 +227,20 @@ class GadgetApiRepository:
         Raises:
             GadgetApiException: Raised when upstream API reports failure status code.
         """
-        logger.debug(f"Deleting gadget ID {gadget_id}")
+        logger.debug("Deleting gadget ID %s", gadget_id)
         resp = await self.api_client.delete(f"/v1/gadgets/{gadget_id}")
 
         if resp.status_code != 204:
-            logger.info(f"Failed to delete gadget: {resp.status_code}: {resp.text}")
+            logger.info("Failed to delete gadget: %s: %s", resp.status_code, resp.text)
             raise GadgetApiException(resp)
 
-        logger.debug(f"Deleted gadget ID {gadget_id}")
+        logger.debug("Deleted gadget ID %s", gadget_id)
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def gadget_bulk_delete(self, ids: list[str]) -> int:
@@ -247,7 +256,7 @@ class GadgetApiRepository:
         Raises:
             GadgetApiException: Raised when upstream API reports failure status code.
         """
-        logger.debug(f"Bulk deleting gadget IDs: {ids}")
+        logger.debug("Bulk deleting gadget IDs: %s", ids)
         resp = await self.api_client.post(
             "/v1/gadgets/actions/bulk/delete",
             json=ids,
@@ -255,19 +264,20 @@ class GadgetApiRepository:
 
         if resp.status_code != 200:
             logger.info(
-                f"Failed to bulk delete gadgets: {resp.status_code}: {resp.text}"
+                "Failed to bulk delete gadgets: %s: %s", resp.status_code, resp.text
             )
             raise GadgetApiException(resp)
 
         deleted = resp.json().get("deleted", 0)
-        logger.debug(f"Bulk deleted {deleted} gadgets")
+        logger.debug("Bulk deleted %s gadgets", deleted)
 
         return deleted
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def gadget_bulk_update(
@@ -288,7 +298,7 @@ class GadgetApiRepository:
         Raises:
             GadgetApiException: Raised when upstream API reports failure status code.
         """
-        logger.debug(f"Bulk updating gadget IDs: {ids}")
+        logger.debug("Bulk updating gadget IDs: %s", ids)
         resp = await self.api_client.post(
             "/v1/gadgets/actions/bulk/update",
             json={"ids": ids, "updates": data.model_dump(exclude_unset=True)},
@@ -296,19 +306,20 @@ class GadgetApiRepository:
 
         if resp.status_code != 200:
             logger.info(
-                f"Failed to bulk update gadgets: {resp.status_code}: {resp.text}"
+                "Failed to bulk update gadgets: %s: %s", resp.status_code, resp.text
             )
             raise GadgetApiException(resp)
 
         updated = resp.json().get("updated", 0)
-        logger.debug(f"Bulk updated {updated} gadgets")
+        logger.debug("Bulk updated %s gadgets", updated)
 
         return updated
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def gadget_zap(
@@ -329,25 +340,26 @@ class GadgetApiRepository:
         Raises:
             GadgetApiException: Raised when upstream API reports failure status code.
         """
-        logger.debug(f"Zapping gadget by ID: {gadget_id}")
+        logger.debug("Zapping gadget by ID: %s", gadget_id)
         resp = await self.api_client.post(
             f"/v1/gadgets/{gadget_id}/zap",
             json=payload.model_dump(),
         )
 
         if resp.status_code != 202:
-            logger.info(f"Failed to zap gadget: {resp.status_code}: {resp.text}")
+            logger.info("Failed to zap gadget: %s: %s", resp.status_code, resp.text)
             raise GadgetApiException(resp)
 
         api_task = GadgetZapTask(**resp.json())
-        logger.debug(f"Zapped gadget: {api_task}")
+        logger.debug("Zapped gadget: %s", api_task)
 
         return api_task
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def gadget_zap_by_uuid(
@@ -368,16 +380,16 @@ class GadgetApiRepository:
         Raises:
             GadgetApiException: Raised when upstream API reports failure status code.
         """
-        logger.debug(f"Fetching zap task by UUID: {task_uuid}")
+        logger.debug("Fetching zap task by UUID: %s", task_uuid)
         resp = await self.api_client.get(
             f"/v1/gadgets/{gadget_id}/zap/{task_uuid}/status"
         )
 
         if resp.status_code != 200:
-            logger.info(f"Failed get task by UUID: {resp.status_code}: {resp.text}")
+            logger.info("Failed get task by UUID: %s: %s", resp.status_code, resp.text)
             raise GadgetApiException(resp)
 
         api_task = GadgetZapTask(**resp.json())
-        logger.debug(f"Gadget zap task: {api_task}")
+        logger.debug("Gadget zap task: %s", api_task)
 
         return api_task
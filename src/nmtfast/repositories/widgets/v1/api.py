@@ -8,7 +8,7 @@ import logging
 from typing import Literal
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import retry, stop_after_attempt, wait_random_exponential
 
 from nmtfast.htmx.v1.schemas import PaginationMeta
 from nmtfast.repositories.widgets.v1.exceptions import WidgetApiException
@@ -20,7 +20,10 @@ from nmtfast.repositories.widgets.v1.schemas import (
     WidgetZapTask,
     WidgetZapTaskRead,
 )
-from nmtfast.retry.v1.tenacity import tenacity_retry_log
+from nmtfast.retry.v1.tenacity import (
+    retry_if_transient_upstream_error,
+    tenacity_retry_log,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +45,8 @@ class WidgetApiRepository:
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def widget_create(self, widget: WidgetCreate) -> WidgetRead:
@@ -59,22 +63,23 @@ class WidgetApiRepository:
             WidgetApiException: Raised when upstream API reports failure status code.
         """
         new_widget = widget.model_dump()
-        logger.debug(f"Adding widget: {new_widget}")
+        logger.debug("Adding widget: %s", new_widget)
         resp = await self.api_client.post("/v1/widgets", json=new_widget)
 
         if resp.status_code != 201:
-            logger.info(f"Failed to created widget: {resp.status_code}: {resp.text}")
+            logger.info("Failed to created widget: %s: %s", resp.status_code, resp.text)
             raise WidgetApiException(resp)
 
         resp_widget = resp.json()
-        logger.info(f"Successfully created widget: {resp_widget}")
+        logger.info("Successfully created widget: %s", resp_widget)
 
         return WidgetRead(**resp_widget)
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def get_by_id(self, widget_id: int) -> WidgetRead:
@@ -90,22 +95,23 @@ class WidgetApiRepository:
         Raises:
             WidgetApiException: Raised when upstream API reports failure status code.
         """
-        logger.debug(f"Fetching widget by ID: {widget_id}")
+        logger.debug("Fetching widget by ID: %s", widget_id)
         resp = await self.api_client.get(f"/v1/widgets/{widget_id}")
 
         if resp.status_code != 200:
-            logger.info(f"Failed to find widget: {resp.status_code}: {resp.text}")
+            logger.info("Failed to find widget: %s: %s", resp.status_code, resp.text)
             raise WidgetApiException(resp)
 
         api_widget = WidgetRead(**resp.json())
-        logger.debug(f"Retrieved widget: {api_widget}")
+        logger.debug("Retrieved widget: %s", api_widget)
 
         return api_widget
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def widget_zap(
@@ -126,25 +132,26 @@ class WidgetApiRepository:
         Raises:
             WidgetApiException: Raised when upstream API reports failure status code.
         """
-        logger.debug(f"Zapping widget by ID: {widget_id}")
+        logger.debug("Zapping widget by ID: %s", widget_id)
         resp = await self.api_client.post(
             f"/v1/widgets/{widget_id}/zap",
             json=payload.model_dump(),
         )
 
         if resp.status_code != 202:
-            logger.info(f"Failed to zap widget: {resp.status_code}: {resp.text}")
+            logger.info("Failed to zap widget: %s: %s", resp.status_code, resp.text)
             raise WidgetApiException(resp)
 
         api_task = WidgetZapTask(**resp.json())
-        logger.debug(f"Zapped widget: {api_task}")
+        logger.debug("Zapped widget: %s", api_task)
 
         return api_task
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def widget_zap_by_uuid(
@@ -165,24 +172,25 @@ class WidgetApiRepository:
         Raises:
             WidgetApiException: Raised when upstream API reports failure status code.
         """
-        logger.debug(f"Fetching zap task by UUID: {task_uuid}")
+        logger.debug("Fetching zap task by UUID: %s", task_uuid)
         resp = await self.api_client.get(
             f"/v1/widgets/{widget_id}/zap/{task_uuid}/status"
         )
 
         if resp.status_code != 200:
-            logger.info(f"Failed get task by UUID: {resp.status_code}: {resp.text}")
+            logger.info("Failed get task by UUID: %s: %s", resp.status_code, resp.text)
             raise WidgetApiException(resp)
 
         api_task = WidgetZapTask(**resp.json())
-        logger.debug(f"Zapped widget: {api_task}")
+        logger.debug("Zapped widget: %s", api_task)
 
         return api_task
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def get_all(
@@ -225,7 +233,7 @@ class WidgetApiRepository:
         )
 
         if resp.status_code != 200:
-            logger.info(f"Failed to list widgets: {resp.status_code}: {resp.text}")
+            logger.info("Failed to list widgets: %s: %s", resp.status_code, resp.text)
             raise WidgetApiException(resp)
 
         widgets = [WidgetRead(**w) for w in resp.json()]
@@ -238,14 +246,15 @@ class WidgetApiRepository:
             sort_order=sort_order,
             search=search,
         )
-        logger.debug(f"Retrieved {len(widgets)} widgets (total: {total})")
+        logger.debug("Retrieved %s widgets (total: %s)", len(widgets), total)
 
         return widgets, pagination
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def widget_update(
@@ -266,25 +275,26 @@ class WidgetApiRepository:
         Raises:
             WidgetApiException: Raised when upstream API reports failure status code.
         """
-        logger.debug(f"Updating widget ID {widget_id}")
+        logger.debug("Updating widget ID %s", widget_id)
         resp = await self.api_client.patch(
             f"/v1/widgets/{widget_id}",
             json=data.model_dump(exclude_unset=True),
         )
 
         if resp.status_code != 200:
-            logger.info(f"Failed to update widget: {resp.status_code}: {resp.text}")
+            logger.info("Failed to update widget: %s: %s", resp.status_code, resp.text)
             raise WidgetApiException(resp)
 
         updated = WidgetRead(**resp.json())
-        logger.debug(f"Updated widget: {updated}")
+        logger.debug("Updated widget: %s", updated)
 
         return updated
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def widget_delete(self, widget_id: int) -> None:
@@ -297,19 +307,20 @@ class WidgetApiRepository:
         Raises:
             WidgetApiException: Raised when upstream API reports failure status code.
         """
-        logger.debug(f"Deleting widget ID {widget_id}")
+        logger.debug("Deleting widget ID %s", widget_id)
         resp = await self.api_client.delete(f"/v1/widgets/{widget_id}")
 
         if resp.status_code != 204:
-            logger.info(f"Failed to delete widget: {resp.status_code}: {resp.text}")
+            logger.info("Failed to delete widget: %s: %s", resp.status_code, resp.text)
             raise WidgetApiException(resp)
 
-        logger.debug(f"Deleted widget ID {widget_id}")
+        logger.debug("Deleted widget ID %s", widget_id)
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def widget_bulk_delete(self, ids: list[int]) -> int:
@@ -325,7 +336,7 @@ class WidgetApiRepository:
         Raises:
             WidgetApiException: Raised when upstream API reports failure status code.
         """
-        logger.debug(f"Bulk deleting widget IDs: {ids}")
+        logger.debug("Bulk deleting widget IDs: %s", ids)
         resp = await self.api_client.post(
             "/v1/widgets/actions/bulk/delete",
             json=ids,
@@ -333,19 +344,20 @@ class WidgetApiRepository:
 
         if resp.status_code != 200:
             logger.info(
-                f"Failed to bulk delete widgets: {resp.status_code}: {resp.text}"
+                "Failed to bulk delete widgets: %s: %s", resp.status_code, resp.text
             )
             raise WidgetApiException(resp)
 
         deleted = resp.json().get("deleted", 0)
-        logger.debug(f"Bulk deleted {deleted} widgets")
+        logger.debug("Bulk deleted %s widgets", deleted)
 
         return deleted
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def widget_bulk_update(
@@ -366,7 +378,7 @@ class WidgetApiRepository:
         Raises:
             WidgetApiException: Raised when upstream API reports failure status code.
         """
-        logger.debug(f"Bulk updating widget IDs: {ids}")
+        logger.debug("Bulk updating widget IDs: %s", ids)
         resp = await self.api_client.post(
             "/v1/widgets/actions/bulk/update",
             json={"ids": ids, "updates": data.model_dump(exclude_unset=True)},
@@ -374,19 +386,20 @@ class WidgetApiRepository:
 
         if resp.status_code != 200:
             logger.info(
-                f"Failed to bulk update widgets: {resp.status_code}: {resp.text}"
+                "Failed to bulk update widgets: %s: %s", resp.status_code, resp.text
             )
             raise WidgetApiException(resp)
 
         updated = resp.json().get("updated", 0)
-        logger.debug(f"Bulk updated {updated} widgets")
+        logger.debug("Bulk updated %s widgets", updated)
 
         return updated
 
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
-        wait=wait_fixed(0.2),
+        wait=wait_random_exponential(multiplier=0.2, max=5),
+        retry=retry_if_transient_upstream_error,
         after=tenacity_retry_log(logger),
     )
     async def widget_zap_history(
@@ -416,7 +429,7 @@ class WidgetApiRepository:
         Raises:
             WidgetApiException: Raised when upstream API reports failure status code.
         """
-        logger.debug(f"Fetching zap history for widget ID {widget_id}")
+        logger.debug("Fetching zap history for widget ID %s", widget_id)
         params: dict[str, str | int] = {
             "page": page,
             "page_size": page_size,
@@ -431,7 +444,9 @@ class WidgetApiRepository:
         )
 
         if resp.status_code != 200:
-            logger.info(f"Failed to get zap history: {resp.status_code}: {resp.text}")
+            logger.info(
+                "Failed to get zap history: %s: %s", resp.status_code, resp.text
+            )
             raise WidgetApiException(resp)
 
         tasks = [WidgetZapTaskRead(**t) for t in resp.json()]
@@ -445,7 +460,10 @@ class WidgetApiRepository:
             search=search,
         )
         logger.debug(
-            f"Retrieved {len(tasks)} zap tasks for widget {widget_id} (total: {total})"
+            "Retrieved %s zap tasks for widget %s (total: %s)",
+            len(tasks),
+            widget_id,
+            total,
         )
 
         return tasks, pagination
@@ -5,9 +5,52 @@
 """Helper functions for retrying functions/code with tenacity."""
 
 import logging
+import traceback
 from typing import Callable
 
-from tenacity import Future, RetryCallState, stop_after_attempt
+import httpx
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+from tenacity import (
+    Future,
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random,
+)
+
+from nmtfast.errors.v1.exceptions import BaseUpstreamRepositoryException
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def is_transient_upstream_error(exc: BaseException) -> bool:
+    """
+    Determine if an exception from an upstream API call is worth retrying.
+
+    Transport errors (connection failures, timeouts, etc.), 5xx responses and 429
+    responses are transient. Other upstream responses (e.g. 4xx) will fail the
+    same way on every attempt, so they are not retried.
+
+    Args:
+        exc: The exception raised by the upstream call.
+
+    Returns:
+        bool: True if the call should be retried, otherwise False.
+    """
+    if isinstance(exc, httpx.TransportError):
+        return True
+
+    if isinstance(exc, BaseUpstreamRepositoryException):
+        return exc.status_code >= 500 or exc.status_code == 429
+
+    return False
+
+
+retry_if_transient_upstream_error = retry_if_exception(is_transient_upstream_error)
 
 
 def tenacity_retry_log(
@@ -25,6 +68,11 @@ def tenacity_retry_log(
         """
         Inner function to log retry message.
         """
+        # NOTE: skip walking the traceback and formatting the message entirely
+        #   when the message would be filtered out anyway
+        if not logger.isEnabledFor(log_level):
+            return
+
         if retry_state.outcome is None:
             logger.log(
                 log_level, f"Retry {retry_state.attempt_number}: outcome is None."
@@ -37,31 +85,58 @@ def tenacity_retry_log(
 
         outcome: Future = retry_state.outcome
         exc = outcome.exception()  # type: ignore[union-attr]
-        tb = exc.__traceback__  # type: ignore[union-attr]
-
-        # NOTE: if retry_state.fn is defined, then it means that a decorator
-        #   (@tenacity.retry) was used, and we should look not in the immediate
-        #   __traceback__ object (which will be tenacity code), but in the
-        #   next __traceback__ which will be the originally wrapped/decorated
-        #   function that caught the exception
-
-        if retry_state.fn is not None:
-            tb = exc.__traceback__.tb_next  # type: ignore[union-attr]
-
-        frame = tb.tb_frame  # type: ignore[union-attr]
-        lineno = tb.tb_lineno  # type: ignore[union-attr]
 
         stop_strategy = retry_state.retry_object.stop
         max_attempt_str = ""
         if isinstance(stop_strategy, stop_after_attempt):
             max_attempt_str = f" of {stop_strategy.max_attempt_number}"
 
+        if exc is None:
+            logger.log(
+                log_level,
+                f"Retry {retry_state.attempt_number}{max_attempt_str}: {outcome}",
+            )
+            return
+
+        # NOTE: if retry_state.fn is defined, then it means that a decorator
+        #   (@tenacity.retry) was used, and the wrapped function identifies the
+        #   call site directly, no matter how many frames (other decorators, etc.)
+        #   the exception passed through; without it (e.g. tenacity.Retrying),
+        #   fall back to the function that raised the exception
+
+        raised_at = traceback.extract_tb(exc.__traceback__, limit=-1)[-1]
+        code = getattr(retry_state.fn, "__code__", None)
+        if code is not None:
+            call_site = f"{code.co_filename}:{code.co_qualname}"
+        else:
+            call_site = f"{raised_at.filename}:{raised_at.name}"
+
         message = (
             f"Retry {retry_state.attempt_number}{max_attempt_str}: "
-            f"while executing {frame}, an exception occurred "
-            f"at line {lineno}: {retry_state.outcome}: "
-            f"{retry_state.outcome.exception()}"
+            f"while executing {call_site}, an exception occurred "
+            f"at line {raised_at.lineno} of {raised_at.filename}: {outcome}: {exc}"
         )
         logger.log(log_level, message)
 
     return log_attempt
+
+
+# NOTE: only connection problems are worth retrying; anything else (e.g. a
+#   serialization error or a bug) fails the same way every time
+REDIS_RETRYABLE_ERRORS: tuple[type[Exception], ...] = (
+    RedisConnectionError,
+    RedisTimeoutError,
+    ConnectionError,
+    TimeoutError,
+)
+
+# NOTE: the retry policy shared by short Redis operations (app caches, task
+#   metadata); jitter keeps workers from retrying in lockstep while Redis
+#   recovers. Retries are logged with the call site of the decorated function.
+redis_retry = retry(
+    reraise=True,
+    stop=stop_after_attempt(5),
+    wait=wait_exponential(multiplier=0.001, max=0.01) + wait_random(0, 0.005),
+    retry=retry_if_exception_type(REDIS_RETRYABLE_ERRORS),
+    after=tenacity_retry_log(logger),
+)
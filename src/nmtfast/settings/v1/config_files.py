@@ -4,34 +4,74 @@
 
 """Helper functions to load configuration files."""
 
+import copy
+import hashlib
+import json
 import logging
 import os
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
-def load_yaml(file_path: Path) -> Dict:
+def load_yaml(file_path: Path) -> dict:
     """
     Load a YAML file and return its contents as a dictionary.
 
+    Parsed contents are cached by path, modification time and size, so loading an
+    unchanged file again only costs a stat() call and a copy. Every call returns its
+    own copy, which the caller is free to modify.
+
     Args:
         file_path: The path to the YAML file.
 
     Returns:
-        Dict: The contents of the YAML file as a dictionary. Returns an empty dictionary if the file does not exist.
+        dict: The contents of the YAML file as a dictionary. Returns an empty dictionary if the file does not exist.
     """
-    if file_path.exists():
-        with open(file_path, "r") as file_reader:
-            return yaml.safe_load(file_reader) or {}
+    try:
+        stat_result = file_path.stat()
+    except FileNotFoundError:
+        return {}
+
+    return copy.deepcopy(
+        _load_yaml_cached(
+            str(file_path.resolve()), stat_result.st_mtime_ns, stat_result.st_size
+        )
+    )
+
+
+@lru_cache(maxsize=64)
+def _load_yaml_cached(file_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a YAML file; mtime_ns and size are only part of the cache key.
+
+    The result is shared by every caller with the same key, so it must not be
+    modified; load_yaml hands out copies of it.
 
-    return {}
+    Args:
+        file_path: The absolute path to the YAML file.
+        mtime_ns: The modification time of the file, in nanoseconds.
+        size: The size of the file, in bytes.
+
+    Returns:
+        dict: The contents of the YAML file as a dictionary.
+    """
+    # NOTE: libyaml (CSafeLoader) is much faster than the pure Python parser, and
+    #   it decodes bytes itself so the file does not need to be read as text
+    return yaml.load(Path(file_path).read_bytes(), Loader=_SafeLoader) or {}
 
 
-def deep_merge(dict1: Dict, dict2: Dict) -> Dict:
+def deep_merge(dict1: dict, dict2: dict) -> dict:
     """Recursively merges two dictionaries.
 
     Args:
@@ -39,56 +79,314 @@ def deep_merge(dict1: Dict, dict2: Dict) -> Dict:
         dict2: The dictionary to merge into dict1.
 
     Returns:
-        Dict: A new dictionary with dict2 merged into dict1.
+        dict: A new dictionary with dict2 merged into dict1.
     """
-    merged = dict1.copy()
+    merged: dict = {}
+    _deep_merge_inplace(merged, dict1)
+    _deep_merge_inplace(merged, dict2)
+
+    return merged
+
 
-    for key, value in dict2.items():
-        if isinstance(value, dict) and isinstance(merged.get(key), dict):
-            merged[key] = deep_merge(merged[key], value)
+def _deep_merge_inplace(dst: dict, src: dict) -> None:
+    """
+    Recursively merge src into dst, modifying dst in place.
+
+    Nested dictionaries from src are never stored in dst directly; dst gets its own
+    copies, so later merges into dst cannot modify src (e.g. cached YAML contents).
+
+    Args:
+        dst: The dictionary to merge into.
+        src: The dictionary to merge from; it is not modified.
+    """
+    for key, value in src.items():
+        if isinstance(value, dict):
+            if not isinstance(dst.get(key), dict):
+                dst[key] = {}
+            _deep_merge_inplace(dst[key], value)
         else:
-            merged[key] = value
+            dst[key] = value
 
-    return merged
+
+def _config_fingerprint(config_files: list[str]) -> str:
+    """
+    Compute a fingerprint of a list of configuration files.
+
+    The fingerprint changes whenever a file is created, removed or modified.
+
+    Args:
+        config_files: List of file paths to fingerprint.
+
+    Returns:
+        str: A hex digest identifying the current state of the files.
+    """
+    parts: list[str] = []
+
+    for file in config_files:
+        try:
+            stat_result = os.stat(file)
+            parts.append(f"{file}:{stat_result.st_mtime_ns}:{stat_result.st_size}")
+        except FileNotFoundError:
+            parts.append(f"{file}:-")
+
+    return hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def _read_config_cache(cache_file: Path, fingerprint: str) -> Optional[dict]:
+    """
+    Read a merged configuration from a cache file, if it matches the fingerprint.
+
+    Args:
+        cache_file: The path to the cache file.
+        fingerprint: The fingerprint of the configuration files.
+
+    Returns:
+        Optional[dict]: The cached configuration, or None if it is missing or stale.
+    """
+    try:
+        header, _, body = cache_file.read_text().partition("\n")
+    except OSError:
+        return None
+
+    if header != f"# fp={fingerprint}":
+        return None
+
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
 
 
-def load_config(config_files: List[str]) -> Dict:
+def _write_config_cache(cache_file: Path, fingerprint: str, config: dict) -> None:
+    """
+    Atomically write a merged configuration to a cache file.
+
+    Nothing is written if the configuration cannot be represented exactly as JSON
+    (for example, if it contains dates or non-string keys).
+
+    Args:
+        cache_file: The path to the cache file.
+        fingerprint: The fingerprint of the configuration files.
+        config: The merged configuration dictionary.
+    """
+    try:
+        body = json.dumps(config, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return
+
+    if json.loads(body) != config:
+        return
+
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        tmp_file.write_text(f"# fp={fingerprint}\n{body}")
+        os.replace(tmp_file, cache_file)
+    except OSError as exc:
+        logger.warning("Unable to write config cache %s: %s", cache_file, exc)
+        tmp_file.unlink(missing_ok=True)
+
+
+def load_config(config_files: list[str]) -> dict:
     """
     Loads configuration from a list of YAML files in the given order.
 
+    If APP_CONFIG_CACHE is set, the merged configuration is also written to that
+    file as JSON, and later calls load it from there until any of the configuration
+    files change.
+
     Args:
         config_files: List of file paths to load and merge.
 
     Returns:
-        Dict: The merged configuration dictionary.
+        dict: The merged configuration dictionary.
     """
-    config: Dict = {}
+    cache_file: Optional[Path] = None
+    fingerprint: str = ""
 
-    for file in config_files:
-        print(f"Looking for config file: {Path(file)} ...")
-        if Path(file).exists():
-            print(f"Loading config file: {Path(file)}")
-        config = deep_merge(config, load_yaml(Path(file)))
+    if app_config_cache := os.getenv("APP_CONFIG_CACHE"):
+        cache_file = Path(app_config_cache)
+        fingerprint = _config_fingerprint(config_files)
+        if (cached_config := _read_config_cache(cache_file, fingerprint)) is not None:
+            logger.info("Loading cached config: %s", cache_file)
+            return cached_config
+
+    config = load_config_lazy(config_files).materialize()
+
+    if cache_file is not None:
+        _write_config_cache(cache_file, fingerprint, config)
 
     return config
 
 
-def get_config_files() -> List[str]:
+class LazyConfig(Mapping):
+    """
+    Read-only view of merged configuration files that parses files on demand.
+
+    Looking up a top-level key only parses files from the highest precedence (last)
+    down to the first one that sets the key to a non-dictionary value; dictionary
+    values are deep merged like load_config does.
+
+    Args:
+        config_files: List of file paths, in the order they should be merged.
+    """
+
+    def __init__(self, config_files: list[str]) -> None:
+        self._paths: list[Path] = []
+        self._loaded: dict[int, dict] = {}
+        self._values: dict[Any, Any] = {}
+
+        for file in config_files:
+            logger.debug("Looking for config file: %s ...", file)
+            if os.path.isfile(file):
+                self._paths.append(Path(file))
+
+    def _load(self, index: int) -> dict:
+        """
+        Parse one of the configuration files, once.
+
+        Args:
+            index: The position of the file in the list of existing files.
+
+        Returns:
+            dict: The contents of the file; must not be modified.
+        """
+        if index not in self._loaded:
+            logger.info("Loading config file: %s", self._paths[index])
+            self._loaded[index] = load_yaml(self._paths[index])
+
+        return self._loaded[index]
+
+    def __getitem__(self, key: Any) -> Any:
+        """
+        Return the merged value of a top-level key.
+
+        Args:
+            key: The top-level configuration key.
+
+        Returns:
+            Any: The merged value.
+
+        Raises:
+            KeyError: If no configuration file sets the key.
+        """
+        if key in self._values:
+            return self._values[key]
+
+        overrides: list[dict] = []
+        for index in reversed(range(len(self._paths))):
+            contents = self._load(index)
+            if key not in contents:
+                continue
+
+            value = contents[key]
+            if not isinstance(value, dict):
+                if not overrides:
+                    self._values[key] = value
+                    return value
+                break
+            overrides.append(value)
+
+        if not overrides:
+            raise KeyError(key)
+
+        merged: dict = {}
+        for override in reversed(overrides):
+            _deep_merge_inplace(merged, override)
+
+        self._values[key] = merged
+        return merged
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over the top-level keys of all configuration files.
+
+        Returns:
+            Iterator[Any]: The top-level keys, in first-seen order.
+        """
+        keys: dict[Any, None] = {}
+        for index in range(len(self._paths)):
+            keys.update(dict.fromkeys(self._load(index)))
+
+        return iter(keys)
+
+    def __len__(self) -> int:
+        """
+        Return the number of top-level keys across all configuration files.
+
+        Returns:
+            int: The number of distinct top-level keys.
+        """
+        return sum(1 for _ in self)
+
+    def materialize(self) -> dict:
+        """
+        Parse all configuration files and return the fully merged configuration.
+
+        Returns:
+            dict: The merged configuration dictionary.
+        """
+        config: dict = {}
+        for index in range(len(self._paths)):
+            _deep_merge_inplace(config, self._load(index))
+
+        return config
+
+
+def load_config_lazy(config_files: list[str]) -> LazyConfig:
+    """
+    Return a lazy view of configuration files, parsing each only when needed.
+
+    Args:
+        config_files: List of file paths to load and merge.
+
+    Returns:
+        LazyConfig: A read-only mapping of the merged configuration.
+    """
+    return LazyConfig(config_files)
+
+
+# NOTE: cwd might be in the src directory of the app or one directory "up", and we can
+#   try some sensible defaults in case APP_CONFIG_FILES is not defined.
+_DEFAULT_CONFIG_PATHS: tuple[str, ...] = (
+    "./src/nmtfast-config-default.yaml",
+    "./nmtfast-config-default.yaml",
+    "./conf/nmtfast-config.yaml",
+    "./nmtfast-config.yaml",
+    "../nmtfast-config.yaml",
+)
+
+
+def get_config_files() -> list[str]:
     """
     Determines the list of configuration files to load, prioritizing APP_CONFIG_FILES.
 
+    The result is computed once; call clear_config_files_cache() after changing
+    APP_CONFIG_FILES. Every call returns a new list.
+
+    Returns:
+        list[str]: A list of configuration file paths in the order they should be merged.
+    """
+    return list(_get_config_files_cached())
+
+
+@lru_cache(maxsize=1)
+def _get_config_files_cached() -> tuple[str, ...]:
+    """
+    Determine the configuration files to load once (see get_config_files).
+
     Returns:
-        List[str]: A list of configuration file paths in the order they should be merged.
+        tuple[str, ...]: Configuration file paths in the order they should be merged.
     """
     if app_config_files := os.getenv("APP_CONFIG_FILES"):
-        return app_config_files.split(",")
-
-    # NOTE: cwd might be in the src directory of the app or one directory "up", and we can
-    #   try some sensible defaults in case APP_CONFIG_FILES is not defined.
-    return [
-        "./src/nmtfast-config-default.yaml",
-        "./nmtfast-config-default.yaml",
-        "./conf/nmtfast-config.yaml",
-        "./nmtfast-config.yaml",
-        "../nmtfast-config.yaml",
-    ]
+        return tuple(app_config_files.split(","))
+
+    return _DEFAULT_CONFIG_PATHS
+
+
+def clear_config_files_cache() -> None:
+    """
+    Forget the configuration files determined by get_config_files.
+
+    The next call to get_config_files reads APP_CONFIG_FILES again.
+    """
+    _get_config_files_cached.cache_clear()
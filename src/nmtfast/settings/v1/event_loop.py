@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""Helpers for configuring the asyncio event loop used by nmtfast apps."""
+
+import asyncio
+import importlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop for new asyncio event loops, if uvloop is installed.
+
+    uvloop is an optional dependency which is not installed with nmtfast. This must
+    be called at application entry, before the event loop is created (i.e. before
+    starting the ASGI server); calling it from a lifespan hook is too late, since the
+    running loop has already been created by then. Servers like uvicorn already pick
+    uvloop when it is installed and --loop is left at "auto".
+
+    Returns:
+        bool: True if the uvloop event loop policy was installed, otherwise False.
+    """
+    try:
+        uvloop = importlib.import_module("uvloop")
+    except ImportError:
+        logger.debug("uvloop is not installed, using the default asyncio event loop")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Installed the uvloop event loop policy")
+
+    return True
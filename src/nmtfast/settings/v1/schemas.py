@@ -4,9 +4,94 @@
 
 """pydantic-settings schemas that can be re-used in nmtfast-derived apps."""
 
-from typing import Literal, Optional
+import re
+from collections.abc import Mapping
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
+
+
+@lru_cache(maxsize=1024)
+def _compile_regex(pattern: str) -> re.Pattern[str]:
+    """
+    Compile a regex pattern once and reuse it across model instances.
+
+    Args:
+        pattern: The regex pattern to compile.
+
+    Returns:
+        re.Pattern[str]: The compiled pattern.
+    """
+    return re.compile(pattern)
+
+
+_REGEX_METACHARS: frozenset[str] = frozenset("^$.*+?()[]{}|\\")
+
+
+@lru_cache(maxsize=1024)
+def _build_section_matcher(pattern: str) -> Callable[[str], bool]:
+    """
+    Build a callable equivalent to re.match(pattern, section) for a section regex.
+
+    Most section regexes are plain names or anchored names, which can be matched with
+    string operations instead of the regex engine. Since re.match only anchors at the
+    start, a literal (optionally prefixed with "^") is a startswith check, and a
+    literal terminated with "$" is an exact match. Anything else falls back to the
+    compiled regex.
+
+    Args:
+        pattern: The section regex to build a matcher for.
+
+    Returns:
+        Callable[[str], bool]: A function returning True if the section matches.
+    """
+    literal = pattern[1:] if pattern.startswith("^") else pattern
+    exact = literal.endswith("$")
+    if exact:
+        literal = literal[:-1]
+
+    if _REGEX_METACHARS.isdisjoint(literal):
+        if exact:
+            # NOTE: "$" also matches just before a trailing newline
+            accepted = (literal, literal + "\n")
+            return lambda section: section in accepted
+        return lambda section: section.startswith(literal)
+
+    compiled = _compile_regex(pattern)
+    return lambda section: compiled.match(section) is not None
+
+
+def _literal_issuers(pattern: str) -> tuple[str, ...]:
+    """
+    Return the exact issuers an anchored issuer regex is known to accept.
+
+    Issuer regexes are usually anchored URLs such as "^https://idp.example.com/?$".
+    For those, the literal URL (with and without the optional trailing slash) can be
+    looked up in a dict instead of running every provider's regex. The candidates
+    are checked against the compiled regex, so an unescaped "." is harmless.
+
+    Args:
+        pattern: The issuer regex.
+
+    Returns:
+        tuple[str, ...]: Issuers matched by the regex, or () if it is not a literal.
+    """
+    if not (pattern.startswith("^") and pattern.endswith("$")):
+        return ()
+
+    body = pattern[1:-1]
+    optional_slash = body.endswith("/?")
+    if optional_slash:
+        body = body[:-2]
+
+    literal = body.replace("\\.", ".")
+    if not _REGEX_METACHARS.isdisjoint(literal.replace(".", "")):
+        return ()
+
+    candidates = (literal, literal + "/") if optional_slash else (literal,)
+    compiled = _compile_regex(pattern)
+    return tuple(issuer for issuer in candidates if compiled.search(issuer))
 
 
 class IDProvider(BaseModel):
@@ -24,6 +109,8 @@ class IDProvider(BaseModel):
         keyid_enabled: Whether key ID verification is enabled.
         keyid_endpoint: URL for key ID verification endpoint.
         groups_claim: JWT claim name containing group memberships.
+        claims_cache_enabled: Whether verified JWT claims may be cached briefly, so
+            a token sent again is not verified again.
     """
 
     type: str = "jwks"
@@ -36,6 +123,63 @@ class IDProvider(BaseModel):
     keyid_enabled: bool = False
     keyid_endpoint: str = "http://localhost/keyid"
     groups_claim: str = "groups"
+    claims_cache_enabled: bool = True
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> "IDProvider":
+        """
+        Copy the provider, dropping the issuer values derived for the original.
+
+        Args:
+            update: Values to change or add in the new model.
+            deep: Whether to make a deep copy of the model.
+
+        Returns:
+            IDProvider: The copied provider.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        copied._drop_derived_values()
+        return copied
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Set a field, dropping the issuer values derived from it if it is issuer_regex.
+
+        Args:
+            name: The name of the attribute.
+            value: The new value of the attribute.
+        """
+        super().__setattr__(name, value)
+        if name == "issuer_regex":
+            self._drop_derived_values()
+
+    def _drop_derived_values(self) -> None:
+        """
+        Drop the cached values derived from issuer_regex.
+        """
+        for name in ("issuer_pattern", "literal_issuers"):
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def issuer_pattern(self) -> re.Pattern[str]:
+        """
+        Compiled form of issuer_regex, resolved once per provider.
+
+        Returns:
+            re.Pattern[str]: The compiled issuer regex.
+        """
+        return _compile_regex(self.issuer_regex)
+
+    @cached_property
+    def literal_issuers(self) -> tuple[str, ...]:
+        """
+        Exact issuers accepted by issuer_regex, if it is an anchored literal.
+
+        Returns:
+            tuple[str, ...]: Issuers matched by the regex, or () if it is not a literal.
+        """
+        return _literal_issuers(self.issuer_regex)
 
 
 # TODO: add support for filters later
@@ -69,6 +213,89 @@ class SectionACL(BaseModel):
     # TODO: add support for filters later
     # filters: list[FilterACL] = []
 
+    @cached_property
+    def permission_set(self) -> frozenset[str]:
+        """
+        Permissions as a frozenset, for constant-time membership checks.
+
+        Returns:
+            frozenset[str]: The granted permissions.
+        """
+        return frozenset(self.permissions)
+
+    @cached_property
+    def allow_all(self) -> bool:
+        """
+        Whether the "*" wildcard grants every permission.
+
+        Returns:
+            bool: True if "*" is one of the granted permissions.
+        """
+        return "*" in self.permission_set
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> "SectionACL":
+        """
+        Copy the ACL, dropping cached values derived from the original fields.
+
+        Args:
+            update: Values to change or add in the new model.
+            deep: Whether to make a deep copy of the model.
+
+        Returns:
+            SectionACL: The copied ACL.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        copied._drop_derived_values()
+        return copied
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Set a field, dropping cached values derived from it.
+
+        Args:
+            name: The name of the attribute.
+            value: The new value of the attribute.
+        """
+        super().__setattr__(name, value)
+        if name in ("section_regex", "permissions"):
+            self._drop_derived_values()
+
+    def _drop_derived_values(self) -> None:
+        """
+        Drop the cached values derived from section_regex and permissions.
+        """
+        for name in (
+            "permission_set",
+            "allow_all",
+            "section_pattern",
+            "section_matcher",
+        ):
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def section_pattern(self) -> re.Pattern[str]:
+        """
+        Compiled form of section_regex, cached per distinct pattern.
+
+        Returns:
+            re.Pattern[str]: The compiled section regex.
+        """
+        return _compile_regex(self.section_regex)
+
+    @cached_property
+    def section_matcher(self) -> Callable[[str], bool]:
+        """
+        Matcher for section_regex that avoids the regex engine for literal patterns.
+
+        Resolved once per ACL, so checking an ACL is a single call.
+
+        Returns:
+            Callable[[str], bool]: A function returning True if a section matches.
+        """
+        return _build_section_matcher(self.section_regex)
+
 
 class IncomingAuthClient(BaseModel):
     """
@@ -96,8 +323,11 @@ class IncomingAuthApiKey(BaseModel):
     Attributes:
         contact: Contact information for the API key holder.
         memo: Additional notes about the API key.
-        algo: Hashing algorithm used.
+        algo: Hashing algorithm used ("argon2" or "hmac-sha256").
         hash: Hashed API key value.
+        fingerprint: Optional HMAC-SHA256 fingerprint of the API key, used to find
+            the matching key without verifying every hash (see
+            nmtfast.auth.v1.api_keys.api_key_fingerprint).
         acls: List of section access control rules.
     """
 
@@ -105,6 +335,7 @@ class IncomingAuthApiKey(BaseModel):
     memo: str = ""
     algo: str = "argon2"
     hash: str = ""
+    fingerprint: Optional[str] = None
     acls: list[SectionACL]
 
 
@@ -159,12 +390,98 @@ class IncomingAuthSettings(BaseModel):
         api_keys: Dictionary of API key configurations.
         users: Dictionary of static user configurations.
         groups: Dictionary of static group configurations.
+        api_key_fingerprint_secret: Secret used to compute API key fingerprints
+            and "hmac-sha256" API key hashes.
     """
 
     clients: dict[str, IncomingAuthClient] = {}
     api_keys: dict[str, IncomingAuthApiKey] = {}
     users: dict[str, IncomingAuthUser] = {}
     groups: dict[str, IncomingAuthGroup] = {}
+    api_key_fingerprint_secret: str = ""
+
+    _api_keys_by_fingerprint: dict[str, str] = PrivateAttr(default_factory=dict)
+    _indexed_api_keys: Optional[dict[str, IncomingAuthApiKey]] = PrivateAttr(
+        default=None
+    )
+    _client_claims_index: dict[
+        str, dict[tuple[str, ...], dict[tuple[str, ...], tuple[int, str]]]
+    ] = PrivateAttr(default_factory=dict)
+    _indexed_clients: Optional[dict[str, IncomingAuthClient]] = PrivateAttr(
+        default=None
+    )
+
+    def model_post_init(self, context: object, /) -> None:
+        """
+        Index API keys by fingerprint and clients by claims once settings are loaded.
+
+        Args:
+            context: The pydantic validation context (unused).
+        """
+        self._index_api_keys()
+        self._index_clients()
+
+    def _index_api_keys(self) -> None:
+        """
+        Rebuild the mapping of API key fingerprints to API key names.
+        """
+        self._api_keys_by_fingerprint = {
+            key_conf.fingerprint: keyname
+            for keyname, key_conf in self.api_keys.items()
+            if key_conf.fingerprint
+        }
+        self._indexed_api_keys = self.api_keys
+
+    @property
+    def api_keys_by_fingerprint(self) -> dict[str, str]:
+        """
+        Mapping of API key fingerprints to API key names.
+
+        The mapping is rebuilt when api_keys is replaced (e.g. by assignment or
+        model_copy). Keys changed in place are not reflected, so callers must check
+        that an indexed key still has the fingerprint it was looked up by.
+
+        Returns:
+            dict[str, str]: API key names keyed by their configured fingerprint.
+        """
+        if self._indexed_api_keys is not self.api_keys:
+            self._index_api_keys()
+        return self._api_keys_by_fingerprint
+
+    def _index_clients(self) -> None:
+        """
+        Rebuild the index of clients by provider and required claims.
+        """
+        self._client_claims_index = {}
+        for position, (keyname, client_conf) in enumerate(self.clients.items()):
+            claim_names = tuple(sorted(client_conf.claims))
+            claim_values = tuple(client_conf.claims[name] for name in claim_names)
+            by_values = self._client_claims_index.setdefault(
+                client_conf.provider, {}
+            ).setdefault(claim_names, {})
+            # NOTE: keep the first client when several have identical claims
+            by_values.setdefault(claim_values, (position, keyname))
+        self._indexed_clients = self.clients
+
+    @property
+    def client_claims_index(
+        self,
+    ) -> dict[str, dict[tuple[str, ...], dict[tuple[str, ...], tuple[int, str]]]]:
+        """
+        Index of clients by provider, required claim names and required claim values.
+
+        Each entry maps provider -> sorted claim names -> claim values to a
+        (position, client name) tuple, where position is the order the client was
+        configured in. The index is rebuilt when clients is replaced (e.g. by
+        assignment or model_copy), but not when it is changed in place.
+
+        Returns:
+            dict[str, dict[tuple[str, ...], dict[tuple[str, ...], tuple[int, str]]]]:
+                The nested client claims index.
+        """
+        if self._indexed_clients is not self.clients:
+            self._index_clients()
+        return self._client_claims_index
 
 
 class OutgoingAuthClient(BaseModel):
@@ -303,6 +620,50 @@ class AuthSettings(BaseModel):
     web_auth: Optional[WebAuthClientSettings] = None
     session: Optional[SessionSettings] = None
 
+    _issuer_index: dict[str, tuple[int, str]] = PrivateAttr(default_factory=dict)
+    _indexed_id_providers: Optional[dict[str, IDProvider]] = PrivateAttr(default=None)
+    _indexed_id_providers_count: int = PrivateAttr(default=0)
+
+    def model_post_init(self, context: object, /) -> None:
+        """
+        Index ID providers by the exact issuers their regexes accept.
+
+        Args:
+            context: The pydantic validation context (unused).
+        """
+        self._index_issuers()
+
+    def _index_issuers(self) -> None:
+        """
+        Rebuild the mapping of exact issuers to ID providers.
+        """
+        self._issuer_index = {}
+        for position, (idp, idp_conf) in enumerate(self.id_providers.items()):
+            for issuer in idp_conf.literal_issuers:
+                # NOTE: later providers win, like a scan of every provider would
+                self._issuer_index[issuer] = (position, idp)
+        self._indexed_id_providers = self.id_providers
+        self._indexed_id_providers_count = len(self.id_providers)
+
+    @property
+    def issuer_index(self) -> dict[str, tuple[int, str]]:
+        """
+        Mapping of exact issuers to the last ID provider whose regex accepts them.
+
+        The mapping is rebuilt when id_providers is replaced (e.g. by assignment or
+        model_copy) or when providers are added or removed. Providers changed in
+        place are not reflected, so callers must check that the issuer is still one
+        of the indexed provider's literal_issuers.
+
+        Returns:
+            dict[str, tuple[int, str]]: (position, provider name) keyed by issuer.
+        """
+        if self._indexed_id_providers is not self.id_providers or (
+            self._indexed_id_providers_count != len(self.id_providers)
+        ):
+            self._index_issuers()
+        return self._issuer_index
+
 
 class DiscoveredService(BaseModel):
     """
@@ -320,6 +681,12 @@ class DiscoveredService(BaseModel):
         scope: Scope that should be included when requesting an access token.
         timeout: Timeout for reads/writes to this service, in seconds.
         connect_timeout: Timeout for opening connections to this service, in seconds.
+        read_timeout: Timeout for reading a response chunk, in seconds. Inherits
+            timeout if not set.
+        write_timeout: Timeout for writing a request chunk, in seconds. Inherits
+            timeout if not set.
+        pool_timeout: Timeout for acquiring a connection from the pool, in seconds.
+            Inherits timeout if not set.
         retries: Number of retries for failed requests to this service.
     """
 
@@ -330,6 +697,9 @@ class DiscoveredService(BaseModel):
     scope: Optional[str] = None
     timeout: float = 10.0
     connect_timeout: float = 5.0
+    read_timeout: Optional[float] = None
+    write_timeout: Optional[float] = None
+    pool_timeout: Optional[float] = None
     retries: int = 3
 
 
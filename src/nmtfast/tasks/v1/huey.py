@@ -5,23 +5,47 @@
 """Helper functions for Huey async tasks and metadata."""
 
 import logging
+from functools import lru_cache
 
 from huey import Huey
 from huey.exceptions import TaskException
-from huey.storage import RedisStorage
-from tenacity import retry, stop_after_attempt, wait_fixed
+from huey.storage import RedisExpireStorage, RedisStorage
 
-from nmtfast.retry.v1.tenacity import tenacity_retry_log
+from nmtfast.retry.v1.tenacity import redis_retry
 
 logger = logging.getLogger(__name__)
 
+METADATA_KEY_PREFIX = "md_"
 
-@retry(
-    reraise=True,
-    stop=stop_after_attempt(5),
-    wait=wait_fixed(0.001),
-    after=tenacity_retry_log(logger),
-)
+
+def _metadata_key(uuid: str) -> str:
+    """
+    Return the Huey storage key holding the metadata of a task.
+
+    Args:
+        uuid: The UUID of the task.
+
+    Returns:
+        str: The metadata key.
+    """
+    return METADATA_KEY_PREFIX + uuid
+
+
+@lru_cache(maxsize=32)
+def _redis_key_prefix(app_name: str) -> str:
+    """
+    Return the prefix of per-key Redis entries for a Huey app.
+
+    Args:
+        app_name: The (cleaned) name of the Huey storage.
+
+    Returns:
+        str: The Redis key prefix.
+    """
+    return f"huey.r.{app_name}."
+
+
+@redis_retry
 def store_task_metadata(
     huey_app: Huey,
     uuid: str,
@@ -31,59 +55,65 @@ def store_task_metadata(
     """
     Store/replace async metadata for given UUID.
     """
-    logger.debug(f"Updating metadata for task {uuid} (TTL: {ttl}) ...")
-    md_key = f"md_{uuid}"
+    logger.debug("Updating metadata for task %s (TTL: %s) ...", uuid, ttl)
+    md_key = _metadata_key(uuid)
+    storage = huey_app.storage
+
+    # NOTE: RedisExpireStorage only expires task results, not other data, so the
+    #   TTL is set in the same SET command instead of a separate EXPIRE round-trip
+    if isinstance(storage, RedisExpireStorage):
+        if ttl <= 0:
+            # NOTE: Redis rejects a SET with a non-positive EX; the EXPIRE it
+            #   replaces would have deleted the key instead, so do just that
+            storage.conn.delete(storage.result_key(md_key))
+            return True
+
+        storage.conn.set(
+            storage.result_key(md_key),
+            huey_app.serializer.serialize(metadata),
+            ex=ttl,
+        )
+        return True
 
     huey_app.put(md_key, metadata)
 
-    # NOTE: even when using RedisExpireStorage, we have to manually set a TTL
-    if isinstance(huey_app.storage, RedisStorage):
-        app_name = huey_app.storage.name
-        redis_key = f"huey.r.{app_name}.{md_key}"
-        huey_app.storage.conn.expire(redis_key, ttl)
+    if isinstance(storage, RedisStorage):
+        redis_key = _redis_key_prefix(storage.name) + md_key
+        storage.conn.expire(redis_key, ttl)
 
     return True
 
 
-@retry(
-    reraise=True,
-    stop=stop_after_attempt(5),
-    wait=wait_fixed(0.001),
-    after=tenacity_retry_log(logger),
-)
+@redis_retry
 def fetch_task_metadata(huey_app: Huey, uuid: str) -> dict | None:
     """
     Return long_async_task metadata.
     """
-    logger.debug(f"Fetching metadata for task {uuid} ...")
-    md_key = f"md_{uuid}"
+    logger.debug("Fetching metadata for task %s ...", uuid)
+    md_key = _metadata_key(uuid)
 
     meta_d: dict | None = huey_app.get(key=md_key, peek=True)
     if not meta_d:
-        logger.warning(f"No metadata found for key {md_key}")
+        logger.warning("No metadata found for key %s", md_key)
 
     return meta_d
 
 
-@retry(
-    reraise=True,
-    stop=stop_after_attempt(5),
-    wait=wait_fixed(0.001),
-    after=tenacity_retry_log(logger),
-)
+@redis_retry
 def fetch_task_result(huey_app: Huey, uuid: str) -> dict | None:
     """
     Return a long_async_task by UUID.
     """
-    logger.debug(f"Fetching result for task {uuid} ...")
+    logger.debug("Fetching result for task %s ...", uuid)
 
     try:
         result_d = huey_app.result(uuid, preserve=True)
     except TaskException:
         result_d = fetch_task_metadata(huey_app, uuid)
         logger.warning(
-            f"Result for task {uuid} is an exception! "
-            f"Returning metadata instead: {result_d}"
+            "Result for task %s is an exception! Returning metadata instead: %s",
+            uuid,
+            result_d,
         )
 
     # NOTE: huey_app.result() does not have stubs, so it is implicitly Any
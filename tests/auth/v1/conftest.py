@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""pytest fixtures for unit / integration tests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from nmtfast.settings.v1.schemas import AuthSettings, IDProvider, IncomingAuthSettings
+
+
+@pytest.fixture(scope="session")
+def base_auth_settings() -> AuthSettings:
+    """
+    Fixture providing AuthSettings with a single JWKS provider and no clients.
+
+    Tests should derive their own settings with model_copy(update=...) rather than
+    modifying this instance, since it is shared across the session.
+    """
+    return AuthSettings(
+        swagger_token_url="https://swagger.example.com/token",
+        id_providers={
+            "test-idp": IDProvider(
+                type="jwks",
+                issuer_regex=r"^https://example.com/?$",
+                jwks_endpoint="https://example.com/jwks",
+            )
+        },
+        incoming=IncomingAuthSettings(clients={}, api_keys={}),
+    )
+
+
+@pytest.fixture
+def patched_jwks(mocker: MockerFixture) -> MagicMock:
+    """
+    Fixture patching PyJWKClient so that every client returns a test signing key.
+    """
+    mock_jwks_client = mocker.patch("nmtfast.auth.v1.jwt.PyJWKClient")
+    mock_key = MagicMock()
+    mock_key.key = "test-key"
+    mock_jwks_client.return_value.get_signing_key_from_jwt.return_value = mock_key
+    return mock_jwks_client
+
+
+@pytest.fixture
+def patched_jwt_decode(mocker: MockerFixture) -> MagicMock:
+    """
+    Fixture patching jwt.decode; tests set return_value or side_effect as needed.
+    """
+    return mocker.patch("nmtfast.auth.v1.jwt.jwt.decode")
@@ -4,7 +4,9 @@
 
 """Unit tests for auth functions."""
 
+import inspect
 import json
+import re
 
 import pytest
 
@@ -132,6 +134,89 @@ async def test_check_acl_tries_all_acls_raises_when_none_match():
         await check_acl(section="widgets", acls=acls, method="delete")
 
 
+def test_section_pattern_is_shared_and_follows_updates():
+    """
+    Tests that SectionACL.section_pattern reuses one compiled pattern per regex.
+
+    Ensures ACLs with the same regex share a compiled pattern, and that copies
+    with an updated section_regex do not keep a stale pattern.
+    """
+    acl_a = SectionACL(section_regex="^widgets$", permissions=["read"])
+    acl_b = SectionACL(section_regex="^widgets$", permissions=["write"])
+    assert acl_a.section_pattern is acl_b.section_pattern
+
+    updated = acl_a.model_copy(update={"section_regex": "^gadgets$"})
+    assert updated.section_pattern.match("gadgets")
+    assert not updated.section_pattern.match("widgets")
+
+
+def test_section_matcher_is_cached_and_follows_assignment():
+    """
+    Tests that SectionACL.section_matcher is built once and reset on assignment.
+    """
+    acl = SectionACL(section_regex="^widgets$", permissions=["read"])
+    assert acl.section_matcher is acl.section_matcher
+    assert acl.section_matcher("widgets")
+
+    acl.section_regex = "^gadgets$"
+    assert acl.section_matcher("gadgets")
+    assert not acl.section_matcher("widgets")
+    assert acl.section_pattern.pattern == "^gadgets$"
+
+    acl.permissions = ["write"]
+    assert acl.permission_set == frozenset({"write"})
+    assert not acl.allow_all
+
+    acl.permissions = ["write", "*"]
+    assert acl.allow_all
+
+
+@pytest.mark.parametrize(
+    "section_regex",
+    ["widgets", "^widgets", "^widgets$", "widgets$", "^widget.*$", "wid|gad", ""],
+)
+@pytest.mark.parametrize(
+    "section",
+    ["widgets", "widgets2", "widgets\n", "gadgets", "widget", ""],
+)
+def test_section_matcher_equivalent_to_re_match(section_regex, section):
+    """
+    Tests that SectionACL.section_matcher agrees with re.match for all pattern kinds.
+
+    Literal, prefix, exact and regex patterns must all produce the same result as
+    calling re.match(section_regex, section) directly.
+    """
+    acl = SectionACL(section_regex=section_regex, permissions=["read"])
+    expected = re.match(section_regex, section) is not None
+    assert acl.section_matcher(section) is expected
+
+
+def test_permission_set_follows_model_copy_updates():
+    """
+    Tests that SectionACL.permission_set is not carried over stale by model_copy.
+    """
+    acl = SectionACL(section_regex="widgets", permissions=["read"])
+    assert acl.permission_set == frozenset({"read"})
+
+    stamped = acl.model_copy(update={"principal_name": "client"})
+    assert stamped.permission_set == frozenset({"read"})
+
+    updated = acl.model_copy(update={"permissions": ["read", "write"]})
+    assert updated.permission_set == frozenset({"read", "write"})
+    assert acl.permission_set == frozenset({"read"})
+
+
+def test_check_acl_signature_keeps_raise_on_failure():
+    """
+    Tests that the canonical check_acl keeps its raise_on_failure parameter.
+
+    Guards against a second, simpler check_acl definition shadowing this one.
+    """
+    parameters = inspect.signature(check_acl).parameters
+
+    assert parameters["raise_on_failure"].default is True
+
+
 # Placeholders for future filter tests
 
 
@@ -171,3 +256,13 @@ def test_model_json_serialization():
     assert parsed["name"] == "test-client"
     assert parsed["acls"][0]["section_regex"] == ".*"
     assert parsed["acls"][0]["permissions"] == ["read"]
+
+
+def test_section_acl_ignores_unknown_keys():
+    """
+    Tests that unknown SectionACL keys are ignored, so existing configs keep loading.
+    """
+    acl = SectionACL(section_regex="widgets", permissions=["read"], memos="typo")
+
+    assert acl.memo is None
+    assert not hasattr(acl, "memos")
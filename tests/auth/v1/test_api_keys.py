@@ -4,11 +4,17 @@
 
 """Unit tests for API keys functions."""
 
+from unittest.mock import patch
+
 import pytest
 from argon2 import PasswordHasher
 
 from nmtfast.auth.v1.acl import AuthSuccess
-from nmtfast.auth.v1.api_keys import authenticate_api_key, verify_api_key
+from nmtfast.auth.v1.api_keys import (
+    api_key_fingerprint,
+    authenticate_api_key,
+    verify_api_key,
+)
 from nmtfast.auth.v1.exceptions import AuthenticationError, AuthorizationError
 from nmtfast.settings.v1.schemas import (
     AuthSettings,
@@ -19,6 +25,10 @@ from nmtfast.settings.v1.schemas import (
 
 ph = PasswordHasher()
 
+# NOTE: argon2 is deliberately slow, so hash the test keys once per module
+TEST_API_KEY_HASH = ph.hash("test_api_key")
+WRONG_API_KEY_HASH = ph.hash("wrong_api_key")
+
 
 @pytest.mark.asyncio
 async def test_verify_api_key_correct():
@@ -28,7 +38,7 @@ async def test_verify_api_key_correct():
     Verifies that the function returns True when the provided API key matches the stored hash.
     """
     api_key = "test_api_key"
-    hashed_key = ph.hash(api_key)
+    hashed_key = TEST_API_KEY_HASH
     result = await verify_api_key(algo="argon2", api_key=api_key, hashed_key=hashed_key)
 
     assert result is True
@@ -42,12 +52,65 @@ async def test_verify_api_key_incorrect():
     Verifies that the function returns False when the provided API key does not match the stored hash.
     """
     api_key = "test_api_key"
-    hashed_key = ph.hash("wrong_api_key")
+    hashed_key = WRONG_API_KEY_HASH
     result = await verify_api_key(algo="argon2", api_key=api_key, hashed_key=hashed_key)
 
     assert result is False
 
 
+@pytest.mark.asyncio
+async def test_verify_api_key_hmac_sha256():
+    """
+    Tests verify_api_key with the hmac-sha256 algorithm.
+
+    Verifies that the key matches only with the right secret and key.
+    """
+    hashed_key = api_key_fingerprint("test_api_key", "secret")
+
+    assert await verify_api_key("hmac-sha256", "test_api_key", hashed_key, "secret")
+    assert not await verify_api_key("hmac-sha256", "wrong_key", hashed_key, "secret")
+    assert not await verify_api_key("hmac-sha256", "test_api_key", hashed_key, "x")
+
+
+@pytest.mark.asyncio
+async def test_verify_api_key_hmac_sha256_requires_secret():
+    """
+    Tests verify_api_key rejects hmac-sha256 without a secret.
+
+    An HMAC with an empty key would just be an unkeyed hash of the API key.
+    """
+    hashed_key = api_key_fingerprint("test_api_key", "")
+
+    with pytest.raises(ValueError, match="non-empty secret"):
+        await verify_api_key("hmac-sha256", "test_api_key", hashed_key)
+
+
+@pytest.mark.asyncio
+async def test_authenticate_api_key_hmac_sha256():
+    """
+    Tests authenticate_api_key with an hmac-sha256 API key hash.
+    """
+    api_key = "test_api_key"
+    secret = "fingerprint-secret"
+    auth_settings = AuthSettings(
+        swagger_token_url="test",
+        id_providers={},
+        incoming=IncomingAuthSettings(
+            api_key_fingerprint_secret=secret,
+            api_keys={
+                "test_key": IncomingAuthApiKey(
+                    algo="hmac-sha256",
+                    hash=api_key_fingerprint(api_key, secret),
+                    acls=[SectionACL(section_regex=".*", permissions=["read"])],
+                )
+            },
+        ),
+    )
+
+    result = await authenticate_api_key(api_key=api_key, auth_settings=auth_settings)
+    assert result.name == "test_key"
+
+
 @pytest.mark.asyncio
 async def test_verify_api_key_unsupported_algo():
     """
@@ -55,8 +118,24 @@ async def test_verify_api_key_unsupported_algo():
 
     Verifies that the function raises an AuthenticationError when an unsupported algorithm is provided.
     """
-    with pytest.raises(AuthenticationError):
+    with (
+        patch("nmtfast.auth.v1.api_keys.ph") as mock_ph,
+        pytest.raises(AuthenticationError),
+    ):
         await verify_api_key(algo="unsupported", api_key="test", hashed_key="hash")
+    mock_ph.verify.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_verify_api_key_malformed_hash():
+    """
+    Tests verify_api_key with a stored hash that is not a valid argon2 hash.
+
+    Verifies that the API key is rejected instead of raising an exception.
+    """
+    assert not await verify_api_key(
+        algo="argon2", api_key="test", hashed_key="not-an-argon2-hash"
+    )
 
 
 @pytest.mark.asyncio
@@ -67,7 +146,7 @@ async def test_authenticate_api_key_valid_with_acls():
     Verifies that the function returns the correct list of ACLs when a valid API key is provided.
     """
     api_key = "test_api_key"
-    hashed_key = ph.hash(api_key)
+    hashed_key = TEST_API_KEY_HASH
     mock_acls = [SectionACL(section_regex=".*", permissions=["read"])]
     mock_auth_info = AuthSuccess(
         name=api_key,
@@ -102,7 +181,7 @@ async def test_authenticate_api_key_valid_no_acls():
     Verifies that the function raises an AuthorizationError when a valid API key has no associated ACLs.
     """
     api_key = "test_api_key"
-    hashed_key = ph.hash(api_key)
+    hashed_key = TEST_API_KEY_HASH
     auth_settings = AuthSettings(
         swagger_token_url="test",
         id_providers={},
@@ -144,9 +223,8 @@ async def test_authenticate_api_key_incorrect_api_key():
 
     Verifies that the function raises an AuthenticationError.
     """
-    api_key = "test_api_key"
     incorrect_api_key = "incorrect_api_key"
-    hashed_key = ph.hash(api_key)
+    hashed_key = TEST_API_KEY_HASH
 
     auth_settings = AuthSettings(
         swagger_token_url="test",
@@ -161,3 +239,94 @@ async def test_authenticate_api_key_incorrect_api_key():
         await authenticate_api_key(
             api_key=incorrect_api_key, auth_settings=auth_settings
         )
+
+
+@pytest.mark.asyncio
+async def test_authenticate_api_key_fingerprint_lookup(mocker):
+    """
+    Tests authenticate_api_key with fingerprinted API keys.
+
+    Verifies that only the key matching the fingerprint is verified, and that keys
+    without a fingerprint are still checked when the index has no match.
+    """
+    api_key = "test_api_key"
+    secret = "fingerprint-secret"
+    acls = [SectionACL(section_regex=".*", permissions=["read"])]
+    auth_settings = AuthSettings(
+        swagger_token_url="test",
+        id_providers={},
+        incoming=IncomingAuthSettings(
+            api_key_fingerprint_secret=secret,
+            api_keys={
+                "other_key": IncomingAuthApiKey(
+                    hash=ph.hash("other_api_key"),
+                    fingerprint=api_key_fingerprint("other_api_key", secret),
+                    acls=acls,
+                ),
+                "legacy_key": IncomingAuthApiKey(
+                    hash=ph.hash("legacy_api_key"), acls=acls
+                ),
+                "test_key": IncomingAuthApiKey(
+                    hash=TEST_API_KEY_HASH,
+                    fingerprint=api_key_fingerprint(api_key, secret),
+                    acls=acls,
+                ),
+            },
+        ),
+    )
+    spy = mocker.spy(PasswordHasher, "verify")
+
+    result = await authenticate_api_key(api_key=api_key, auth_settings=auth_settings)
+    assert result.name == "test_key"
+    assert spy.call_count == 1
+
+    spy.reset_mock()
+    result = await authenticate_api_key(
+        api_key="legacy_api_key", auth_settings=auth_settings
+    )
+    assert result.name == "legacy_key"
+    assert spy.call_count == 1
+
+    spy.reset_mock()
+    with pytest.raises(AuthenticationError):
+        await authenticate_api_key(api_key="unknown", auth_settings=auth_settings)
+    assert spy.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_authenticate_api_key_fingerprint_added_later():
+    """
+    Tests authenticate_api_key with fingerprinted keys added after loading settings.
+
+    Verifies that keys added in place or through model_copy are still found.
+    """
+    secret = "fingerprint-secret"
+    acls = [SectionACL(section_regex=".*", permissions=["read"])]
+    incoming = IncomingAuthSettings(api_key_fingerprint_secret=secret)
+    auth_settings = AuthSettings(
+        swagger_token_url="test", id_providers={}, incoming=incoming
+    )
+    with pytest.raises(AuthenticationError):
+        await authenticate_api_key(api_key="late_key", auth_settings=auth_settings)
+
+    incoming.api_keys["late_key"] = IncomingAuthApiKey(
+        algo="hmac-sha256",
+        hash=api_key_fingerprint("late_key", secret),
+        fingerprint=api_key_fingerprint("late_key", secret),
+        acls=acls,
+    )
+    result = await authenticate_api_key(api_key="late_key", auth_settings=auth_settings)
+    assert result.name == "late_key"
+
+    copied = auth_settings.model_copy(
+        update={
+            "incoming": incoming.model_copy(
+                update={"api_keys": {"copied_key": incoming.api_keys["late_key"]}}
+            )
+        }
+    )
+    assert copied.incoming.api_keys_by_fingerprint == {
+        api_key_fingerprint("late_key", secret): "copied_key"
+    }
+    result = await authenticate_api_key(api_key="late_key", auth_settings=copied)
+    assert result.name == "copied_key"
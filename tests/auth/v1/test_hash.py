@@ -2,9 +2,13 @@
 # Copyright (c) 2025. All rights reserved.
 # Licensed under the MIT License. See LICENSE file in the project root for details.
 
+import re
+
 import pytest
 
-from nmtfast.auth.v1.hash import fingerprint_hash, secure_hash
+from nmtfast.auth.v1.hash import fingerprint_hash, fingerprint_hash_many, secure_hash
+
+HEX_RE = re.compile(r"[0-9a-f]+")
 
 
 @pytest.mark.parametrize(
@@ -28,7 +32,16 @@ def test_secure_hash_output_format(value, secret_key, salt, expected_length):
 
     assert isinstance(result, str)
     assert len(result) == expected_length
-    assert all(c in "0123456789abcdef" for c in result)
+    assert HEX_RE.fullmatch(result)
+
+
+def test_secure_hash_is_hmac_sha256():
+    """
+    Test that secure_hash output stays stable, since it is persisted in configs.
+    """
+    assert secure_hash(b"value", b"secret", b"salt") == (
+        "1fb9a760dfb137c66605f48f23340a042da5c591e1c6c039142efe9f8aaba139"
+    )
 
 
 def test_secure_hash_with_same_inputs_produces_same_output():
@@ -90,7 +103,7 @@ def test_fingerprint_hash_output_format(value, salt, expected_length):
 
     assert isinstance(result, str)
     assert len(result) == expected_length
-    assert all(c in "0123456789abcdef" for c in result)
+    assert HEX_RE.fullmatch(result)
 
 
 def test_fingerprint_hash_with_same_inputs_produces_same_output():
@@ -130,3 +143,16 @@ def test_secure_hash_vs_fingerprint_hash_difference():
     fingerprint = fingerprint_hash(value, salt)
 
     assert secure != fingerprint
+
+
+def test_fingerprint_hash_many_matches_fingerprint_hash():
+    """
+    Test that fingerprint_hash_many agrees with fingerprint_hash for each value.
+    """
+    values = [b"", b"one", b"two" * 100]
+    salt = b"salt value"
+
+    assert fingerprint_hash_many(values, salt) == [
+        fingerprint_hash(value, salt) for value in values
+    ]
+    assert fingerprint_hash_many([]) == []
@@ -5,8 +5,11 @@
 """Unit tests for JWT functions."""
 
 import base64
+import binascii
 import json
-from unittest.mock import AsyncMock, patch
+import os
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
@@ -15,10 +18,14 @@ from jwt import DecodeError, ExpiredSignatureError, InvalidTokenError
 from nmtfast.auth.v1.acl import AuthSuccess
 from nmtfast.auth.v1.exceptions import AuthenticationError, AuthorizationError
 from nmtfast.auth.v1.jwt import (
+    _claim_matches,
     _extract_username,
+    _find_client,
+    _get_jwks_client,
     _resolve_group_acls,
     _resolve_user_acls,
     authenticate_token,
+    clear_verified_claims_cache,
     decode_jwt_part,
     get_claims_jwks,
     get_idp_provider,
@@ -34,12 +41,44 @@ from nmtfast.settings.v1.schemas import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_jwks_client_cache():
+    """
+    Clear the shared PyJWKClient and claims caches so each test sees its own mocks.
+    """
+    _get_jwks_client.cache_clear()
+    clear_verified_claims_cache()
+    yield
+    _get_jwks_client.cache_clear()
+    clear_verified_claims_cache()
+
+
+def _unvalidated_acls(section_regex: str, permissions: list[str]) -> list[SectionACL]:
+    """
+    Helper function to build a single-entry ACL list without pydantic validation.
+    """
+    return [
+        SectionACL.model_construct(section_regex=section_regex, permissions=permissions)
+    ]
+
+
 def encode_base64(data):
     """
     Helper function to encode data in base64 with proper padding.
     """
-    encoded = base64.urlsafe_b64encode(data.encode("utf-8")).decode("utf-8")
-    return encoded.rstrip("=") + "=" * (4 - len(encoded) % 4)
+    encoded = base64.urlsafe_b64encode(data.encode("utf-8")).decode("utf-8").rstrip("=")
+    # NOTE: (-n) & 3 equals (-n) % 4 only because 4 is a power of two; it yields
+    #   0 padding characters when the length is already a multiple of 4
+    return encoded + "=" * ((-len(encoded)) & 3)
+
+
+def test_encode_base64_padding_zero_mod_four():
+    """
+    Test that encode_base64 adds no padding when none is needed.
+    """
+    assert encode_base64("abc") == "YWJj"
+    assert encode_base64("ab") == "YWI="
+    assert encode_base64("a") == "YQ=="
 
 
 def test_decode_jwt_part():
@@ -71,59 +110,138 @@ def test_decode_jwt_part():
 
 
 @pytest.mark.asyncio
-@patch("nmtfast.auth.v1.jwt.PyJWKClient")
-async def test_get_claims_jwks(mock_jwks_client):
+async def test_get_claims_jwks(patched_jwks, patched_jwt_decode):
     """
     Test using JWKS to retrieve claims for a JWT.
     """
-    mock_key = AsyncMock()
-    mock_key.key = "test-key"
-    mock_jwks_client.return_value.get_signing_key_from_jwt.return_value = mock_key
+    patched_jwt_decode.return_value = {"iss": "test-issuer"}
 
-    with patch("nmtfast.auth.v1.jwt.jwt.decode", return_value={"iss": "test-issuer"}):
-        claims = await get_claims_jwks("test.token", "https://example.com/jwks")
-        assert claims == {"iss": "test-issuer"}
+    claims = await get_claims_jwks("test.token", "https://example.com/jwks")
+    assert claims == {"iss": "test-issuer"}
 
-    with patch(
-        "nmtfast.auth.v1.jwt.jwt.decode", side_effect=DecodeError("Invalid token")
-    ):
-        with pytest.raises(AuthenticationError, match="Invalid token"):
-            await get_claims_jwks("test.token", "https://example.com/jwks")
 
-    with patch(
-        "nmtfast.auth.v1.jwt.jwt.decode",
-        side_effect=ExpiredSignatureError("Token expired"),
-    ):
-        with pytest.raises(AuthenticationError, match="Token expired"):
-            await get_claims_jwks("test.token", "https://example.com/jwks")
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "exc, match",
+    [
+        (DecodeError("Invalid token"), "Invalid token"),
+        (ExpiredSignatureError("Token expired"), "Token expired"),
+        (InvalidTokenError("Invalid"), "Invalid"),
+    ],
+)
+async def test_get_claims_jwks_decode_errors(
+    patched_jwks, patched_jwt_decode, exc, match
+):
+    """
+    Test that JWT decoding errors are raised as AuthenticationError.
+    """
+    patched_jwt_decode.side_effect = exc
+
+    with pytest.raises(AuthenticationError, match=match):
+        await get_claims_jwks("test.token", "https://example.com/jwks")
+
+
+@pytest.mark.asyncio
+async def test_get_claims_jwks_caches_verified_claims(patched_jwks, patched_jwt_decode):
+    """
+    Test that verified claims are cached briefly, but never past the token expiry.
+    """
+    exp = time.time() + 3600
+    patched_jwt_decode.return_value = {"iss": "test-issuer", "exp": exp}
+
+    first = await get_claims_jwks("test.token", "https://example.com/jwks")
+    first["iss"] = "modified"  # callers cannot modify the cached claims
+    second = await get_claims_jwks("test.token", "https://example.com/jwks")
+    assert second == {"iss": "test-issuer", "exp": exp}
+    patched_jwt_decode.assert_called_once()
+
+    # a different audience is verified separately
+    await get_claims_jwks("test.token", "https://example.com/jwks", "aud")
+    assert patched_jwt_decode.call_count == 2
+
+    clear_verified_claims_cache()
+    patched_jwt_decode.reset_mock()
+    patched_jwt_decode.return_value = {"iss": "test-issuer", "exp": time.time() - 60}
+    await get_claims_jwks("test.token", "https://example.com/jwks")
+    await get_claims_jwks("test.token", "https://example.com/jwks")
+    assert patched_jwt_decode.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_claims_jwks_claims_cache_scope(patched_jwks, patched_jwt_decode):
+    """
+    Test that cached claims are only reused for the same provider, and can be off.
+    """
+    patched_jwt_decode.return_value = {"iss": "test-issuer", "exp": time.time() + 60}
+    jwks_url = "https://example.com/jwks"
+
+    await get_claims_jwks("test.token", jwks_url, issuer_regex="^a$")
+    await get_claims_jwks("test.token", jwks_url, issuer_regex="^a$")
+    assert patched_jwt_decode.call_count == 1
+
+    # claims verified for one provider are not reused for another
+    await get_claims_jwks("test.token", jwks_url, issuer_regex="^b$")
+    assert patched_jwt_decode.call_count == 2
+
+    # with the cache disabled, every call verifies the token
+    await get_claims_jwks(
+        "test.token", jwks_url, issuer_regex="^a$", cache_claims=False
+    )
+    await get_claims_jwks("test.token", jwks_url, cache_claims=False)
+    await get_claims_jwks("test.token", jwks_url, cache_claims=False)
+    assert patched_jwt_decode.call_count == 5
+
+    clear_verified_claims_cache()
+    await get_claims_jwks("test.token", jwks_url, issuer_regex="^a$")
+    assert patched_jwt_decode.call_count == 6
+
+
+def test_decode_jwt_part_cached():
+    """
+    Test that decoding the same JWT segment twice only base64-decodes it once.
+    """
+    valid_payload = json.dumps({"iss": "cached-issuer"}).encode("utf-8")
+    encoded_payload = (
+        base64.urlsafe_b64encode(valid_payload).decode("utf-8").rstrip("=")
+    )
+    token = f"header.{encoded_payload}.signature"
 
     with patch(
-        "nmtfast.auth.v1.jwt.jwt.decode", side_effect=InvalidTokenError("Invalid")
-    ):
-        with pytest.raises(AuthenticationError, match="Invalid"):
-            await get_claims_jwks("test.token", "https://example.com/jwks")
+        "nmtfast.auth.v1.jwt.binascii.a2b_base64", side_effect=binascii.a2b_base64
+    ) as mock_b64decode:
+        first = decode_jwt_part(token, "payload")
+        first["iss"] = "modified"  # callers cannot modify the cached segment
+        assert decode_jwt_part(token, "payload") == {"iss": "cached-issuer"}
+        assert mock_b64decode.call_count == 1
 
 
 @pytest.mark.asyncio
-@patch("nmtfast.auth.v1.jwt.PyJWKClient")
-async def test_get_claims_jwks_with_audience(mock_jwks_client):
+async def test_get_claims_jwks_reuses_client(patched_jwks, patched_jwt_decode):
+    """
+    Test that one PyJWKClient is created and reused per JWKS URL.
+    """
+    patched_jwt_decode.return_value = {"iss": "test-issuer"}
+
+    await get_claims_jwks("test.token", "https://example.com/jwks")
+    await get_claims_jwks("test.token", "https://example.com/jwks")
+    await get_claims_jwks("test.token", "https://other.example.com/jwks")
+
+    assert patched_jwks.call_count == 2
+    patched_jwks.assert_any_call("https://example.com/jwks", cache_keys=True)
+
+
+@pytest.mark.asyncio
+async def test_get_claims_jwks_with_audience(patched_jwks, patched_jwt_decode):
     """
     Test that an audience parameter is passed through to jwt.decode.
     """
-    mock_key = AsyncMock()
-    mock_key.key = "test-key"
-    mock_jwks_client.return_value.get_signing_key_from_jwt.return_value = mock_key
+    patched_jwt_decode.return_value = {"iss": "test-issuer", "aud": "my-aud"}
 
-    with patch(
-        "nmtfast.auth.v1.jwt.jwt.decode",
-        return_value={"iss": "test-issuer", "aud": "my-aud"},
-    ) as mock_decode:
-        claims = await get_claims_jwks(
-            "test.token", "https://example.com/jwks", audience="my-aud"
-        )
-        assert claims == {"iss": "test-issuer", "aud": "my-aud"}
-        call_kwargs = mock_decode.call_args
-        assert call_kwargs.kwargs["audience"] == "my-aud"
+    claims = await get_claims_jwks(
+        "test.token", "https://example.com/jwks", audience="my-aud"
+    )
+    assert claims == {"iss": "test-issuer", "aud": "my-aud"}
+    assert patched_jwt_decode.call_args.kwargs["audience"] == "my-aud"
 
 
 @pytest.mark.asyncio
@@ -189,29 +307,23 @@ async def test_get_idp_provider_bearer_token():
 
 
 @pytest.mark.asyncio
-async def test_authenticate_token_success():
+async def test_authenticate_token_success(base_auth_settings):
     """
     Test successful token authentication with matching claims.
     """
-    auth_settings = AuthSettings(
-        swagger_token_url="https://swagger.example.com/token",
-        id_providers={
-            "test-idp": IDProvider(
-                type="jwks",
-                issuer_regex=r"^https://example.com/?$",
-                jwks_endpoint="https://example.com/jwks",
+    auth_settings = base_auth_settings.model_copy(
+        update={
+            "incoming": IncomingAuthSettings(
+                clients={
+                    "client1": IncomingAuthClient(
+                        provider="test-idp",
+                        claims={"sub": "test-user", "aud": "test-audience"},
+                        acls=[SectionACL(section_regex=".*", permissions=["read"])],
+                    )
+                },
+                api_keys={},
             )
-        },
-        incoming=IncomingAuthSettings(
-            clients={
-                "client1": IncomingAuthClient(
-                    provider="test-idp",
-                    claims={"sub": "test-user", "aud": "test-audience"},
-                    acls=[SectionACL(section_regex=".*", permissions=["read"])],
-                )
-            },
-            api_keys={},
-        ),
+        }
     )
     mock_token = "valid.token"
     expected_auth_info = AuthSuccess(
@@ -244,28 +356,26 @@ async def test_authenticate_token_success():
         assert result == expected_auth_info
         mock_get_provider.assert_called_once_with(mock_token, auth_settings)
         mock_get_claims.assert_called_once_with(
-            mock_token, "https://example.com/jwks", None
+            mock_token,
+            "https://example.com/jwks",
+            None,
+            issuer_regex=auth_settings.id_providers["test-idp"].issuer_regex,
+            cache_claims=True,
         )
 
 
 @pytest.mark.asyncio
-async def test_authenticate_token_no_claims():
+async def test_authenticate_token_no_claims(base_auth_settings):
     """
     Test when no claims are found after decoding.
     """
-    auth_settings = AuthSettings(
-        swagger_token_url="https://swagger.example.com/token",
-        id_providers={
-            "test-idp": IDProvider(
-                type="jwks",
-                issuer_regex=r"^https://example.com/?$",
-                jwks_endpoint="https://example.com/jwks",
+    auth_settings = base_auth_settings.model_copy(
+        update={
+            "incoming": IncomingAuthSettings.model_construct(
+                clients={},
+                api_keys={},
             )
-        },
-        incoming=IncomingAuthSettings(
-            clients={},
-            api_keys={},
-        ),
+        }
     )
     mock_token = "valid.token"
 
@@ -278,29 +388,23 @@ async def test_authenticate_token_no_claims():
 
 
 @pytest.mark.asyncio
-async def test_authenticate_token_no_matching_client():
+async def test_authenticate_token_no_matching_client(base_auth_settings):
     """
     Test when no client matches the claims.
     """
-    auth_settings = AuthSettings(
-        swagger_token_url="https://swagger.example.com/token",
-        id_providers={
-            "test-idp": IDProvider(
-                type="jwks",
-                issuer_regex=r"^https://example.com/?$",
-                jwks_endpoint="https://example.com/jwks",
+    auth_settings = base_auth_settings.model_copy(
+        update={
+            "incoming": IncomingAuthSettings.model_construct(
+                clients={
+                    "client1": IncomingAuthClient.model_construct(
+                        provider="test-idp",
+                        claims={"sub": "non-matching-user"},
+                        acls=_unvalidated_acls(".*", ["read"]),
+                    )
+                },
+                api_keys={},
             )
-        },
-        incoming=IncomingAuthSettings(
-            clients={
-                "client1": IncomingAuthClient(
-                    provider="test-idp",
-                    claims={"sub": "non-matching-user"},
-                    acls=[SectionACL(section_regex=".*", permissions=["read"])],
-                )
-            },
-            api_keys={},
-        ),
+        }
     )
     mock_token = "valid.token"
 
@@ -316,29 +420,23 @@ async def test_authenticate_token_no_matching_client():
 
 
 @pytest.mark.asyncio
-async def test_authenticate_token_partial_claims_match():
+async def test_authenticate_token_partial_claims_match(base_auth_settings):
     """
     Test when some claims match but not all.
     """
-    auth_settings = AuthSettings(
-        swagger_token_url="https://swagger.example.com/token",
-        id_providers={
-            "test-idp": IDProvider(
-                type="jwks",
-                issuer_regex=r"^https://example.com/?$",
-                jwks_endpoint="https://example.com/jwks",
+    auth_settings = base_auth_settings.model_copy(
+        update={
+            "incoming": IncomingAuthSettings.model_construct(
+                clients={
+                    "client1": IncomingAuthClient.model_construct(
+                        provider="test-idp",
+                        claims={"sub": "test-user", "aud": "required-audience"},
+                        acls=_unvalidated_acls(".*", ["read"]),
+                    )
+                },
+                api_keys={},
             )
-        },
-        incoming=IncomingAuthSettings(
-            clients={
-                "client1": IncomingAuthClient(
-                    provider="test-idp",
-                    claims={"sub": "test-user", "aud": "required-audience"},
-                    acls=[SectionACL(section_regex=".*", permissions=["read"])],
-                )
-            },
-            api_keys={},
-        ),
+        }
     )
     mock_token = "valid.token"
 
@@ -357,34 +455,28 @@ async def test_authenticate_token_partial_claims_match():
 
 
 @pytest.mark.asyncio
-async def test_authenticate_token_multiple_clients():
+async def test_authenticate_token_multiple_clients(base_auth_settings):
     """
     Test with multiple clients where second one matches.
     """
-    auth_settings = AuthSettings(
-        swagger_token_url="https://swagger.example.com/token",
-        id_providers={
-            "test-idp": IDProvider(
-                type="jwks",
-                issuer_regex=r"^https://example.com/?$",
-                jwks_endpoint="https://example.com/jwks",
+    auth_settings = base_auth_settings.model_copy(
+        update={
+            "incoming": IncomingAuthSettings.model_construct(
+                clients={
+                    "client1": IncomingAuthClient.model_construct(
+                        provider="test-idp",
+                        claims={"sub": "non-matching-user"},
+                        acls=_unvalidated_acls(".*", ["read"]),
+                    ),
+                    "client2": IncomingAuthClient.model_construct(
+                        provider="test-idp",
+                        claims={"sub": "correct-user"},
+                        acls=_unvalidated_acls("specific", ["write"]),
+                    ),
+                },
+                api_keys={},
             )
-        },
-        incoming=IncomingAuthSettings(
-            clients={
-                "client1": IncomingAuthClient(
-                    provider="test-idp",
-                    claims={"sub": "non-matching-user"},
-                    acls=[SectionACL(section_regex=".*", permissions=["read"])],
-                ),
-                "client2": IncomingAuthClient(
-                    provider="test-idp",
-                    claims={"sub": "correct-user"},
-                    acls=[SectionACL(section_regex="specific", permissions=["write"])],
-                ),
-            },
-            api_keys={},
-        ),
+        }
     )
     mock_token = "valid.token"
     mock_acls = [
@@ -412,21 +504,21 @@ async def test_authenticate_token_unsupported_provider_type():
     """
     Test when the ID provider type is not supported.
     """
-    auth_settings = AuthSettings(
+    auth_settings = AuthSettings.model_construct(
         swagger_token_url="https://swagger.example.com/token",
         id_providers={
-            "test-idp": IDProvider(
+            "test-idp": IDProvider.model_construct(
                 type="unsupported_type",  # not "jwks"
                 issuer_regex=r"^https://example.com/?$",
                 jwks_endpoint="https://example.com/jwks",
             )
         },
-        incoming=IncomingAuthSettings(
+        incoming=IncomingAuthSettings.model_construct(
             clients={
-                "client1": IncomingAuthClient(
+                "client1": IncomingAuthClient.model_construct(
                     provider="test-idp",
                     claims={"sub": "test-user"},
-                    acls=[SectionACL(section_regex=".*", permissions=["read"])],
+                    acls=_unvalidated_acls(".*", ["read"]),
                 )
             },
             api_keys={},
@@ -450,21 +542,21 @@ async def test_authenticate_token_future_provider_type():
     """
     Test when a new provider type is added but not yet implemented.
     """
-    auth_settings = AuthSettings(
+    auth_settings = AuthSettings.model_construct(
         swagger_token_url="https://swagger.example.com/token",
         id_providers={
-            "test-idp": IDProvider(
+            "test-idp": IDProvider.model_construct(
                 type="future_type",  # not yet implemented
                 issuer_regex=r"^https://example.com/?$",
                 jwks_endpoint="https://example.com/jwks",
             )
         },
-        incoming=IncomingAuthSettings(
+        incoming=IncomingAuthSettings.model_construct(
             clients={
-                "client1": IncomingAuthClient(
+                "client1": IncomingAuthClient.model_construct(
                     provider="test-idp",
                     claims={"sub": "test-user"},
-                    acls=[SectionACL(section_regex=".*", permissions=["read"])],
+                    acls=_unvalidated_acls(".*", ["read"]),
                 )
             },
             api_keys={},
@@ -482,31 +574,31 @@ async def test_authenticate_token_only_wrong_provider_clients():
     """
     Test when all clients have wrong providers.
     """
-    auth_settings = AuthSettings(
+    auth_settings = AuthSettings.model_construct(
         swagger_token_url="https://swagger.example.com/token",
         id_providers={
-            "test-idp": IDProvider(
+            "test-idp": IDProvider.model_construct(
                 type="jwks",
                 issuer_regex=r"^https://example.com/?$",
                 jwks_endpoint="https://example.com/jwks",
             ),
-            "other-idp": IDProvider(
+            "other-idp": IDProvider.model_construct(
                 type="jwks",
                 issuer_regex=r"^https://other.com/?$",
                 jwks_endpoint="https://other.com/jwks",
             ),
         },
-        incoming=IncomingAuthSettings(
+        incoming=IncomingAuthSettings.model_construct(
             clients={
-                "client1": IncomingAuthClient(
+                "client1": IncomingAuthClient.model_construct(
                     provider="other-idp",  # doesn't match
                     claims={"sub": "test-user"},
-                    acls=[SectionACL(section_regex=".*", permissions=["read"])],
+                    acls=_unvalidated_acls(".*", ["read"]),
                 ),
-                "client2": IncomingAuthClient(
+                "client2": IncomingAuthClient.model_construct(
                     provider="other-idp",  # doesn't match
                     claims={"sub": "test-user"},
-                    acls=[SectionACL(section_regex=".*", permissions=["read"])],
+                    acls=_unvalidated_acls(".*", ["read"]),
                 ),
             },
             api_keys={},
@@ -533,6 +625,114 @@ async def test_authenticate_token_only_wrong_provider_clients():
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.parametrize(
+    "value, expected, result",
+    [
+        ("alice", "alice", True),
+        ("alice", "bob", False),
+        ("älice", "älice", True),
+        (None, "alice", False),
+        (["alice"], "alice", False),
+        ("", "", True),
+    ],
+)
+def test_claim_matches(value, expected, result):
+    """
+    Test constant-time claim comparison, including non-ASCII and non-string values.
+    """
+    assert _claim_matches(value, expected) is result
+
+
+def test_find_client_prefers_first_configured_match():
+    """
+    Test that _find_client returns the first configured client whose claims match.
+
+    Clients with different claim name sets can match the same token; the one
+    configured first must win, as with a linear scan over the clients.
+    """
+    acls = [SectionACL(section_regex=".*", permissions=["read"])]
+    auth_settings = AuthSettings(
+        swagger_token_url="https://swagger.example.com/token",
+        id_providers={"test-idp": IDProvider(), "other-idp": IDProvider()},
+        incoming=IncomingAuthSettings(
+            clients={
+                "other_provider": IncomingAuthClient(
+                    provider="other-idp", claims={"sub": "user"}, acls=acls
+                ),
+                "by_sub_and_azp": IncomingAuthClient(
+                    provider="test-idp",
+                    claims={"sub": "user", "azp": "app"},
+                    acls=acls,
+                ),
+                "by_sub": IncomingAuthClient(
+                    provider="test-idp", claims={"sub": "user"}, acls=acls
+                ),
+                "by_groups": IncomingAuthClient(
+                    provider="test-idp", claims={"groups": "admins"}, acls=acls
+                ),
+            },
+        ),
+    )
+
+    claims = {"sub": "user", "azp": "app", "groups": ["admins"]}
+    assert _find_client(claims, auth_settings, "test-idp") == "by_sub_and_azp"
+    assert _find_client({"sub": "user"}, auth_settings, "test-idp") == "by_sub"
+    assert _find_client({"sub": "user"}, auth_settings, "other-idp") == (
+        "other_provider"
+    )
+    assert _find_client({"sub": "nobody"}, auth_settings, "test-idp") is None
+    assert _find_client(claims, auth_settings, "unknown-idp") is None
+
+
+def test_find_client_after_clients_change():
+    """
+    Test that _find_client sees clients changed after the settings were loaded.
+
+    Replacing clients (by assignment or model_copy) rebuilds the index, and
+    clients changed in place are found by falling back to a scan.
+    """
+    acls = [SectionACL(section_regex=".*", permissions=["read"])]
+    incoming = IncomingAuthSettings(
+        clients={
+            "old": IncomingAuthClient(
+                provider="test-idp", claims={"sub": "old"}, acls=acls
+            ),
+        },
+    )
+    auth_settings = AuthSettings(
+        swagger_token_url="https://swagger.example.com/token",
+        id_providers={"test-idp": IDProvider()},
+        incoming=incoming,
+    )
+
+    incoming.clients["added"] = IncomingAuthClient(
+        provider="test-idp", claims={"sub": "added"}, acls=acls
+    )
+    assert _find_client({"sub": "added"}, auth_settings, "test-idp") == "added"
+
+    del incoming.clients["old"]
+    assert _find_client({"sub": "old"}, auth_settings, "test-idp") is None
+
+    copied = auth_settings.model_copy(
+        update={
+            "incoming": incoming.model_copy(
+                update={
+                    "clients": {
+                        "new": IncomingAuthClient(
+                            provider="test-idp", claims={"sub": "new"}, acls=acls
+                        )
+                    }
+                }
+            )
+        }
+    )
+    assert copied.incoming.client_claims_index == {
+        "test-idp": {("sub",): {("new",): (0, "new")}}
+    }
+    assert _find_client({"sub": "new"}, copied, "test-idp") == "new"
+    assert _find_client({"sub": "added"}, copied, "test-idp") is None
+
+
 def test_resolve_user_acls_match():
     """
     Test that _resolve_user_acls returns ACLs when a user's claims match.
@@ -1133,3 +1333,164 @@ def test_extract_username_strips_whitespace():
     """Test that leading/trailing whitespace is stripped."""
     claims = {"preferred_username": "  jdoe  "}
     assert _extract_username(claims) == "jdoe"
+
+
+def test_issuer_pattern_is_cached_and_follows_updates():
+    """Test that IDProvider.issuer_pattern is compiled once and reset on changes."""
+    idp = IDProvider(issuer_regex=r"^https://example.com/?$")
+    assert idp.issuer_pattern is idp.issuer_pattern
+    assert idp.issuer_pattern.search("https://example.com")
+
+    copied = idp.model_copy(update={"issuer_regex": r"^https://other.com/?$"})
+    assert copied.issuer_pattern.search("https://other.com")
+
+    idp.issuer_regex = r"^https://third.com/?$"
+    assert idp.issuer_pattern.search("https://third.com")
+    assert not idp.issuer_pattern.search("https://example.com")
+
+
+@pytest.mark.asyncio
+async def test_idp_provider_regex_is_precompiled():
+    """Test that matching issuers never compiles a regex per token."""
+    idp = IDProvider(issuer_regex=r"^https://example.com/?$")
+    auth_settings = AuthSettings(
+        swagger_token_url="https://swagger.example.com/token",
+        id_providers={"test-idp": idp},
+    )
+    payload = encode_base64(json.dumps({"iss": "https://example.com"})).rstrip("=")
+    token = f"header.{payload}.signature"
+    idp.issuer_pattern  # compile once, as the first request would
+
+    with patch("re.compile") as mock_compile:
+        for _ in range(1000):
+            assert await get_idp_provider(token, auth_settings) == "test-idp"
+
+    mock_compile.assert_not_called()
+
+
+def _issuer_token(issuer: str) -> str:
+    """Build an unsigned token whose payload only has an iss claim."""
+    payload = encode_base64(json.dumps({"iss": issuer})).rstrip("=")
+    return f"header.{payload}.signature"
+
+
+@pytest.mark.asyncio
+async def test_literal_issuer_fastpath():
+    """Test that literal issuers are found without running any provider regex."""
+    auth_settings = AuthSettings(
+        swagger_token_url="https://swagger.example.com/token",
+        id_providers={
+            "regex-idp": IDProvider(issuer_regex=r"^https://(a|b)\.example\.com$"),
+            "literal-idp": IDProvider(issuer_regex=r"^https://idp\.example\.com/?$"),
+        },
+    )
+    assert auth_settings.issuer_index == {
+        "https://idp.example.com": (1, "literal-idp"),
+        "https://idp.example.com/": (1, "literal-idp"),
+    }
+
+    patterns = {}
+    for idp_conf in auth_settings.id_providers.values():
+        patterns[idp_conf.issuer_regex] = MagicMock(wraps=idp_conf.issuer_pattern)
+        idp_conf.__dict__["issuer_pattern"] = patterns[idp_conf.issuer_regex]
+
+    token = _issuer_token("https://idp.example.com/")
+    assert await get_idp_provider(token, auth_settings) == "literal-idp"
+    for pattern in patterns.values():
+        pattern.search.assert_not_called()
+
+    # issuers that are not in the index still go through the regexes
+    token = _issuer_token("https://b.example.com")
+    assert await get_idp_provider(token, auth_settings) == "regex-idp"
+
+
+@pytest.mark.asyncio
+async def test_literal_issuer_index_follows_provider_changes():
+    """Test that issuers are matched against providers changed after loading."""
+    auth_settings = AuthSettings(
+        swagger_token_url="https://swagger.example.com/token",
+        id_providers={
+            "old-idp": IDProvider(issuer_regex=r"^https://old\.example\.com$"),
+        },
+    )
+    old_token = _issuer_token("https://old.example.com")
+    new_token = _issuer_token("https://new.example.com")
+
+    auth_settings.id_providers["new-idp"] = IDProvider(
+        issuer_regex=r"^https://new\.example\.com$"
+    )
+    assert await get_idp_provider(new_token, auth_settings) == "new-idp"
+
+    auth_settings.id_providers["old-idp"].issuer_regex = r"^https://moved\.com$"
+    with pytest.raises(AuthenticationError):
+        await get_idp_provider(old_token, auth_settings)
+
+    copied = auth_settings.model_copy(
+        update={
+            "id_providers": {
+                "copied-idp": IDProvider(issuer_regex=r"^https://old\.example\.com$")
+            }
+        }
+    )
+    assert await get_idp_provider(old_token, copied) == "copied-idp"
+    with pytest.raises(AuthenticationError):
+        await get_idp_provider(new_token, copied)
+
+
+@pytest.mark.asyncio
+async def test_literal_issuer_fastpath_keeps_last_match():
+    """Test that a later provider matching the same issuer still wins."""
+    auth_settings = AuthSettings(
+        swagger_token_url="https://swagger.example.com/token",
+        id_providers={
+            "literal-idp": IDProvider(issuer_regex=r"^https://idp\.example\.com$"),
+            "catch-all-idp": IDProvider(issuer_regex=r"^https://.*$"),
+        },
+    )
+
+    token = _issuer_token("https://idp.example.com")
+    assert await get_idp_provider(token, auth_settings) == "catch-all-idp"
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 100, 1024])
+def test_decode_jwt_part_round_trip(size):
+    """Test that JWT segments of any length decode like base64.urlsafe_b64decode."""
+    claims = {"data": base64.b64encode(os.urandom(size)).decode("ascii")}
+    encoded = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode()
+    token = f"header.{encoded.rstrip('=')}.signature"
+
+    assert decode_jwt_part(token, "payload") == claims
+
+
+def test_decode_jwt_part_big_int_claims():
+    """Test that integer claims wider than 64 bits are decoded exactly."""
+    claims = {"sub": 2**64 + 1, "nbf": -(2**70)}
+    encoded = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode()
+    token = f"header.{encoded.rstrip('=')}.signature"
+
+    assert decode_jwt_part(token, "payload") == claims
+
+
+def test_clients_by_provider_index_built():
+    """Test that clients are indexed by provider, claim names and claim values."""
+    incoming = IncomingAuthSettings(
+        clients={
+            "client-a": IncomingAuthClient(
+                provider="idp-1", claims={"sub": "a", "aud": "x"}, acls=[]
+            ),
+            "client-b": IncomingAuthClient(
+                provider="idp-1", claims={"sub": "b"}, acls=[]
+            ),
+            "client-c": IncomingAuthClient(
+                provider="idp-2", claims={"sub": "a"}, acls=[]
+            ),
+        }
+    )
+
+    assert incoming.client_claims_index == {
+        "idp-1": {
+            ("aud", "sub"): {("x", "a"): (0, "client-a")},
+            ("sub",): {("b",): (1, "client-b")},
+        },
+        "idp-2": {("sub",): {("a",): (2, "client-c")}},
+    }
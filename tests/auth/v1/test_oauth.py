@@ -174,3 +174,19 @@ def test_oauth2_client_credentials_repr():
         "auto_error=True)"
     )
     assert repr(scheme) == expected_repr
+
+
+def test_oauth2_client_credentials_flows_model_cached():
+    """
+    Test that OAuth2ClientCredentials reuses the flow model built for a token URL.
+    """
+    token_url = "https://example.com/token"
+    first = OAuth2ClientCredentials(tokenUrl=token_url)
+    second = OAuth2ClientCredentials(tokenUrl=token_url, scheme_name="Other")
+    other = OAuth2ClientCredentials(tokenUrl="https://other.example.com/token")
+
+    assert first.model.flows is not second.model.flows
+    assert first.model.flows.clientCredentials is second.model.flows.clientCredentials
+    assert other.model.flows.clientCredentials.tokenUrl == (
+        "https://other.example.com/token"
+    )
@@ -4,7 +4,10 @@
 
 """Base cache classes and utility functions for nmtfast apps."""
 
+import math
+import time
 from typing import Any, Optional
+from unittest.mock import patch
 
 import pytest
 
@@ -165,33 +168,90 @@ def test_ttl_handling():
     class TTLCache(AppCacheBase):
 
         def __init__(self):
-            self.storage = {}
-            self.ttls = {}
+            self._entries: dict[str, tuple[Any, int, float]] = {}
 
         def store_app_cache(self, key: str, value: Any, ttl: int = -1) -> bool:
-            self.storage[key] = value
-            self.ttls[key] = ttl
+            expires = time.monotonic() + ttl if ttl > 0 else math.inf
+            self._entries[key] = (value, ttl, expires)
             return True
 
         def fetch_app_cache(self, key: str) -> Optional[Any]:
-            return self.storage.get(key)
+            entry = self._entries.get(key)
+            if entry is None or entry[2] < time.monotonic():
+                return None
+            return entry[0]
 
         def clear_app_cache(self, key: str) -> bool:
-            if key in self.storage:
-                del self.storage[key]
-                del self.ttls[key]
-                return True
-            return False
+            return self._entries.pop(key, None) is not None
 
     cache = TTLCache()
 
     # test TTL storage
     cache.store_app_cache("default_ttl", "value")
-    assert cache.ttls["default_ttl"] == -1
+    assert cache._entries["default_ttl"][1] == -1
+    assert cache.fetch_app_cache("default_ttl") == "value"
 
     cache.store_app_cache("short_ttl", "value", 60)
-    assert cache.ttls["short_ttl"] == 60
+    assert cache._entries["short_ttl"][1] == 60
 
     # test clear removes TTL info
     assert cache.clear_app_cache("short_ttl") is True
-    assert "short_ttl" not in cache.ttls
+    assert "short_ttl" not in cache._entries
+
+    # test expired entries are not returned
+    cache.store_app_cache("expired", "value", 60)
+    with patch("time.monotonic", return_value=time.monotonic() + 61):
+        assert cache.fetch_app_cache("expired") is None
+
+
+def test_fetch_many_app_cache_default():
+    """
+    Test that fetch_many_app_cache falls back to fetch_app_cache for each key.
+    """
+
+    class TestCache(AppCacheBase):
+
+        def store_app_cache(self, key: str, value: Any, ttl: int = -1) -> bool:
+            return True
+
+        def fetch_app_cache(self, key: str) -> Optional[Any]:
+            return None if key == "missing" else f"value-{key}"
+
+        def clear_app_cache(self, key: str) -> bool:
+            return True
+
+    cache = TestCache()
+    assert cache.fetch_many_app_cache(["a", "missing", "b"]) == [
+        "value-a",
+        None,
+        "value-b",
+    ]
+
+
+def test_store_many_app_cache_default():
+    """
+    Test that store_many_app_cache falls back to store_app_cache for each item.
+    """
+
+    class TestCache(AppCacheBase):
+
+        def __init__(self):
+            self.stored = {}
+
+        def store_app_cache(self, key: str, value: Any, ttl: int = -1) -> bool:
+            self.stored[key] = (value, ttl)
+            return key != "fails"
+
+        def fetch_app_cache(self, key: str) -> Optional[Any]:
+            return None
+
+        def clear_app_cache(self, key: str) -> bool:
+            return True
+
+    cache = TestCache()
+    assert cache.store_many_app_cache({"a": 1, "b": 2}, 60) is True
+    assert cache.stored == {"a": (1, 60), "b": (2, 60)}
+
+    # every item is stored, even after a failure
+    assert cache.store_many_app_cache({"fails": 3, "c": 4}) is False
+    assert cache.stored["c"] == (4, -1)
@@ -4,13 +4,17 @@
 
 """Huey cache classes and utility functions for nmtfast apps."""
 
+import datetime
 import json
+import os
 import zlib
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from huey import Huey
-from huey.storage import RedisStorage, SqliteStorage
+from huey.storage import RedisExpireStorage, RedisStorage, SqliteStorage
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
 
 from nmtfast.cache.v1.huey import HueyAppCache
 
@@ -24,11 +28,15 @@ def mock_huey_redis():
 
     huey.storage = Mock(spec=RedisStorage)
     huey.storage.name = "test-redis"
-    huey.storage.conn = Mock()
+    huey.storage.result_key = "huey.results.test-redis"
+    huey.storage.conn = MagicMock()
+    # NOTE: serializer is set in Huey.__init__, so it is not part of the spec
+    huey.serializer = Mock()
+    huey.serializer.serialize.side_effect = lambda data: b"serialized:" + data
 
-    huey.put = Mock(return_value=True)
-    huey.get = Mock(return_value=None)
-    huey.delete = Mock(return_value=True)
+    huey.put.return_value = True
+    huey.get.return_value = None
+    huey.delete.return_value = True
 
     return huey
 
@@ -46,9 +54,9 @@ def mock_huey_sqlite():
         delattr(storage, "conn")
 
     huey.storage = storage
-    huey.put = Mock(return_value=True)
-    huey.get = Mock(return_value=None)
-    huey.delete = Mock(return_value=True)
+    huey.put.return_value = True
+    huey.get.return_value = None
+    huey.delete.return_value = True
 
     return huey
 
@@ -62,6 +70,7 @@ def test_initialization(mock_huey_redis):
     assert cache.name == "test_cache"
     assert cache.default_ttl == 3600
     assert cache.compress_threshold == 8192
+    assert cache.compress_level == 1
     assert cache.huey_app == mock_huey_redis
 
 
@@ -84,13 +93,48 @@ def test_store_app_cache_with_redis(mock_huey_redis):
 
     assert cache.store_app_cache("key1", test_value) is True
 
-    mock_huey_redis.put.assert_called_once()
-    args, _ = mock_huey_redis.put.call_args
-    assert args[0] == "app_cache_test_cache_key1"
-    assert isinstance(args[1], bytes)
-    mock_huey_redis.storage.conn.expire.assert_called_once_with(
+    # the value is written exactly as huey_app.put would, in the same pipeline
+    mock_huey_redis.put.assert_not_called()
+    conn = mock_huey_redis.storage.conn
+    conn.pipeline.assert_called_once_with(transaction=False)
+    pipe = conn.pipeline.return_value.__enter__.return_value
+    pipe.hset.assert_called_once_with(
+        "huey.results.test-redis",
+        "app_cache_test_cache_key1",
+        b"serialized:value1",
+    )
+    pipe.expire.assert_called_once_with(
         "huey.r.test-redis.app_cache_test_cache_key1", 3600
     )
+    pipe.execute.assert_called_once_with()
+    conn.expire.assert_not_called()
+
+
+def test_store_app_cache_with_redis_expire_storage():
+    """
+    Test storing with RedisExpireStorage uses a single SET with an expiry.
+
+    The value must be written under the same key and with the same serialization
+    that huey_app.put would use, so that huey_app.get can still read it back.
+    """
+    huey = Mock(spec=Huey)
+    huey.storage = Mock(spec=RedisExpireStorage)
+    huey.storage.name = "test-redis"
+    huey.storage.conn = Mock()
+    huey.storage.result_key = lambda key: b"huey.r.test-redis." + key.encode()
+    huey.serializer = Mock()
+    huey.serializer.serialize = Mock(return_value=b"serialized")
+
+    cache = HueyAppCache(huey, "test_cache", 3600)
+
+    assert cache.store_app_cache("key1", b"value1", 60) is True
+
+    huey.put.assert_not_called()
+    huey.serializer.serialize.assert_called_once_with(b"value1")
+    huey.storage.conn.set.assert_called_once_with(
+        b"huey.r.test-redis.app_cache_test_cache_key1", b"serialized", ex=60
+    )
+    huey.storage.conn.expire.assert_not_called()
 
 
 def test_store_app_cache_with_sqlite(mock_huey_sqlite):
@@ -117,11 +161,88 @@ def test_store_app_cache_with_custom_ttl(mock_huey_redis):
     test_value = b"value1"
 
     assert cache.store_app_cache("key1", test_value, 60) is True
-    mock_huey_redis.storage.conn.expire.assert_called_once_with(
+    pipe = mock_huey_redis.storage.conn.pipeline.return_value.__enter__.return_value
+    pipe.expire.assert_called_once_with(
         "huey.r.test-redis.app_cache_test_cache_key1", 60
     )
 
 
+def test_store_many_app_cache_with_redis(mock_huey_redis):
+    """
+    Test that storing many keys with RedisStorage uses a single pipeline.
+    """
+    cache = HueyAppCache(mock_huey_redis, "test_cache", 3600)
+    items = {f"key{i}": f"value{i}".encode() for i in range(100)}
+
+    assert cache.store_many_app_cache(items, 60) is True
+
+    mock_huey_redis.put.assert_not_called()
+    conn = mock_huey_redis.storage.conn
+    conn.pipeline.assert_called_once_with(transaction=False)
+    pipe = conn.pipeline.return_value.__enter__.return_value
+    pipe.execute.assert_called_once_with()
+    assert pipe.hset.call_count == 100
+    assert pipe.expire.call_count == 100
+    pipe.hset.assert_any_call(
+        "huey.results.test-redis", "app_cache_test_cache_key7", b"serialized:value7"
+    )
+    pipe.expire.assert_any_call("huey.r.test-redis.app_cache_test_cache_key7", 60)
+
+
+def test_store_many_app_cache_with_redis_expire_storage():
+    """
+    Test that storing many keys with RedisExpireStorage pipelines SET ... EX.
+    """
+    huey = Mock(spec=Huey)
+    huey.storage = Mock(spec=RedisExpireStorage)
+    huey.storage.name = "test-redis"
+    huey.storage.conn = MagicMock()
+    huey.storage.result_key = lambda key: b"huey.r.test-redis." + key.encode()
+    huey.serializer = Mock()
+    huey.serializer.serialize = Mock(side_effect=lambda data: b"serialized:" + data)
+
+    cache = HueyAppCache(huey, "test_cache", 3600)
+
+    assert cache.store_many_app_cache({"a": b"1", "b": {"n": 2}}) is True
+
+    pipe = huey.storage.conn.pipeline.return_value.__enter__.return_value
+    pipe.set.assert_any_call(
+        b"huey.r.test-redis.app_cache_test_cache_a", b"serialized:1", ex=3600
+    )
+    pipe.set.assert_any_call(
+        b"huey.r.test-redis.app_cache_test_cache_b",
+        b'serialized:{"n":2}',
+        ex=3600,
+    )
+    pipe.expire.assert_not_called()
+    pipe.execute.assert_called_once_with()
+
+
+def test_store_many_app_cache_with_sqlite(mock_huey_sqlite):
+    """
+    Test that storing many keys without Redis stores each key in turn.
+    """
+    cache = HueyAppCache(mock_huey_sqlite, "test_cache", 3600)
+
+    assert cache.store_many_app_cache({"a": b"1", "b": b"2"}) is True
+
+    assert mock_huey_sqlite.put.call_count == 2
+    mock_huey_sqlite.put.assert_any_call("app_cache_test_cache_b", b"2")
+
+
+def test_store_many_app_cache_failure(mock_huey_redis):
+    """
+    Test that a pipeline failing after retries is raised as RuntimeError.
+    """
+    pipe = mock_huey_redis.storage.conn.pipeline.return_value.__enter__.return_value
+    pipe.execute.side_effect = RedisConnectionError("Redis down")
+    cache = HueyAppCache(mock_huey_redis, "test_cache", 3600)
+
+    with pytest.raises(RuntimeError, match="Cache storage operation failed"):
+        cache.store_many_app_cache({"a": b"1"})
+    assert pipe.execute.call_count == 5
+
+
 def test_fetch_app_cache_hit(mock_huey_redis):
     """
     Test successful cache fetch.
@@ -149,35 +270,146 @@ def test_fetch_app_cache_miss(mock_huey_redis):
     assert result is None
 
 
-def test_store_app_cache_retry(mock_huey_redis):
+def test_fetch_many_app_cache_redis_storage(mock_huey_redis):
+    """
+    Test fetching several keys from RedisStorage with a single HMGET.
+    """
+    mock_huey_redis.storage.result_key = "huey.results.test-redis"
+    mock_huey_redis.storage.conn.hmget.return_value = [b"raw1", None]
+    mock_huey_redis.serializer = Mock()
+    mock_huey_redis.serializer.deserialize = Mock(return_value=b"value1")
+    cache = HueyAppCache(mock_huey_redis, "test_cache", 3600)
+
+    assert cache.fetch_many_app_cache(["key1", "key2"]) == [b"value1", None]
+
+    mock_huey_redis.storage.conn.hmget.assert_called_once_with(
+        "huey.results.test-redis",
+        ["app_cache_test_cache_key1", "app_cache_test_cache_key2"],
+    )
+    mock_huey_redis.serializer.deserialize.assert_called_once_with(b"raw1")
+    mock_huey_redis.get.assert_not_called()
+
+
+def test_fetch_many_app_cache_redis_expire_storage():
+    """
+    Test fetching several keys from RedisExpireStorage with a single MGET.
+    """
+    huey = Mock(spec=Huey)
+    huey.storage = Mock(spec=RedisExpireStorage)
+    huey.storage.name = "test-redis"
+    huey.storage.conn = Mock()
+    huey.storage.conn.mget.return_value = [None, b"raw2"]
+    huey.storage.result_key = lambda key: b"huey.r.test-redis." + key.encode()
+    huey.serializer = Mock()
+    huey.serializer.deserialize = Mock(return_value=b"value2")
+    cache = HueyAppCache(huey, "test_cache", 3600)
+
+    assert cache.fetch_many_app_cache(["key1", "key2"]) == [None, b"value2"]
+
+    huey.storage.conn.mget.assert_called_once_with(
+        [
+            b"huey.r.test-redis.app_cache_test_cache_key1",
+            b"huey.r.test-redis.app_cache_test_cache_key2",
+        ]
+    )
+
+
+def test_fetch_many_app_cache_fails_fast(mock_huey_redis):
+    """
+    Test that bulk fetch errors are treated as cache misses for every key.
+    """
+    mock_huey_redis.storage.result_key = "huey.results.test-redis"
+    mock_huey_redis.storage.conn.hmget.side_effect = RedisTimeoutError("Error 1")
+    cache = HueyAppCache(mock_huey_redis, "test_cache", 3600)
+
+    assert cache.fetch_many_app_cache(["key1", "key2"]) == [None, None]
+    assert mock_huey_redis.storage.conn.hmget.call_count == 1
+
+    mock_huey_redis.storage.conn.hmget.side_effect = KeyError("bug")
+    with pytest.raises(KeyError):
+        cache.fetch_many_app_cache(["key1", "key2"])
+
+
+def test_fetch_many_app_cache_sqlite(mock_huey_sqlite):
+    """
+    Test that bulk fetches without Redis fall back to one fetch per key.
+    """
+    mock_huey_sqlite.get.side_effect = [b"value1", None]
+    cache = HueyAppCache(mock_huey_sqlite, "test_cache", 3600)
+
+    assert cache.fetch_many_app_cache(["key1", "key2"]) == [b"value1", None]
+    assert mock_huey_sqlite.get.call_count == 2
+
+
+def test_store_app_cache_retry(mock_huey_sqlite):
     """
     Test retry behavior on store operations.
     """
     test_value = b"value"
-    mock_huey_redis.put.side_effect = [Exception("Error 1"), Exception("Error 2"), True]
-    cache = HueyAppCache(mock_huey_redis, "test_cache", 3600)
+    mock_huey_sqlite.put.side_effect = [
+        RedisConnectionError("Error 1"),
+        ConnectionError("Error 2"),
+        True,
+    ]
+    cache = HueyAppCache(mock_huey_sqlite, "test_cache", 3600)
 
     assert cache.store_app_cache("key", test_value) is True
-    assert mock_huey_redis.put.call_count == 3
+    assert mock_huey_sqlite.put.call_count == 3
 
 
-def test_fetch_app_cache_retry(mock_huey_redis):
+def test_store_app_cache_no_retry_on_other_errors(mock_huey_sqlite):
     """
-    Test retry behavior on fetch operations.
+    Test that errors other than connection problems are not retried.
     """
-    test_value = b"success"
-    mock_huey_redis.get.side_effect = [
-        Exception("Error 1"),
-        Exception("Error 2"),
-        test_value,
-    ]
+    mock_huey_sqlite.put.side_effect = [KeyError("bug"), True]
+    cache = HueyAppCache(mock_huey_sqlite, "test_cache", 3600)
+
+    with pytest.raises(RuntimeError, match="Cache storage operation failed"):
+        cache.store_app_cache("key", b"value")
+    assert mock_huey_sqlite.put.call_count == 1
+
+    mock_huey_sqlite.delete.side_effect = KeyError("bug")
+    with pytest.raises(KeyError):
+        cache.clear_app_cache("key")
+    assert mock_huey_sqlite.delete.call_count == 1
+
+
+def test_store_app_cache_retry_redis_pipeline(mock_huey_redis):
+    """
+    Test that a failed Redis pipeline is retried as a whole.
+    """
+    pipe = mock_huey_redis.storage.conn.pipeline.return_value.__enter__.return_value
+    pipe.execute.side_effect = [RedisTimeoutError("Error 1"), [1, True]]
     cache = HueyAppCache(mock_huey_redis, "test_cache", 3600)
 
-    assert cache.fetch_app_cache("key") == test_value
-    assert mock_huey_redis.get.call_count == 3
+    assert cache.store_app_cache("key", b"value") is True
+    assert pipe.execute.call_count == 2
+    assert pipe.hset.call_count == 2
 
 
-def test_store_app_cache_complex_object(mock_huey_redis):
+def test_fetch_app_cache_fails_fast(mock_huey_redis):
+    """
+    Test that fetch operations are not retried and backend errors are cache misses.
+    """
+    mock_huey_redis.get.side_effect = [RedisConnectionError("Error 1"), b"success"]
+    cache = HueyAppCache(mock_huey_redis, "test_cache", 3600)
+
+    assert cache.fetch_app_cache("key") is None
+    assert mock_huey_redis.get.call_count == 1
+
+
+def test_fetch_app_cache_raises_non_backend_errors(mock_huey_redis):
+    """
+    Test that errors other than backend failures are not hidden as cache misses.
+    """
+    mock_huey_redis.get.side_effect = KeyError("bug")
+    cache = HueyAppCache(mock_huey_redis, "test_cache", 3600)
+
+    with pytest.raises(KeyError):
+        cache.fetch_app_cache("key")
+
+
+def test_store_app_cache_complex_object(mock_huey_sqlite):
     """
     Test storage of complex Python objects with JSON serialization.
 
@@ -188,12 +420,12 @@ def test_store_app_cache_complex_object(mock_huey_redis):
     """
     # Create test data with tuple that will become list after JSON round-trip
     original_obj = {"list": [1, 2, 3], "dict": {"a": 1}, "nested": {"tuple": (1, 2)}}
-    cache = HueyAppCache(mock_huey_redis, "test_cache", 3600)
+    cache = HueyAppCache(mock_huey_sqlite, "test_cache", 3600)
 
     assert cache.store_app_cache("complex", original_obj) is True
-    mock_huey_redis.put.assert_called_once()
+    mock_huey_sqlite.put.assert_called_once()
 
-    args, _ = mock_huey_redis.put.call_args
+    args, _ = mock_huey_sqlite.put.call_args
     assert args[0] == "app_cache_test_cache_complex"
     assert isinstance(args[1], bytes)
 
@@ -213,31 +445,45 @@ def test_store_app_cache_complex_object(mock_huey_redis):
     assert json.loads(stored_data.decode("utf-8")) == expected_obj
 
 
-def test_store_app_cache_with_bytes(mock_huey_redis):
+def test_store_app_cache_with_bytes(mock_huey_sqlite):
     """
     Test storing raw bytes.
     """
-    cache = HueyAppCache(mock_huey_redis, "test_cache", 3600)
+    cache = HueyAppCache(mock_huey_sqlite, "test_cache", 3600)
     data = b"raw_bytes"
 
     assert cache.store_app_cache("bytes", data) is True
 
-    mock_huey_redis.put.assert_called_once()
-    args, _ = mock_huey_redis.put.call_args
+    mock_huey_sqlite.put.assert_called_once()
+    args, _ = mock_huey_sqlite.put.call_args
 
     assert args[1] == data or args[1].endswith(data)  # possible compression
 
 
-def test_store_app_cache_with_string(mock_huey_redis):
+@pytest.mark.parametrize("data", [bytearray(b"raw_bytes"), memoryview(b"raw_bytes")])
+def test_store_app_cache_with_binary_buffer(mock_huey_sqlite, data):
+    """
+    Test storing bytearray and memoryview values as raw bytes.
+    """
+    cache = HueyAppCache(mock_huey_sqlite, "test_cache", 3600)
+
+    assert cache.store_app_cache("bytes", data) is True
+
+    args, _ = mock_huey_sqlite.put.call_args
+    assert args[1] == b"raw_bytes"
+    assert type(args[1]) is bytes
+
+
+def test_store_app_cache_with_string(mock_huey_sqlite):
     """
     Test storing regular string.
     """
-    cache = HueyAppCache(mock_huey_redis, "test_cache", 3600)
+    cache = HueyAppCache(mock_huey_sqlite, "test_cache", 3600)
     data = "regular string"
 
     assert cache.store_app_cache("string", data) is True
 
-    args, _ = mock_huey_redis.put.call_args
+    args, _ = mock_huey_sqlite.put.call_args
     stored = args[1]
 
     if stored.startswith(HueyAppCache.COMPRESSION_HEADER):
@@ -246,16 +492,16 @@ def test_store_app_cache_with_string(mock_huey_redis):
     assert stored == data.encode("utf-8")
 
 
-def test_store_app_cache_with_json_string(mock_huey_redis):
+def test_store_app_cache_with_json_string(mock_huey_sqlite):
     """
     Test storing string that happens to be JSON.
     """
-    cache = HueyAppCache(mock_huey_redis, "test_cache", 3600)
+    cache = HueyAppCache(mock_huey_sqlite, "test_cache", 3600)
     data = '{"key": "value"}'  # Valid JSON string
 
     assert cache.store_app_cache("json", data) is True
 
-    args, _ = mock_huey_redis.put.call_args
+    args, _ = mock_huey_sqlite.put.call_args
     stored = args[1]
     if stored.startswith(HueyAppCache.COMPRESSION_HEADER):
         stored = zlib.decompress(stored[len(HueyAppCache.COMPRESSION_HEADER) :])
@@ -289,6 +535,22 @@ def test_store_app_cache_serialization_errors(mock_huey_redis):
         assert isinstance(excinfo.value.__cause__, TypeError)
 
 
+def test_serialize_value_matches_json_module(mock_huey_redis):
+    """
+    Test values are serialized exactly like compact json.dumps, on every host.
+    """
+    cache = HueyAppCache(mock_huey_redis, "test_cache", 3600)
+    value = {"big": 2**70, 1: "int key", "nan": float("nan"), "inf": float("inf")}
+
+    assert cache._serialize_value("key", value) == json.dumps(
+        value, separators=(",", ":")
+    ).encode("utf-8")
+
+    with pytest.raises(ValueError) as excinfo:
+        cache.store_app_cache("key", datetime.datetime.now())
+    assert isinstance(excinfo.value.__cause__, TypeError)
+
+
 def test_prepare_data_compression(mock_huey_redis):
     """
     Test data preparation with compression.
@@ -302,6 +564,44 @@ def test_prepare_data_compression(mock_huey_redis):
     assert len(result) < len(large_data)
 
 
+@pytest.mark.parametrize("size", [100, 100_000])
+def test_prepare_data_incompressible(mock_huey_redis, size):
+    """
+    Test that high entropy data is stored uncompressed, small or large.
+    """
+    cache = HueyAppCache(mock_huey_redis, "test_cache", 3600, compress_threshold=10)
+    random_data = os.urandom(size)
+
+    with patch("nmtfast.cache.v1.huey.zlib.compress", wraps=zlib.compress) as spy:
+        result = cache._prepare_data(random_data)
+
+    assert result == random_data
+    if size > 2 * HueyAppCache.COMPRESSION_SAMPLE_SIZE:
+        # only the sample was compressed
+        spy.assert_called_once()
+        assert len(spy.call_args.args[0]) == HueyAppCache.COMPRESSION_SAMPLE_SIZE
+
+
+@pytest.mark.parametrize("compress_level", [1, 6, 9])
+def test_prepare_data_compress_level_round_trip(mock_huey_redis, compress_level):
+    """
+    Test that data compressed at any zlib level is restored to the original bytes.
+    """
+    cache = HueyAppCache(
+        mock_huey_redis,
+        "test_cache",
+        3600,
+        compress_threshold=10,
+        compress_level=compress_level,
+    )
+    large_data = b"abc" * 1000
+
+    result = cache._prepare_data(large_data)
+
+    assert result.startswith(HueyAppCache.COMPRESSION_HEADER)
+    assert cache._restore_data(result) == large_data
+
+
 def test_prepare_data_no_compression(mock_huey_redis):
     """
     Test data preparation without compression.
@@ -390,6 +690,47 @@ def test_restore_data_corrupted_compressed(mock_huey_redis, caplog):
         cache._restore_data(corrupted)
 
 
+def test_unsupported_compression(mock_huey_redis):
+    """
+    Test that an unknown compression algorithm is rejected.
+    """
+    with pytest.raises(ValueError, match="Unsupported cache compression"):
+        HueyAppCache(mock_huey_redis, "test_cache", 3600, compression="lz4")
+
+
+def test_zstd_compression_requires_zstandard(mock_huey_redis):
+    """
+    Test that zstd compression without zstandard fails early, and reads say why.
+    """
+    cache = HueyAppCache(mock_huey_redis, "test_cache", 3600)
+
+    with patch("nmtfast.cache.v1.huey._zstd", None):
+        with pytest.raises(ImportError, match="zstandard"):
+            HueyAppCache(mock_huey_redis, "test_cache", 3600, compression="zstd")
+        with pytest.raises(ValueError, match="zstandard is not installed"):
+            cache._restore_data(HueyAppCache.ZSTD_COMPRESSION_HEADER + b"payload")
+
+
+def test_zstd_compression_round_trip(mock_huey_redis):
+    """
+    Test that zstd compressed data is restored, by zstd and zlib configured caches.
+    """
+    pytest.importorskip("zstandard")
+    cache = HueyAppCache(
+        mock_huey_redis, "test_cache", 3600, compress_threshold=10, compression="zstd"
+    )
+    large_data = b"abc" * 1000
+
+    result = cache._prepare_data(large_data)
+
+    assert result.startswith(HueyAppCache.ZSTD_COMPRESSION_HEADER)
+    assert len(result) < len(large_data)
+    assert cache._restore_data(result) == large_data
+
+    zlib_cache = HueyAppCache(mock_huey_redis, "test_cache", 3600)
+    assert zlib_cache._restore_data(result) == large_data
+
+
 def test_clear_app_cache(mock_huey_redis):
     """
     Test clearing cache data.
@@ -7,6 +7,7 @@
 import importlib
 import importlib.util
 import logging
+import os
 import pathlib
 
 import pytest
@@ -16,12 +17,21 @@ logger = logging.getLogger(__name__)
 
 
 @pytest.fixture(scope="session", autouse=True)
-def discover_all_nmtfast_modules() -> None:
+def discover_all_nmtfast_modules(request: pytest.FixtureRequest) -> None:
     """
     Fixture that discovers all implicit namespace packages in nmtfast.
 
-    It is necessary to load all packages in order to detect missing code coverage.
+    It is necessary to load all packages in order to detect missing code coverage,
+    so this only runs when coverage is collected (pytest --cov, as in CI and
+    "invoke coverage") or when NMTFAST_DISCOVER_ALL=1 is set. Other runs only
+    import the modules their tests need.
     """
+    if not (
+        request.config.getoption("cov_source", default=None)
+        or os.environ.get("NMTFAST_DISCOVER_ALL", "0") == "1"
+    ):
+        return
+
     package = "nmtfast"
     spec = importlib.util.find_spec(package)
 
@@ -42,10 +52,10 @@ def discover_all_nmtfast_modules() -> None:
                 continue
 
             # convert file path to module import path
-            relative_path = entry.relative_to(path)
-            module_name = (
-                f"{parent}.{relative_path.with_suffix('').as_posix().replace('/', '.')}"
-            )
+            # NOTE: pkgutil.walk_packages cannot be used here, since it does not
+            #   descend into implicit namespace packages (no __init__.py)
+            module_parts = entry.relative_to(path).with_suffix("").parts
+            module_name = ".".join((parent, *module_parts))
             try:
                 importlib.import_module(module_name)
                 logger.info(f"Loaded module: {module_name}")
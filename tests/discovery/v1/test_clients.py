@@ -4,8 +4,12 @@
 
 """Tests for OAuth client handling in nmtfast.discovery.v1.clients."""
 
+import asyncio
 import json
+import subprocess
 import sys
+import time
+from typing import Any, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -29,15 +33,48 @@ from nmtfast.settings.v1.schemas import (
 #   they MUST be imported inside of the test so that the patch_retry_and_reload()
 #   fixture will intercept tenacity retry and disable it
 
+# NOTE: patch_retry_and_reload() reloads the clients module once per module, so
+#   keep these tests on one worker when running under pytest-xdist
+pytestmark = pytest.mark.xdist_group(name="discovery_clients")
 
-@pytest.fixture(autouse=True)
+# NOTE: cached token payloads are constants, so serialize them once at import
+_VALID_CACHED_TOKEN: dict = {
+    "access_token": "valid_token",
+    "token_type": "Bearer",
+    "expires_at": 9999999999,
+}
+_VALID_CACHED_TOKEN_BYTES: bytes = json.dumps(_VALID_CACHED_TOKEN).encode()
+
+_CACHED_TOKEN_DATA: dict = {
+    "access_token": "cached_token",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+}
+_CACHED_TOKEN_JSON_BYTES: bytes = json.dumps(_CACHED_TOKEN_DATA).encode("utf-8")
+
+
+def _valid_token_oauth_client() -> AsyncMock:
+    """
+    Build a mock AsyncOAuth2Client holding a token that has not expired.
+    """
+    # NOTE: each test needs its own mock since calls are recorded on it; a shared
+    #   template (or copy.copy of one) would leak those between tests
+    mock_client = AsyncMock(spec=AsyncOAuth2Client)
+    mock_client.token = MagicMock()
+    mock_client.token.is_expired.return_value = False
+    return mock_client
+
+
+@pytest.fixture(scope="module", autouse=True)
 def patch_retry_and_reload():
     """
     Patch the retry decorator and reload nmtfast.discovery.v1.clients.
 
     This incredibly useful (but difficult to discover) use of fixtures will prevent
     tenacity retry from firing. Basically, we need to strip out the retry decorator
-    before the module is loaded and cached by the interpreter.
+    before the module is loaded and cached by the interpreter. The decorators are
+    applied at import time, so the module is only reloaded once for this test
+    module; reset_clients_module() clears its state between tests.
     """
     from importlib import import_module
 
@@ -61,7 +98,7 @@ def patch_retry_and_reload():
 
     yield module
 
-    # NOTE: this cleanup runs AFTER the test is complete
+    # NOTE: this cleanup runs AFTER all tests in this module are complete
 
     # reload original module after test to avoid side effects
     if original is not None:
@@ -70,6 +107,50 @@ def patch_retry_and_reload():
         sys.modules.pop("nmtfast.discovery.v1.clients", None)
 
 
+@pytest.fixture(autouse=True)
+def reset_clients_module(patch_retry_and_reload):
+    """
+    Clear the per-loop client pools of the reloaded clients module.
+    """
+    yield
+    patch_retry_and_reload._LOOP_CLIENT_POOLS.clear()
+
+
+def _patch_oauth_client_class(monkeypatch, module, client_class) -> None:
+    """
+    Make the clients module build its OAuth clients with client_class.
+    """
+    classes = module._AuthlibClasses(client_class, OAuth2Error)
+    monkeypatch.setattr(module, "_authlib", lambda: classes)
+
+
+@pytest.fixture
+def mock_oauth_client_class(monkeypatch, patch_retry_and_reload):
+    """
+    Fixture replacing AsyncOAuth2Client in the reloaded clients module.
+
+    Tests configure the client it builds via mock_oauth_client_class.return_value.
+    """
+    mock_class = MagicMock()
+    _patch_oauth_client_class(monkeypatch, patch_retry_and_reload, mock_class)
+    return mock_class
+
+
+@pytest.fixture
+def mock_http_transport(monkeypatch):
+    """
+    Fixture replacing httpx.AsyncHTTPTransport so no network traffic happens.
+
+    The transports it builds answer every request with an empty 200 response.
+    """
+    mock_class = MagicMock()
+    mock_class.return_value.handle_async_request = AsyncMock(
+        return_value=httpx.Response(200, request=httpx.Request("GET", "http://test"))
+    )
+    monkeypatch.setattr(httpx, "AsyncHTTPTransport", mock_class)
+    return mock_class
+
+
 @pytest.fixture
 def mock_id_provider():
     """
@@ -146,20 +227,51 @@ def mock_discovery_settings(mock_service_config):
     return ServiceDiscoverySettings(services={"test_service": mock_service_config})
 
 
+class FakeAppCache(AppCacheBase):
+    """
+    In-memory AppCacheBase stand-in that records how it was called.
+
+    Every key fetches the same cached value, which tests set directly.
+    """
+
+    def __init__(self) -> None:
+        self.cached: Any = None
+        self.fetched: list[str] = []
+        self.fetched_many: list[list[str]] = []
+        self.stored: list[tuple[str, Any, int]] = []
+        self.cleared: list[str] = []
+
+    def store_app_cache(self, key: str, value: Any, ttl: int = -1) -> bool:
+        self.stored.append((key, value, ttl))
+        return True
+
+    def fetch_app_cache(self, key: str) -> Optional[Any]:
+        self.fetched.append(key)
+        return self.cached
+
+    def fetch_many_app_cache(self, keys: list[str]) -> list[Optional[Any]]:
+        self.fetched_many.append(keys)
+        return [self.cached for _ in keys]
+
+    def clear_app_cache(self, key: str) -> bool:
+        self.cleared.append(key)
+        return True
+
+
 @pytest.fixture
-def mock_cache():
+def mock_cache() -> FakeAppCache:
     """
-    Fixture to return a mock AppCacheBase object.
+    Fixture to return a fake AppCacheBase object.
     """
-    cache = MagicMock(spec=AppCacheBase)
-    cache.fetch_app_cache.return_value = None
-    cache.store_app_cache = MagicMock()
-    return cache
+    return FakeAppCache()
 
 
-@pytest.mark.asyncio
 async def test_get_oauth_client(
-    mock_service_config, mock_id_provider, mock_outgoing_client, monkeypatch
+    mock_service_config,
+    mock_id_provider,
+    mock_outgoing_client,
+    mock_oauth_client_class,
+    mock_http_transport,
 ):
     """
     Test get_oauth_client creates a properly configured client.
@@ -169,40 +281,31 @@ async def test_get_oauth_client(
     #   tenacity retry, and disable it
     from nmtfast.discovery.v1.clients import get_oauth_client
 
-    with (
-        patch(
-            "nmtfast.discovery.v1.clients.AsyncOAuth2Client", autospec=True
-        ) as mock_client_class,
-        patch(
-            "httpx.AsyncHTTPTransport",
-            return_value="MOCK_TRANSPORT",
-        ),
-    ):
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
-
-        await get_oauth_client(
-            service_config=mock_service_config,
-            id_provider=mock_id_provider,
-            client_settings=mock_outgoing_client,
-        )
+    await get_oauth_client(
+        service_config=mock_service_config,
+        id_provider=mock_id_provider,
+        client_settings=mock_outgoing_client,
+    )
 
-        # Assert the client was created with expected parameters
-        mock_client_class.assert_called_once()
-        call_args = mock_client_class.call_args.kwargs
-        assert call_args["client_id"] == "client_id"
-        assert call_args["client_secret"] == "client_secret"
-        assert call_args["token_endpoint"] == "https://auth.example.com/token"
-        assert call_args["token_endpoint_auth_method"] == "client_secret_basic"
-        assert call_args["base_url"] == "https://api.example.com"
-        assert isinstance(call_args["timeout"], httpx.Timeout)
-        assert call_args["timeout"].connect == 5.0
-        assert call_args["timeout"].read == 10.0
+    # Assert the client was created with expected parameters
+    mock_oauth_client_class.assert_called_once()
+    call_args = mock_oauth_client_class.call_args.kwargs
+    assert call_args["client_id"] == "client_id"
+    assert call_args["client_secret"] == "client_secret"
+    assert call_args["token_endpoint"] == "https://auth.example.com/token"
+    assert call_args["token_endpoint_auth_method"] == "client_secret_basic"
+    assert call_args["base_url"] == "https://api.example.com"
+    assert isinstance(call_args["timeout"], httpx.Timeout)
+    assert call_args["timeout"].connect == 5.0
+    assert call_args["timeout"].read == 10.0
 
 
-@pytest.mark.asyncio
 async def test_create_api_client_with_client_credentials(
-    mock_auth_settings, mock_discovery_settings, mock_cache
+    mock_auth_settings,
+    mock_discovery_settings,
+    mock_cache,
+    mock_oauth_client_class,
+    mock_http_transport,
 ):
     """
     Test create_api_client works with client credentials auth.
@@ -212,52 +315,41 @@ async def test_create_api_client_with_client_credentials(
     #   tenacity retry, and disable it
     from nmtfast.discovery.v1.clients import create_api_client
 
-    mock_cache.fetch_app_cache.return_value = None
-
-    with patch("nmtfast.discovery.v1.clients.AsyncOAuth2Client") as MockOAuthClient:
-
-        # create a proper mock client and the entire token flow
-        mock_client = AsyncMock(spec=AsyncOAuth2Client)
-        mock_client.fetch_token = AsyncMock(
-            return_value={
-                "access_token": "test_token",
-                "token_type": "Bearer",
-                "expires_in": 3600,
-            }
-        )
-        mock_client.token = {
+    # create a proper mock client and the entire token flow
+    mock_client = AsyncMock(spec=AsyncOAuth2Client)
+    mock_client.fetch_token = AsyncMock(
+        return_value={
             "access_token": "test_token",
             "token_type": "Bearer",
             "expires_in": 3600,
         }
-        MockOAuthClient.return_value = mock_client
-
-        # Mock the transport to prevent real network calls
-        with patch("httpx.AsyncHTTPTransport") as MockHTTPTransport:
-            mock_transport_instance = MagicMock()
-            mock_transport_instance.handle_async_request = AsyncMock(
-                return_value=httpx.Response(
-                    200, request=httpx.Request("GET", "http://test.com")
-                )
-            )
-            MockHTTPTransport.return_value = mock_transport_instance  # Ensure the constructor returns our mock instance
+    )
+    mock_client.token = {
+        "access_token": "test_token",
+        "token_type": "Bearer",
+        "expires_in": 3600,
+    }
+    mock_oauth_client_class.return_value = mock_client
 
-            await create_api_client(
-                auth=mock_auth_settings,
-                discovery=mock_discovery_settings,
-                service_name="test_service",
-                cache=mock_cache,
-            )
+    await create_api_client(
+        auth=mock_auth_settings,
+        discovery=mock_discovery_settings,
+        service_name="test_service",
+        cache=mock_cache,
+    )
 
-        # Verify the client was properly configured
-        MockOAuthClient.assert_called_once()
-        mock_client.fetch_token.assert_awaited_once()
-        mock_cache.store_app_cache.assert_called_once()
+    # Verify the client was properly configured
+    mock_oauth_client_class.assert_called_once()
+    mock_client.fetch_token.assert_awaited_once()
+    assert len(mock_cache.stored) == 1
 
 
-@pytest.mark.asyncio
 async def test_create_api_client_with_valid_cached_token(
-    mock_auth_settings, mock_discovery_settings, mock_cache
+    mock_auth_settings,
+    mock_discovery_settings,
+    mock_cache,
+    mock_oauth_client_class,
+    mock_http_transport,
 ):
     """
     Test create_api_client uses valid cached token.
@@ -267,140 +359,78 @@ async def test_create_api_client_with_valid_cached_token(
     #   tenacity retry, and disable it
     from nmtfast.discovery.v1.clients import create_api_client
 
-    cached_token = {
-        "access_token": "valid_token",
-        "token_type": "Bearer",
-        "expires_at": 9999999999,
-    }
-    mock_cache.fetch_app_cache.return_value = json.dumps(cached_token).encode()
+    mock_cache.cached = _VALID_CACHED_TOKEN_BYTES
 
-    with patch("nmtfast.discovery.v1.clients.AsyncOAuth2Client") as MockOAuthClient:
+    # create mock client and mock token validation
+    mock_client = _valid_token_oauth_client()
+    mock_oauth_client_class.return_value = mock_client
 
-        # create mock client and mock token validation
-        mock_client = AsyncMock(spec=AsyncOAuth2Client)
-        mock_token = MagicMock()
-        mock_token.is_expired.return_value = False
-        mock_client.token = mock_token
-        MockOAuthClient.return_value = mock_client
+    await create_api_client(
+        auth=mock_auth_settings,
+        discovery=mock_discovery_settings,
+        service_name="test_service",
+        cache=mock_cache,
+    )
 
-        # mock the transport so no network traffic happens
-        with patch("httpx.AsyncHTTPTransport"):
+    mock_client.fetch_token.assert_not_called()
 
-            await create_api_client(
-                auth=mock_auth_settings,
-                discovery=mock_discovery_settings,
-                service_name="test_service",
-                cache=mock_cache,
-            )
 
-        mock_client.fetch_token.assert_not_called()
+def _unknown_principal(auth: AuthSettings, discovery: ServiceDiscoverySettings):
+    discovery.services["test_service"].auth_principal = "missing_client"
 
 
-@pytest.mark.asyncio
-async def test_create_api_client_service_not_found(
-    mock_auth_settings, mock_discovery_settings, mock_cache
-):
-    """
-    Test create_api_client raises for unknown services.
-    """
-    # NOTE: we must load nmtfast.discovery.v1.clients functions INSIDE of the test
-    #   in order for the patch_retry_and_reload() autouse fixture to intercept
-    #   tenacity retry, and disable it
-    from nmtfast.discovery.v1.clients import create_api_client
+def _drop_outgoing_client(auth: AuthSettings, discovery: ServiceDiscoverySettings):
+    auth.outgoing.clients.pop("test_client")
 
-    with pytest.raises(ServiceConnectionError):
-        await create_api_client(
-            auth=mock_auth_settings,
-            discovery=mock_discovery_settings,
-            service_name="missing_service",
-            cache=mock_cache,
-        )
 
+def _unknown_provider(auth: AuthSettings, discovery: ServiceDiscoverySettings):
+    auth.outgoing.clients["test_client"].provider = "missing_provider"
 
-@pytest.mark.asyncio
-async def test_create_api_client_service_not_found_alt1(
-    mock_auth_settings, mock_discovery_settings, mock_cache
-):
-    """Test create_api_client raises ServiceConnectionError when service not found."""
-    from nmtfast.discovery.v1.clients import create_api_client
 
-    with pytest.raises(ServiceConnectionError) as excinfo:
-        await create_api_client(
-            auth=mock_auth_settings,
-            discovery=mock_discovery_settings,
-            service_name="nonexistent_service",
-            cache=mock_cache,
-        )
-    assert "nonexistent_service" in str(excinfo.value)
+def _drop_id_provider(auth: AuthSettings, discovery: ServiceDiscoverySettings):
+    auth.id_providers.pop("test_provider")
 
 
-@pytest.mark.asyncio
-async def test_create_api_client_outgoing_client_not_found(
-    mock_auth_settings, mock_cache, mock_service_config
+@pytest.mark.parametrize(
+    "service_name, mutate, expected",
+    [
+        ("missing_service", None, "missing_service"),
+        ("test_service", _unknown_principal, "Outgoing client 'missing_client'"),
+        ("test_service", _drop_outgoing_client, "Outgoing client 'test_client'"),
+        ("test_service", _unknown_provider, "ID Provider 'missing_provider'"),
+        ("test_service", _drop_id_provider, "ID Provider 'test_provider'"),
+    ],
+)
+async def test_create_api_client_raises_for_missing_settings(
+    mock_auth_settings,
+    mock_discovery_settings,
+    mock_cache,
+    service_name,
+    mutate,
+    expected,
 ):
     """
-    Test create_api_client raises when outgoing client not found in auth settings.
+    Test create_api_client raises when the service or its auth settings are missing.
     """
     # NOTE: we must load nmtfast.discovery.v1.clients functions INSIDE of the test
     #   in order for the patch_retry_and_reload() autouse fixture to intercept
     #   tenacity retry, and disable it
     from nmtfast.discovery.v1.clients import create_api_client
 
-    mock_service_config.auth_principal = "missing_client"
+    if mutate:
+        mutate(mock_auth_settings, mock_discovery_settings)
 
-    # manipulate the service config to use a missing client name
-    bad_discovery = ServiceDiscoverySettings(
-        services={
-            "test_service": mock_service_config,
-        }
-    )
     with pytest.raises(ServiceConnectionError) as excinfo:
         await create_api_client(
             auth=mock_auth_settings,
-            discovery=bad_discovery,
-            service_name="test_service",
-            cache=mock_cache,
-        )
-
-    assert "Outgoing client 'missing_client' not found" in str(excinfo.value)
-
-
-@pytest.mark.asyncio
-async def test_create_api_client_id_provider_not_found(
-    mock_auth_settings,
-    mock_cache,
-    mock_outgoing_client,
-    mock_service_config,
-):
-    """
-    Test create_api_client raises when ID provider not found.
-    """
-    from nmtfast.discovery.v1.clients import create_api_client
-
-    mock_outgoing_client.provider = "missing_provider"
-
-    bad_auth_settings = AuthSettings(
-        swagger_token_url=mock_auth_settings.swagger_token_url,
-        id_providers={},  # no providers
-        outgoing=OutgoingAuthSettings(clients={"test_client": mock_outgoing_client}),
-    )
-
-    # service discovery uses auth_principal 'test_client'
-    good_discovery = ServiceDiscoverySettings(
-        services={"test_service": mock_service_config}
-    )
-    with pytest.raises(ServiceConnectionError) as excinfo:
-        await create_api_client(
-            auth=bad_auth_settings,
-            discovery=good_discovery,
-            service_name="test_service",
+            discovery=mock_discovery_settings,
+            service_name=service_name,
             cache=mock_cache,
         )
 
-    assert "ID Provider 'missing_provider' not found" in str(excinfo.value)
+    assert expected in str(excinfo.value)
 
 
-@pytest.mark.asyncio
 async def test_create_api_client_oauth2_error(
     mock_auth_settings, mock_discovery_settings, mock_cache
 ):
@@ -412,8 +442,6 @@ async def test_create_api_client_oauth2_error(
     #   tenacity retry, and disable it
     from nmtfast.discovery.v1.clients import create_api_client
 
-    mock_cache.fetch_app_cache.return_value = None
-
     with patch(
         "nmtfast.discovery.v1.clients.get_oauth_client",
         new_callable=AsyncMock,
@@ -436,7 +464,6 @@ async def test_create_api_client_oauth2_error(
         assert "test_service" in str(excinfo.value)
 
 
-@pytest.mark.asyncio
 async def test_create_api_client_unexpected_exception(
     mock_auth_settings, mock_discovery_settings, mock_cache
 ):
@@ -448,8 +475,6 @@ async def test_create_api_client_unexpected_exception(
     #   tenacity retry, and disable it
     from nmtfast.discovery.v1.clients import create_api_client
 
-    mock_cache.fetch_app_cache.return_value = None
-
     with patch(
         "nmtfast.discovery.v1.clients.get_oauth_client", new_callable=AsyncMock
     ) as mock_get_oauth_client:
@@ -469,7 +494,6 @@ async def test_create_api_client_unexpected_exception(
         assert "error" in str(excinfo.value)
 
 
-@pytest.mark.asyncio
 async def test_create_api_client_returns_auth_headers(mock_auth_settings, mock_cache):
     """
     Test create_api_client returns AsyncClient for non-client_credentials auth method.
@@ -503,9 +527,8 @@ async def test_create_api_client_returns_auth_headers(mock_auth_settings, mock_c
     )  # From mock_outgoing_headers
 
 
-@pytest.mark.asyncio
 async def test_create_api_client_with_cached_token_returned(
-    mock_auth_settings, mock_discovery_settings, mock_cache
+    mock_auth_settings, mock_discovery_settings, mock_cache, mock_oauth_client_class
 ):
     """
     Test create_api_client returns cached client if token is valid.
@@ -516,43 +539,33 @@ async def test_create_api_client_with_cached_token_returned(
     from nmtfast.discovery.v1.clients import create_api_client
 
     # setup a fake cached token JSON string
-    cached_token_data = {
-        "access_token": "cached_token",
-        "token_type": "Bearer",
-        "expires_in": 3600,
-    }
-    cached_token_json = json.dumps(cached_token_data)
-    mock_cache.fetch_app_cache.return_value = cached_token_json.encode("utf-8")
+    mock_cache.cached = _CACHED_TOKEN_JSON_BYTES
 
     # patch AsyncOAuth2Client and its token.is_expired() to False to simulate
     #   valid token
-    with patch("nmtfast.discovery.v1.clients.AsyncOAuth2Client") as MockOAuthClient:
-        mock_client = AsyncMock(spec=AsyncOAuth2Client)
-        mock_token = MagicMock()
-        mock_token._data = cached_token_data
-        mock_token.is_expired.return_value = False
-        mock_client.token = mock_token
-        MockOAuthClient.return_value = mock_client
-
-        http_client = await create_api_client(
-            auth=mock_auth_settings,
-            discovery=mock_discovery_settings,
-            service_name="test_service",
-            cache=mock_cache,
-        )
+    mock_client = _valid_token_oauth_client()
+    mock_client.token._data = _CACHED_TOKEN_DATA
+    mock_oauth_client_class.return_value = mock_client
 
-        # it should return the OAuth client directly using cached token
-        assert http_client is mock_client
-        mock_cache.fetch_app_cache.assert_called_once()
-        MockOAuthClient.assert_called_once()
+    http_client = await create_api_client(
+        auth=mock_auth_settings,
+        discovery=mock_discovery_settings,
+        service_name="test_service",
+        cache=mock_cache,
+    )
+
+    # it should return the OAuth client directly using cached token
+    assert http_client is mock_client
+    assert len(mock_cache.fetched) == 1
+    mock_oauth_client_class.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_create_api_client_raises_when_token_missing_access_token(
     mock_auth_settings,
     mock_discovery_settings,
     monkeypatch,
     mock_cache,
+    patch_retry_and_reload,
 ):
     # NOTE: we must load nmtfast.discovery.v1.clients functions INSIDE of the test
     #   in order for the patch_retry_and_reload() autouse fixture to intercept
@@ -564,16 +577,13 @@ async def test_create_api_client_raises_when_token_missing_access_token(
         def __init__(self, *args, **kwargs):
             pass
 
+        def register_client_auth_method(self, auth):
+            pass
+
         async def fetch_token(self):
             return {"expires_in": 3600}  # Missing 'access_token'
 
-    monkeypatch.setattr(
-        "nmtfast.discovery.v1.clients.AsyncOAuth2Client",
-        MockOAuth2Client,
-    )
-
-    # explicitly add a get() method to the mock cache
-    mock_cache.get = MagicMock(return_value=None)
+    _patch_oauth_client_class(monkeypatch, patch_retry_and_reload, MockOAuth2Client)
 
     with pytest.raises(ServiceConnectionError) as excinfo:
         await create_api_client(
@@ -586,75 +596,641 @@ async def test_create_api_client_raises_when_token_missing_access_token(
     assert "Authlib failed to retrieve token" in str(excinfo.value)
 
 
-@pytest.mark.asyncio
-async def test_create_api_client_raises_when_outgoing_client_missing(
-    mock_auth_settings, mock_discovery_settings, mock_cache
-):
+async def test_create_api_client_reuses_pooled_client(mock_auth_settings, mock_cache):
     """
-    Test create_api_client raises if outgoing client not found in auth settings.
+    Test create_api_client returns the pooled client until it is closed.
     """
-    # NOTE: we must load nmtfast.discovery.v1.clients functions INSIDE of the test
-    #   in order for the patch_retry_and_reload() autouse fixture to intercept
-    #   tenacity retry, and disable it
-    from nmtfast.discovery.v1.clients import create_api_client
+    from nmtfast.discovery.v1.clients import (
+        _running_loop_pool,
+        close_api_clients,
+        create_api_client,
+    )
+
+    service_config = DiscoveredService(
+        base_url="https://api.example.com",
+        auth_method="headers",
+        auth_principal="test_headers",
+    )
+    discovery = ServiceDiscoverySettings(services={"test_service": service_config})
 
-    # remove the outgoing client entry
-    mock_auth_settings.outgoing.clients.pop("test_client", None)
+    client1 = await create_api_client(
+        auth=mock_auth_settings,
+        discovery=discovery,
+        service_name="test_service",
+        cache=mock_cache,
+    )
+    client2 = await create_api_client(
+        auth=mock_auth_settings,
+        discovery=discovery,
+        service_name="test_service",
+        cache=mock_cache,
+    )
+    assert client1 is client2
 
-    with pytest.raises(ServiceConnectionError) as excinfo:
-        await create_api_client(
+    await close_api_clients()
+    assert client1.is_closed
+    assert _running_loop_pool().clients == {}
+
+    client3 = await create_api_client(
+        auth=mock_auth_settings,
+        discovery=discovery,
+        service_name="test_service",
+        cache=mock_cache,
+    )
+    assert client3 is not client1
+    await close_api_clients()
+
+
+async def test_create_api_client_pools_per_settings(mock_auth_settings, mock_cache):
+    """
+    Test create_api_client does not share a client between different auth settings.
+    """
+    from nmtfast.discovery.v1.clients import close_api_clients, create_api_client
+
+    discovery = ServiceDiscoverySettings(
+        services={
+            "test_service": DiscoveredService(
+                base_url="https://api.example.com",
+                auth_method="headers",
+                auth_principal="test_headers",
+            )
+        }
+    )
+    other_auth = mock_auth_settings.model_copy(deep=True)
+    other_auth.outgoing.headers["test_headers"].headers = {"X-Api-Key": "other"}
+
+    client1 = await create_api_client(
+        auth=mock_auth_settings,
+        discovery=discovery,
+        service_name="test_service",
+        cache=mock_cache,
+    )
+    client2 = await create_api_client(
+        auth=other_auth,
+        discovery=discovery,
+        service_name="test_service",
+        cache=mock_cache,
+    )
+
+    assert client2 is not client1
+    assert client2.headers["X-Api-Key"] == "other"
+    assert client1 is await create_api_client(
+        auth=mock_auth_settings,
+        discovery=discovery,
+        service_name="test_service",
+        cache=mock_cache,
+    )
+    await close_api_clients()
+
+
+def test_create_api_client_pools_per_event_loop(mock_auth_settings, mock_cache):
+    """
+    Test create_api_client keeps a separate pool for every event loop.
+
+    A client pooled on a loop that has since been closed must not be returned.
+    """
+    from nmtfast.discovery.v1 import clients
+
+    discovery = ServiceDiscoverySettings(
+        services={
+            "test_service": DiscoveredService(
+                base_url="https://api.example.com",
+                auth_method="headers",
+                auth_principal="test_headers",
+            )
+        }
+    )
+
+    async def get_client() -> httpx.AsyncClient:
+        client = await clients.create_api_client(
             auth=mock_auth_settings,
-            discovery=mock_discovery_settings,
+            discovery=discovery,
+            service_name="test_service",
+            cache=mock_cache,
+        )
+        assert client is await clients.create_api_client(
+            auth=mock_auth_settings,
+            discovery=discovery,
             service_name="test_service",
             cache=mock_cache,
         )
-    assert "test_client" in str(excinfo.value)
+        return client
 
+    client1 = asyncio.run(get_client())
+    client2 = asyncio.run(get_client())
 
-@pytest.mark.asyncio
-async def test_create_api_client_raises_when_id_provider_missing(
-    mock_auth_settings,
-    mock_discovery_settings,
-    mock_cache,
+    assert client2 is not client1
+    assert len(clients._LOOP_CLIENT_POOLS) == 1
+
+
+def _pooled_oauth_client(expires_in: float) -> MagicMock:
+    """
+    Build a mock pooled OAuth client whose token expires in the given seconds.
+    """
+    token = {"access_token": "old_token", "expires_at": time.time() + expires_in}
+    client = MagicMock()
+    client.is_closed = False
+    client.client_id = "client_id"
+    client.token = token
+    client.fetch_token = AsyncMock(return_value={"access_token": "new_token"})
+    return client
+
+
+async def test_create_api_client_fresh_token_skips_refresh(
+    mock_auth_settings, mock_discovery_settings, mock_cache
 ):
     """
-    Test create_api_client raises if ID provider not found in auth settings.
+    Test create_api_client returns a pooled client with a fresh token as-is.
     """
-    # NOTE: we must load nmtfast.discovery.v1.clients functions INSIDE of the test
-    #   in order for the patch_retry_and_reload() autouse fixture to intercept
-    #   tenacity retry, and disable it
-    from nmtfast.discovery.v1.clients import create_api_client
+    from nmtfast.discovery.v1 import clients
 
-    # remove the id provider entry so it is missing
-    mock_auth_settings.id_providers.pop("test_provider", None)
-    with pytest.raises(ServiceConnectionError) as excinfo:
-        await create_api_client(
+    pooled_client = _pooled_oauth_client(expires_in=3600)
+    pool_key = clients._client_pool_key(
+        mock_auth_settings,
+        "test_service",
+        mock_discovery_settings.services["test_service"],
+    )
+    clients._running_loop_pool().clients[pool_key] = pooled_client
+
+    client = await clients.create_api_client(
+        auth=mock_auth_settings,
+        discovery=mock_discovery_settings,
+        service_name="test_service",
+        cache=mock_cache,
+    )
+
+    assert client is pooled_client
+    assert clients._running_loop_pool().refresh_tasks == {}
+    pooled_client.fetch_token.assert_not_called()
+
+
+async def test_create_api_client_stale_token_refreshes_in_background(
+    mock_auth_settings, mock_discovery_settings, mock_cache
+):
+    """
+    Test create_api_client returns a stale client and refreshes it in the background.
+    """
+    from nmtfast.discovery.v1 import clients
+
+    pooled_client = _pooled_oauth_client(expires_in=clients.STALE_BUFFER / 2)
+    pool_key = clients._client_pool_key(
+        mock_auth_settings,
+        "test_service",
+        mock_discovery_settings.services["test_service"],
+    )
+    clients._running_loop_pool().clients[pool_key] = pooled_client
+
+    for _ in range(3):
+        client = await clients.create_api_client(
             auth=mock_auth_settings,
             discovery=mock_discovery_settings,
             service_name="test_service",
             cache=mock_cache,
         )
+        assert client is pooled_client
+
+    # NOTE: only one refresh is started, no matter how many callers see the
+    #   stale token
+    refresh_tasks = clients._running_loop_pool().refresh_tasks
+    assert len(refresh_tasks) == 1
+    await refresh_tasks[pool_key]
+
+    pooled_client.fetch_token.assert_awaited_once()
+    assert mock_cache.stored == [
+        (
+            clients.token_cache_key("test_service", "client_id"),
+            json.dumps(pooled_client.token, separators=(",", ":")),
+            -1,
+        )
+    ]
+    assert clients._running_loop_pool().refresh_tasks == {}
 
-    assert "ID Provider 'test_provider' not found" in str(excinfo.value)
 
+async def test_background_refresh_logs_failures(mock_cache, caplog):
+    """
+    Test a failed background refresh is logged instead of raised.
+    """
+    from nmtfast.discovery.v1 import clients
 
-@pytest.mark.asyncio
-async def test_create_api_client_raises_when_id_provider_missing_alt1(
-    mock_auth_settings, mock_discovery_settings, mock_cache
+    pooled_client = _pooled_oauth_client(expires_in=60)
+    pooled_client.fetch_token = AsyncMock(return_value={})
+
+    await clients._background_refresh("test_service", pooled_client, mock_cache)
+
+    assert mock_cache.stored == []
+    assert "Background token refresh failed for test_service" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "error",
+    [httpx.ConnectError("connection refused"), OAuth2Error(description="denied")],
+)
+async def test_background_refresh_logs_token_errors(mock_cache, caplog, error):
+    """
+    Test HTTP and OAuth errors during a background refresh are logged.
+    """
+    from nmtfast.discovery.v1 import clients
+
+    pooled_client = _pooled_oauth_client(expires_in=60)
+    pooled_client.fetch_token = AsyncMock(side_effect=error)
+
+    await clients._background_refresh("test_service", pooled_client, mock_cache)
+
+    assert mock_cache.stored == []
+    assert "Background token refresh failed for test_service" in caplog.text
+
+
+async def test_background_refresh_raises_other_errors(mock_cache):
+    """
+    Test a background refresh does not swallow errors other than token errors.
+    """
+    from nmtfast.discovery.v1 import clients
+
+    pooled_client = _pooled_oauth_client(expires_in=60)
+    pooled_client.fetch_token = AsyncMock(side_effect=RuntimeError("bug"))
+
+    with pytest.raises(RuntimeError):
+        await clients._background_refresh("test_service", pooled_client, mock_cache)
+
+
+def test_token_cache_key():
+    """
+    Test token cache keys are short and unique per service and client ID.
+    """
+    from nmtfast.discovery.v1.clients import CACHE_KEY_PREFIX, token_cache_key
+
+    key = token_cache_key("test_service", "client_id" * 100)
+    prefix, digest = key.rsplit(":", 1)
+
+    assert prefix == CACHE_KEY_PREFIX
+    assert len(digest) == 32
+    assert key == token_cache_key("test_service", "client_id" * 100)
+    assert key != token_cache_key("test_service", "other_client_id")
+    assert key != token_cache_key("other_service", "client_id" * 100)
+
+
+def test_httpx_timeout_is_shared(mock_service_config):
+    """
+    Test httpx.Timeout objects are built once per distinct set of values.
+    """
+    from nmtfast.discovery.v1.clients import _httpx_timeout
+
+    timeout = _httpx_timeout(mock_service_config)
+
+    assert timeout is _httpx_timeout(mock_service_config.model_copy())
+    assert timeout is not _httpx_timeout(
+        mock_service_config.model_copy(update={"connect_timeout": 2.0})
+    )
+
+
+def test_httpx_timeout_stages(mock_service_config):
+    """
+    Test stage timeouts are applied, and inherit the service timeout if unset.
+    """
+    from nmtfast.discovery.v1.clients import _httpx_timeout
+
+    timeout = _httpx_timeout(mock_service_config)
+    assert timeout.connect == 5.0
+    assert timeout.read == timeout.write == timeout.pool == 10.0
+
+    staged_config = mock_service_config.model_copy(
+        update={"read_timeout": 30.0, "write_timeout": 2.0, "pool_timeout": 1.0}
+    )
+    timeout = _httpx_timeout(staged_config)
+    assert timeout.connect == 5.0
+    assert timeout.read == 30.0
+    assert timeout.write == 2.0
+    assert timeout.pool == 1.0
+
+
+async def test_create_api_clients_prefetches_tokens(
+    mock_auth_settings, mock_cache, mock_oauth_client_class
 ):
-    # NOTE: we must load nmtfast.discovery.v1.clients functions INSIDE of the test
-    #   in order for the patch_retry_and_reload() autouse fixture to intercept
-    #   tenacity retry, and disable it
+    """
+    Test create_api_clients fetches cached tokens in one batch for all services.
+    """
+    from nmtfast.discovery.v1 import clients
+
+    discovery = ServiceDiscoverySettings(
+        services={
+            "oauth_service": DiscoveredService(
+                base_url="https://oauth.example.com",
+                auth_method="client_credentials",
+                auth_principal="test_client",
+            ),
+            "headers_service": DiscoveredService(
+                base_url="https://headers.example.com",
+                auth_method="headers",
+                auth_principal="test_headers",
+            ),
+        }
+    )
+    cached_token = {"access_token": "valid_token", "expires_at": 9999999999}
+    mock_cache.cached = json.dumps(cached_token).encode()
+
+    mock_client = _valid_token_oauth_client()
+    mock_oauth_client_class.return_value = mock_client
+
+    api_clients = await clients.create_api_clients(
+        auth=mock_auth_settings,
+        discovery=discovery,
+        service_names=["oauth_service", "headers_service"],
+        cache=mock_cache,
+    )
+
+    assert mock_cache.fetched_many == [
+        [clients.token_cache_key("oauth_service", "client_id")]
+    ]
+    assert mock_cache.fetched == []
+    assert mock_oauth_client_class.call_args.kwargs["token"] == cached_token
+    assert api_clients["oauth_service"] is mock_client
+    assert api_clients["headers_service"].base_url == "https://headers.example.com"
+    mock_client.fetch_token.assert_not_called()
+
+    await api_clients["headers_service"].aclose()
+
+
+def _wrapped(cause: Exception) -> ServiceConnectionError:
+    """
+    Build a ServiceConnectionError raised from the given cause.
+    """
+    try:
+        raise ServiceConnectionError("wrapped") from cause
+    except ServiceConnectionError as exc:
+        return exc
+
+
+@pytest.mark.parametrize(
+    "exc, expected",
+    [
+        (httpx.ConnectError("connection refused"), True),
+        (httpx.ConnectTimeout("timed out"), True),
+        (OAuth2Error(description="server_error"), True),
+        (_wrapped(httpx.ReadTimeout("timed out")), True),
+        (_wrapped(OAuth2Error(description="server_error")), True),
+        (ServiceConnectionError("Service 'x' not found in discovery settings."), False),
+        (_wrapped(KeyError("missing")), False),
+        (ValueError("bad value"), False),
+    ],
+)
+def test_is_transient_connection_error(exc, expected):
+    """
+    Test only transient connection errors are retried, and config errors fail fast.
+    """
+    from nmtfast.discovery.v1.clients import _is_transient_connection_error
+
+    assert _is_transient_connection_error(exc) is expected
+
+
+async def test_get_oauth_client_pre_encodes_basic_auth(
+    mock_service_config, mock_id_provider, mock_outgoing_client
+):
+    """
+    Test client_secret_basic uses a pre-encoded header matching Authlib's encoding.
+    """
+    from authlib.oauth2.auth import ClientAuth, encode_client_secret_basic
+
+    from nmtfast.discovery.v1.clients import get_oauth_client
+
+    client = await get_oauth_client(
+        service_config=mock_service_config,
+        id_provider=mock_id_provider,
+        client_settings=mock_outgoing_client,
+    )
+    client_auth = client.client_auth(client.token_endpoint_auth_method)
+
+    _, headers, _ = client_auth.prepare("POST", "https://auth.example.com", {}, "")
+    _, expected_headers, _ = encode_client_secret_basic(
+        ClientAuth("client_id", "client_secret"), "POST", "", {}, ""
+    )
+
+    assert client.token_endpoint_auth_method == "client_secret_basic"
+    assert headers["Authorization"] == expected_headers["Authorization"]
+    assert client_auth.auth_method is not encode_client_secret_basic
+
+    await client.aclose()
+
+
+async def test_get_oauth_client_client_secret_post(
+    mock_service_config, mock_id_provider, mock_outgoing_client
+):
+    """
+    Test other token endpoint auth methods are left to Authlib.
+    """
+    from authlib.oauth2.auth import encode_client_secret_post
+
+    from nmtfast.discovery.v1.clients import get_oauth_client
+
+    client_settings = mock_outgoing_client.model_copy(
+        update={"token_endpoint_auth_method": "client_secret_post"}
+    )
+    client = await get_oauth_client(
+        service_config=mock_service_config,
+        id_provider=mock_id_provider,
+        client_settings=client_settings,
+    )
+    client_auth = client.client_auth(client.token_endpoint_auth_method)
+
+    assert client_auth.auth_method is encode_client_secret_post
+
+    await client.aclose()
+
+
+def test_authlib_is_imported_lazily():
+    """
+    Test importing the module does not import Authlib until OAuth is needed.
+    """
+    code = (
+        "import sys\n"
+        "import nmtfast.discovery.v1.clients as clients\n"
+        "assert not any(name.startswith('authlib') for name in sys.modules)\n"
+        "assert clients._authlib().OAuth2Error.__module__.startswith('authlib')\n"
+        "assert 'authlib.integrations.httpx_client' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+async def test_create_api_client_concurrent_calls_fetch_one_token(
+    mock_auth_settings, mock_discovery_settings, mock_cache, mock_oauth_client_class
+):
+    """
+    Test concurrent callers for the same service share a single token fetch.
+    """
     from nmtfast.discovery.v1.clients import create_api_client
 
-    # remove the id provider entry
-    mock_auth_settings.id_providers.pop("test_provider", None)
-    with pytest.raises(ServiceConnectionError) as excinfo:
-        await create_api_client(
-            auth=mock_auth_settings,
-            discovery=mock_discovery_settings,
-            service_name="test_service",
-            cache=mock_cache,
+    async def fetch_token():
+        await asyncio.sleep(0.01)  # let the other callers pile up on the lock
+        return {"access_token": "test_token", "expires_in": 3600}
+
+    mock_client = AsyncMock(spec=AsyncOAuth2Client)
+    mock_client.is_closed = False
+    mock_client.fetch_token = AsyncMock(side_effect=fetch_token)
+    mock_client.token = {"access_token": "test_token", "expires_in": 3600}
+    mock_oauth_client_class.return_value = mock_client
+
+    api_clients = await asyncio.gather(
+        *(
+            create_api_client(
+                auth=mock_auth_settings,
+                discovery=mock_discovery_settings,
+                service_name="test_service",
+                cache=mock_cache,
+            )
+            for _ in range(5)
+        )
+    )
+
+    assert all(api_client is mock_client for api_client in api_clients)
+    mock_oauth_client_class.assert_called_once()
+    mock_client.fetch_token.assert_awaited_once()
+    assert len(mock_cache.stored) == 1
+
+
+def _unauthorized_transport(statuses: list[int], on_unauthorized):
+    """
+    Build an _UnauthorizedRetryTransport around a transport replying with statuses.
+    """
+    from nmtfast.discovery.v1.clients import _UnauthorizedRetryTransport
+
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("Authorization", ""))
+        return httpx.Response(statuses[len(seen) - 1])
+
+    transport = _UnauthorizedRetryTransport(
+        httpx.MockTransport(handler), on_unauthorized
+    )
+    return transport, seen
+
+
+async def test_unauthorized_retry_transport_retries_once():
+    """
+    Test a 401 response is retried exactly once with the new Authorization header.
+    """
+    on_unauthorized = AsyncMock(return_value="Bearer new_token")
+    transport, seen = _unauthorized_transport([401, 401, 200], on_unauthorized)
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.post(
+            "https://test/", json={"a": 1}, headers={"Authorization": "Bearer old"}
+        )
+
+    assert response.status_code == 401
+    assert seen == ["Bearer old", "Bearer new_token"]
+    on_unauthorized.assert_awaited_once_with("Bearer old")
+
+
+@pytest.mark.parametrize(
+    "headers, new_authorization",
+    [
+        ({}, "Bearer new_token"),
+        ({"Authorization": "Basic abc"}, "Bearer new_token"),
+        ({"Authorization": "Bearer old"}, None),
+    ],
+)
+async def test_unauthorized_retry_transport_skips_retry(headers, new_authorization):
+    """
+    Test requests without a bearer token, or without a replacement, are not retried.
+    """
+    on_unauthorized = AsyncMock(return_value=new_authorization)
+    transport, seen = _unauthorized_transport([401, 200], on_unauthorized)
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.get("https://test/", headers=headers)
+
+    assert response.status_code == 401
+    assert len(seen) == 1
+
+
+async def test_refresh_revoked_token(mock_cache):
+    """
+    Test a rejected token is cleared from the cache and replaced once.
+    """
+    from nmtfast.discovery.v1.clients import _refresh_revoked_token
+
+    new_token = {"access_token": "new_token", "expires_in": 3600}
+    oauth_client = MagicMock()
+    oauth_client.token = {"access_token": "old_token"}
+
+    async def fetch_token():
+        await asyncio.sleep(0.01)  # let the other callers pile up on the lock
+        oauth_client.token = new_token
+        return new_token
+
+    oauth_client.fetch_token = AsyncMock(side_effect=fetch_token)
+
+    results = await asyncio.gather(
+        *(
+            _refresh_revoked_token(
+                "test_service", oauth_client, mock_cache, "key", "Bearer old_token"
+            )
+            for _ in range(3)
         )
+    )
+
+    assert results == ["Bearer new_token"] * 3
+    oauth_client.fetch_token.assert_awaited_once()
+    assert mock_cache.cleared == ["key"]
+    assert mock_cache.stored == [
+        ("key", json.dumps(new_token, separators=(",", ":")), -1)
+    ]
+
+
+async def test_refresh_revoked_token_failure(mock_cache):
+    """
+    Test no Authorization header is returned when a new token cannot be fetched.
+    """
+    from nmtfast.discovery.v1.clients import _refresh_revoked_token
+
+    oauth_client = MagicMock()
+    oauth_client.token = {"access_token": "old_token"}
+    oauth_client.fetch_token = AsyncMock(side_effect=OAuth2Error("denied"))
+
+    result = await _refresh_revoked_token(
+        "test_service", oauth_client, mock_cache, "key", "Bearer old_token"
+    )
 
-    assert "ID Provider 'test_provider' not found" in str(excinfo.value)
+    assert result is None
+    assert mock_cache.stored == []
+
+
+async def test_refresh_revoked_token_raises_other_errors(mock_cache):
+    """
+    Test errors other than HTTP and OAuth errors are not swallowed.
+    """
+    from nmtfast.discovery.v1.clients import _refresh_revoked_token
+
+    oauth_client = MagicMock()
+    oauth_client.token = {"access_token": "old_token"}
+    oauth_client.fetch_token = AsyncMock(side_effect=RuntimeError("bug"))
+
+    with pytest.raises(RuntimeError):
+        await _refresh_revoked_token(
+            "test_service", oauth_client, mock_cache, "key", "Bearer old_token"
+        )
+
+
+async def test_get_oauth_client_wraps_transport_on_unauthorized(
+    mock_service_config, mock_id_provider, mock_outgoing_client, mock_oauth_client_class
+):
+    """
+    Test get_oauth_client only wraps its transport when on_unauthorized is given.
+    """
+    from nmtfast.discovery.v1.clients import (
+        _UnauthorizedRetryTransport,
+        get_oauth_client,
+    )
+
+    await get_oauth_client(mock_service_config, mock_id_provider, mock_outgoing_client)
+    transport = mock_oauth_client_class.call_args.kwargs["transport"]
+    assert isinstance(transport, httpx.AsyncHTTPTransport)
+
+    await get_oauth_client(
+        mock_service_config,
+        mock_id_provider,
+        mock_outgoing_client,
+        on_unauthorized=AsyncMock(),
+    )
+    transport = mock_oauth_client_class.call_args.kwargs["transport"]
+    assert isinstance(transport, _UnauthorizedRetryTransport)
@@ -4,6 +4,8 @@
 
 """Tests for nmtfast.errors.v1.exceptions."""
 
+from functools import lru_cache
+
 import httpx
 import pytest
 
@@ -13,14 +15,19 @@ from nmtfast.errors.v1.exceptions import (
 )
 
 
+@lru_cache(maxsize=None)
 def make_response(status_code=500, text="Server error", headers=None):
     """
     Helper to create a fake httpx.Response with given parameters.
+
+    Responses are cached per argument set; the exceptions only read from them,
+    so tests must not mutate the returned object. Pass headers as a tuple of
+    pairs to keep the arguments hashable.
     """
     return httpx.Response(
         status_code=status_code,
-        text=text,
-        headers=headers or {"x-request-id": "abc-123"},
+        content=text.encode("utf-8"),
+        headers=dict(headers) if headers else {"x-request-id": "abc-123"},
     )
 
 
@@ -37,6 +37,30 @@ def test_create_logging_config():
     assert config["root"]["level"] == logging.DEBUG
 
 
+def test_create_logging_config_is_cached():
+    """
+    Test the logging config is built once per distinct level and format.
+    """
+    config = create_logging_config(LoggingSettings(level="warning"))
+
+    assert config is create_logging_config(LoggingSettings(level="WARNING"))
+    assert config["root"]["level"] == logging.WARNING
+    assert config is not create_logging_config(
+        LoggingSettings(level="WARNING", format="%(message)s")
+    )
+
+
+def test_create_logging_config_unknown_level():
+    """
+    Test unknown log levels fall back to INFO instead of raising.
+    """
+    config = create_logging_config(LoggingSettings(level="verbose"))
+    assert config["root"]["level"] == logging.INFO
+
+    config = create_logging_config(LoggingSettings(level="basic_format"))
+    assert config["root"]["level"] == logging.INFO
+
+
 def test_request_id_filter():
     """
     Test creating a request ID and filter.
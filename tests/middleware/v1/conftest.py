@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""pytest fixtures for unit / integration tests."""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from nmtfast.middleware.v1.request_duration import RequestDurationMiddleware
+from nmtfast.middleware.v1.request_id import (
+    REQUEST_ID_CONTEXTVAR,
+    RequestIDMiddleware,
+)
+
+
+def _asgi_client(app: FastAPI) -> httpx.AsyncClient:
+    """
+    Build an in-process async client for an app.
+
+    The client address matches what TestClient reports, so remote host/port
+    assertions read the same as before.
+    """
+    transport = httpx.ASGITransport(app=app, client=("testclient", 50000))
+    return httpx.AsyncClient(transport=transport, base_url="http://testserver")
+
+
+@pytest.fixture(scope="session")
+def duration_client() -> httpx.AsyncClient:
+    """
+    Fixture providing a test client for an app using RequestDurationMiddleware.
+
+    The app is stateless, so it is built once and shared by all tests.
+    """
+    app = FastAPI()
+    app.add_middleware(RequestDurationMiddleware)
+
+    @app.get("/")
+    async def read_root():
+        return {"Hello": "World"}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for chunk in (b"a", b"b", b"c"):
+                yield chunk
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return _asgi_client(app)
+
+
+@pytest.fixture(scope="session")
+def request_id_client() -> httpx.AsyncClient:
+    """
+    Fixture providing a test client for an app using RequestIDMiddleware.
+
+    The app is stateless, so it is built once and shared by all tests.
+    """
+    app = FastAPI()
+    app.add_middleware(RequestIDMiddleware)
+
+    @app.get("/")
+    async def read_root():
+        return {"request_id": REQUEST_ID_CONTEXTVAR.get()}
+
+    return _asgi_client(app)
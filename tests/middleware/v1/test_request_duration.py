@@ -4,35 +4,66 @@
 
 """Unit tests for request duration middleware."""
 
-from unittest.mock import patch
+import logging
 
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
+import pytest
 
-from nmtfast.middleware.v1.request_duration import RequestDurationMiddleware
+LOGGER_NAME = "nmtfast.middleware.v1.request_duration"
 
 
-def test_request_duration_middleware():
+@pytest.fixture
+def duration_records(caplog):
+    """
+    Fixture capturing INFO records emitted by the request duration middleware.
+    """
+    caplog.set_level(logging.INFO, logger=LOGGER_NAME)
+
+    def records() -> list[logging.LogRecord]:
+        return [r for r in caplog.records if r.name == LOGGER_NAME]
+
+    return records
+
+
+async def test_request_duration_middleware(duration_client, duration_records):
     """
     Test whether request duration is recorded in headers.
     """
-    app = FastAPI()
-    app.add_middleware(
-        RequestDurationMiddleware,
-        remote_headers=["X-Real-IP", "X-Forwarded-For"],
-    )
-    client = TestClient(app)
+    await duration_client.get("/")
+    response = await duration_client.get("/", headers={"X-Real-IP": "1.2.3.4"})
 
-    @app.get("/")
-    async def read_root():
-        return {"Hello": "World"}
+    assert response.status_code == 200
+    assert "x-nmtfast-request-time-ms" in response.headers
+    assert len(duration_records()) == 2
 
-    with patch("logging.Logger.info") as mock_logger:
-        response = client.get("/")
 
-    with patch("logging.Logger.info") as mock_logger:
-        response = client.get("/", headers={"X-Real-IP": "1.2.3.4"})
+async def test_request_duration_middleware_streaming_response(
+    duration_client, duration_records
+):
+    """
+    Test streaming responses pass through the middleware with the duration header.
+    """
+    response = await duration_client.get(
+        "/stream", headers={"X-Forwarded-For": "5.6.7.8"}
+    )
 
     assert response.status_code == 200
+    assert response.text == "abc"
     assert "x-nmtfast-request-time-ms" in response.headers
-    assert mock_logger.called
+    assert duration_records()[-1].args[:4] == ("5.6.7.8", 50000, "GET", "/stream")
+
+
+async def test_request_duration_middleware_remote_header_priority(
+    duration_client, duration_records
+):
+    """
+    Test remote headers are matched case-insensitively, in the configured order.
+    """
+    await duration_client.get(
+        "/", headers={"x-forwarded-for": "5.6.7.8", "X-REAL-IP": "1.2.3.4"}
+    )
+
+    assert duration_records()[-1].args[0] == "1.2.3.4"
+
+    await duration_client.get("/")
+
+    assert duration_records()[-1].args[0] == "testclient"
@@ -4,35 +4,41 @@
 
 """Unit tests for request ID middleware."""
 
-from unittest.mock import patch
+import secrets
 
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
+from nmtfast.middleware.v1.request_id import REQUEST_ID_CONTEXTVAR
 
-from nmtfast.middleware.v1.request_id import RequestIDMiddleware
 
-
-def test_request_id_middleware():
+async def test_request_id_middleware(request_id_client, monkeypatch):
     """
     Test whether request ID is recorded in headers.
     """
-    app = FastAPI()
-    app.add_middleware(RequestIDMiddleware)
-    client = TestClient(app)
+    calls: list[int] = []
+
+    def fake_token_hex(nbytes: int) -> str:
+        calls.append(nbytes)
+        return fill * 128
 
-    @app.get("/")
-    async def read_root():
-        return {"Hello": "World"}
+    monkeypatch.setattr(secrets, "token_hex", fake_token_hex)
 
-    with patch("secrets.token_hex") as mock_token:
-        mock_token.return_value = "0" * 128
-        response = client.get("/")
+    fill = "0"
+    response = await request_id_client.get("/")
 
     assert response.status_code == 200
     assert response.headers["x-nmtfast-request-id"] == "R00000"
+    assert calls == [3]
 
-    with patch("secrets.token_hex") as mock_token2:
-        mock_token2.return_value = "1" * 128
-        response = client.get("/")
+    fill = "1"
+    response = await request_id_client.get("/")
 
     assert response.headers["x-nmtfast-request-id"] == "R11111"
+
+
+async def test_request_id_middleware_sets_contextvar(request_id_client):
+    """
+    Test the request ID is visible to the endpoint, and reset after the request.
+    """
+    response = await request_id_client.get("/")
+
+    assert response.json()["request_id"] == response.headers["x-nmtfast-request-id"]
+    assert REQUEST_ID_CONTEXTVAR.get() is None
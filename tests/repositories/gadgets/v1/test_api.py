@@ -4,6 +4,8 @@
 
 """Tests for gadget repository methods."""
 
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock
 
 import httpx
@@ -29,6 +31,26 @@ def fake_api_client():
     return client
 
 
+def _resp(
+    status_code: int,
+    payload: Any = None,
+    text: str = "",
+    headers: dict[str, str] | None = None,
+) -> SimpleNamespace:
+    """
+    Build a stand-in for the httpx.Response returned by the fake API client.
+
+    Only status_code, text, headers and json() are read by the repository, so the
+    payload is handed back as-is instead of being serialized into a real response.
+    """
+    return SimpleNamespace(
+        status_code=status_code,
+        text=text,
+        headers=httpx.Headers(headers),
+        json=lambda **_: payload,
+    )
+
+
 @pytest.mark.asyncio
 async def test_gadget_create_success(fake_api_client):
     """
@@ -39,11 +61,7 @@ async def test_gadget_create_success(fake_api_client):
 
     mock_response = GadgetRead(id="g1", name="test").model_dump()
 
-    fake_api_client.post.return_value = httpx.Response(
-        status_code=201,
-        json=mock_response,
-    )
-    fake_api_client.post.return_value.json = lambda **kwargs: mock_response
+    fake_api_client.post.return_value = _resp(201, mock_response)
 
     gadget_out = await repo.gadget_create(gadget_in)
     assert isinstance(gadget_out, GadgetRead)
@@ -58,9 +76,7 @@ async def test_gadget_create_failure_raises(fake_api_client):
     repo = GadgetApiRepository(fake_api_client)
     gadget_in = GadgetCreate(name="fail")
 
-    fake_api_client.post.return_value = httpx.Response(
-        status_code=400, text="Bad request"
-    )
+    fake_api_client.post.return_value = _resp(400, text="Bad request")
 
     with pytest.raises(GadgetApiException):
         await repo.gadget_create(gadget_in)
@@ -74,11 +90,7 @@ async def test_get_by_id_success(fake_api_client):
     repo = GadgetApiRepository(fake_api_client)
     mock_response = GadgetRead(id="g2", name="found").model_dump()
 
-    fake_api_client.get.return_value = httpx.Response(
-        status_code=200,
-        json=mock_response,
-    )
-    fake_api_client.get.return_value.json = lambda **kwargs: mock_response
+    fake_api_client.get.return_value = _resp(200, mock_response)
 
     gadget = await repo.get_by_id("g2")
     assert isinstance(gadget, GadgetRead)
@@ -91,7 +103,7 @@ async def test_get_by_id_failure_raises(fake_api_client):
     Test get_by_id raises GadgetApiException on failure.
     """
     repo = GadgetApiRepository(fake_api_client)
-    fake_api_client.get.return_value = httpx.Response(status_code=404, text="Not found")
+    fake_api_client.get.return_value = _resp(404, text="Not found")
 
     with pytest.raises(GadgetApiException):
         await repo.get_by_id("missing")
@@ -108,10 +120,9 @@ async def test_get_all_success(fake_api_client):
         GadgetRead(id="g2", name="b").model_dump(),
     ]
 
-    resp = httpx.Response(status_code=200, json=mock_list)
-    resp.json = lambda **kwargs: mock_list
-    resp.headers["X-Total-Count"] = "5"
-    fake_api_client.get.return_value = resp
+    fake_api_client.get.return_value = _resp(
+        200, mock_list, headers={"X-Total-Count": "5"}
+    )
 
     gadgets, pagination = await repo.get_all(page=1, page_size=2)
     assert len(gadgets) == 2
@@ -128,10 +139,9 @@ async def test_get_all_with_search(fake_api_client):
     repo = GadgetApiRepository(fake_api_client)
     mock_list = [GadgetRead(id="g1", name="match").model_dump()]
 
-    resp = httpx.Response(status_code=200, json=mock_list)
-    resp.json = lambda **kwargs: mock_list
-    resp.headers["X-Total-Count"] = "1"
-    fake_api_client.get.return_value = resp
+    fake_api_client.get.return_value = _resp(
+        200, mock_list, headers={"X-Total-Count": "1"}
+    )
 
     gadgets, pagination = await repo.get_all(search="match")
     assert len(gadgets) == 1
@@ -145,9 +155,7 @@ async def test_get_all_failure_raises(fake_api_client):
     Test get_all raises GadgetApiException on failure.
     """
     repo = GadgetApiRepository(fake_api_client)
-    fake_api_client.get.return_value = httpx.Response(
-        status_code=500, text="Server error"
-    )
+    fake_api_client.get.return_value = _resp(500, text="Server error")
 
     with pytest.raises(GadgetApiException):
         await repo.get_all()
@@ -162,11 +170,7 @@ async def test_gadget_update_success(fake_api_client):
     data = GadgetUpdate(name="updated")
     mock_response = GadgetRead(id="g1", name="updated").model_dump()
 
-    fake_api_client.patch.return_value = httpx.Response(
-        status_code=200,
-        json=mock_response,
-    )
-    fake_api_client.patch.return_value.json = lambda **kwargs: mock_response
+    fake_api_client.patch.return_value = _resp(200, mock_response)
 
     gadget = await repo.gadget_update("g1", data)
     assert isinstance(gadget, GadgetRead)
@@ -181,9 +185,7 @@ async def test_gadget_update_failure_raises(fake_api_client):
     repo = GadgetApiRepository(fake_api_client)
     data = GadgetUpdate(name="fail")
 
-    fake_api_client.patch.return_value = httpx.Response(
-        status_code=400, text="Bad request"
-    )
+    fake_api_client.patch.return_value = _resp(400, text="Bad request")
 
     with pytest.raises(GadgetApiException):
         await repo.gadget_update("g1", data)
@@ -195,7 +197,7 @@ async def test_gadget_delete_success(fake_api_client):
     Test successful gadget delete.
     """
     repo = GadgetApiRepository(fake_api_client)
-    fake_api_client.delete.return_value = httpx.Response(status_code=204)
+    fake_api_client.delete.return_value = _resp(204)
 
     await repo.gadget_delete("g1")
     fake_api_client.delete.assert_called_once()
@@ -207,9 +209,7 @@ async def test_gadget_delete_failure_raises(fake_api_client):
     Test gadget_delete raises GadgetApiException on failure.
     """
     repo = GadgetApiRepository(fake_api_client)
-    fake_api_client.delete.return_value = httpx.Response(
-        status_code=404, text="Not found"
-    )
+    fake_api_client.delete.return_value = _resp(404, text="Not found")
 
     with pytest.raises(GadgetApiException):
         await repo.gadget_delete("missing")
@@ -223,11 +223,7 @@ async def test_gadget_bulk_delete_success(fake_api_client):
     repo = GadgetApiRepository(fake_api_client)
     mock_response = {"deleted": 3}
 
-    fake_api_client.post.return_value = httpx.Response(
-        status_code=200,
-        json=mock_response,
-    )
-    fake_api_client.post.return_value.json = lambda **kwargs: mock_response
+    fake_api_client.post.return_value = _resp(200, mock_response)
 
     deleted = await repo.gadget_bulk_delete(["g1", "g2", "g3"])
     assert deleted == 3
@@ -239,9 +235,7 @@ async def test_gadget_bulk_delete_failure_raises(fake_api_client):
     Test gadget_bulk_delete raises GadgetApiException on failure.
     """
     repo = GadgetApiRepository(fake_api_client)
-    fake_api_client.post.return_value = httpx.Response(
-        status_code=400, text="Bad request"
-    )
+    fake_api_client.post.return_value = _resp(400, text="Bad request")
 
     with pytest.raises(GadgetApiException):
         await repo.gadget_bulk_delete(["g1"])
@@ -256,11 +250,7 @@ async def test_gadget_bulk_update_success(fake_api_client):
     data = GadgetUpdate(name="bulk")
     mock_response = {"updated": 2}
 
-    fake_api_client.post.return_value = httpx.Response(
-        status_code=200,
-        json=mock_response,
-    )
-    fake_api_client.post.return_value.json = lambda **kwargs: mock_response
+    fake_api_client.post.return_value = _resp(200, mock_response)
 
     updated = await repo.gadget_bulk_update(["g1", "g2"], data)
     assert updated == 2
@@ -274,9 +264,7 @@ async def test_gadget_bulk_update_failure_raises(fake_api_client):
     repo = GadgetApiRepository(fake_api_client)
     data = GadgetUpdate(name="fail")
 
-    fake_api_client.post.return_value = httpx.Response(
-        status_code=400, text="Bad request"
-    )
+    fake_api_client.post.return_value = _resp(400, text="Bad request")
 
     with pytest.raises(GadgetApiException):
         await repo.gadget_bulk_update(["g1"], data)
@@ -297,11 +285,7 @@ async def test_gadget_zap_success(fake_api_client):
         runtime=0,
     ).model_dump()
 
-    fake_api_client.post.return_value = httpx.Response(
-        status_code=202,
-        json=mock_response,
-    )
-    fake_api_client.post.return_value.json = lambda **kwargs: mock_response
+    fake_api_client.post.return_value = _resp(202, mock_response)
 
     task = await repo.gadget_zap("g1", payload)
     assert isinstance(task, GadgetZapTask)
@@ -316,7 +300,7 @@ async def test_gadget_zap_failure_raises(fake_api_client):
     repo = GadgetApiRepository(fake_api_client)
     payload = GadgetZap(duration=10)
 
-    fake_api_client.post.return_value = httpx.Response(status_code=400, text="Bad zap")
+    fake_api_client.post.return_value = _resp(400, text="Bad zap")
 
     with pytest.raises(GadgetApiException):
         await repo.gadget_zap("g1", payload)
@@ -336,11 +320,7 @@ async def test_gadget_zap_by_uuid_success(fake_api_client):
         runtime=123,
     ).model_dump()
 
-    fake_api_client.get.return_value = httpx.Response(
-        status_code=200,
-        json=mock_response_data,
-    )
-    fake_api_client.get.return_value.json = lambda **kwargs: mock_response_data
+    fake_api_client.get.return_value = _resp(200, mock_response_data)
 
     task = await repo.gadget_zap_by_uuid("g1", "uuid-456")
 
@@ -355,7 +335,7 @@ async def test_gadget_zap_by_uuid_failure_raises(fake_api_client):
     Test gadget_zap_by_uuid raises GadgetApiException on failure.
     """
     repo = GadgetApiRepository(fake_api_client)
-    fake_api_client.get.return_value = httpx.Response(status_code=404, text="Not found")
+    fake_api_client.get.return_value = _resp(404, text="Not found")
 
     with pytest.raises(GadgetApiException):
         await repo.gadget_zap_by_uuid("g1", "uuid-999")
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""pytest fixtures for widget repository tests."""
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from nmtfast.repositories.widgets.v1.api import WidgetApiRepository
+
+
+@pytest.fixture(scope="session")
+def _fake_api_client_template() -> AsyncMock:
+    """
+    Fixture building the spec'd httpx.AsyncClient mock once per session.
+
+    Building the spec walks the whole httpx.AsyncClient surface, which is far more
+    expensive than resetting an existing mock.
+    """
+    return AsyncMock(spec=httpx.AsyncClient)
+
+
+@pytest.fixture
+def fake_api_client(_fake_api_client_template: AsyncMock) -> AsyncMock:
+    """
+    Create a fake httpx.AsyncClient mock, cleared of any earlier test's state.
+    """
+    _fake_api_client_template.reset_mock(return_value=True, side_effect=True)
+    return _fake_api_client_template
+
+
+@pytest.fixture
+def repo(fake_api_client: AsyncMock) -> WidgetApiRepository:
+    """
+    Create a WidgetApiRepository backed by the fake httpx.AsyncClient.
+    """
+    return WidgetApiRepository(fake_api_client)
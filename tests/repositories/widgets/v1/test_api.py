@@ -4,13 +4,13 @@
 
 """Tests for widget repository methods."""
 
-from unittest.mock import AsyncMock
+from types import SimpleNamespace
+from typing import Any
 
 import httpx
 import pytest
 
 from nmtfast.htmx.v1.schemas import PaginationMeta
-from nmtfast.repositories.widgets.v1.api import WidgetApiRepository
 from nmtfast.repositories.widgets.v1.exceptions import WidgetApiException
 from nmtfast.repositories.widgets.v1.schemas import (
     WidgetCreate,
@@ -21,130 +21,150 @@ from nmtfast.repositories.widgets.v1.schemas import (
     WidgetZapTaskRead,
 )
 
-
-@pytest.fixture
-def fake_api_client():
-    """
-    Create a fake httpx.AsyncClient mock.
-    """
-    client = AsyncMock(spec=httpx.AsyncClient)
-    return client
-
-
-@pytest.mark.asyncio
-async def test_widget_create_success(fake_api_client):
-    """
-    Test successful widget creation.
-    """
-    repo = WidgetApiRepository(fake_api_client)
-    widget_in = WidgetCreate(name="test")
-
-    mock_response = WidgetRead(id=1, name="test").model_dump()
-
-    fake_api_client.post.return_value = httpx.Response(
-        status_code=201,
-        json=mock_response,
+# NOTE: the tests only await mocks, so they can all share one session-scoped event
+#   loop instead of starting a new loop for every test
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# NOTE: canned upstream payloads are plain dicts, so building them needs no pydantic
+#   validation; the repository still parses them into models under test
+_WIDGET_CREATED: dict = {"id": 1, "name": "test"}
+_WIDGET_FOUND: dict = {"id": 2, "name": "found"}
+_WIDGET_UPDATED: dict = {"id": 1, "name": "updated"}
+_WIDGET_PAGE: list[dict] = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+_WIDGET_MATCHES: list[dict] = [{"id": 1, "name": "match"}]
+_ZAP_PENDING: dict = {
+    "uuid": "uuid-123",
+    "state": "PENDING",
+    "widget_id": 1,
+    "duration": 10,
+    "runtime": 0,
+}
+_ZAP_SUCCESS: dict = {
+    "uuid": "uuid-456",
+    "state": "SUCCESS",
+    "widget_id": 1,
+    "duration": 10,
+    "runtime": 123,
+}
+
+
+def _resp(
+    status_code: int,
+    payload: Any = None,
+    text: str = "",
+    headers: dict[str, str] | None = None,
+) -> SimpleNamespace:
+    """
+    Build a stand-in for the httpx.Response returned by the fake API client.
+
+    The repository only reads status_code, text, headers and json(), so this avoids
+    httpx.Response's content encoding and header processing.
+    """
+    return SimpleNamespace(
+        status_code=status_code,
+        text=text,
+        headers=httpx.Headers(headers),
+        json=lambda **_: payload,
     )
-    fake_api_client.post.return_value.json = lambda **kwargs: mock_response
 
-    widget_out = await repo.widget_create(widget_in)
-    assert isinstance(widget_out, WidgetRead)
-    assert widget_out.id == 1
-
-
-@pytest.mark.asyncio
-async def test_widget_create_failure_raises(fake_api_client):
-    """
-    Test widget_create raises WidgetApiException on failure.
-    """
-    repo = WidgetApiRepository(fake_api_client)
-    widget_in = WidgetCreate(name="fail")
-
-    fake_api_client.post.return_value = httpx.Response(
-        status_code=400, text="Bad request"
-    )
-
-    with pytest.raises(WidgetApiException):
-        await repo.widget_create(widget_in)
 
-
-@pytest.mark.asyncio
-async def test_get_by_id_success(fake_api_client):
+# NOTE: (method, args, client method, success status, payload, model, failure status)
+#   for repository methods that return a single parsed model
+_SINGLE_ITEM_CASES = [
+    pytest.param(
+        "widget_create",
+        (WidgetCreate(name="test"),),
+        "post",
+        201,
+        _WIDGET_CREATED,
+        WidgetRead,
+        400,
+        id="widget_create",
+    ),
+    pytest.param(
+        "get_by_id", (2,), "get", 200, _WIDGET_FOUND, WidgetRead, 404, id="get_by_id"
+    ),
+    pytest.param(
+        "widget_zap",
+        (1, WidgetZap(duration=10)),
+        "post",
+        202,
+        _ZAP_PENDING,
+        WidgetZapTask,
+        400,
+        id="widget_zap",
+    ),
+    pytest.param(
+        "widget_zap_by_uuid",
+        (1, "uuid-456"),
+        "get",
+        200,
+        _ZAP_SUCCESS,
+        WidgetZapTask,
+        404,
+        id="widget_zap_by_uuid",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "method, args, client_method, ok_status, payload, model, bad_status",
+    _SINGLE_ITEM_CASES,
+)
+async def test_single_item_success(
+    fake_api_client,
+    repo,
+    method,
+    args,
+    client_method,
+    ok_status,
+    payload,
+    model,
+    bad_status,
+):
     """
-    Test successful get_by_id.
+    Test repository methods parse a successful upstream response into a model.
     """
-    repo = WidgetApiRepository(fake_api_client)
-    mock_response = WidgetRead(id=2, name="found").model_dump()
+    getattr(fake_api_client, client_method).return_value = _resp(ok_status, payload)
 
-    fake_api_client.get.return_value = httpx.Response(
-        status_code=200,
-        json=mock_response,
-    )
-    fake_api_client.get.return_value.json = lambda **kwargs: mock_response
+    result = await getattr(repo, method)(*args)
 
-    widget = await repo.get_by_id(2)
-    assert isinstance(widget, WidgetRead)
-    assert widget.id == 2
+    assert isinstance(result, model)
+    assert result.model_dump(include=set(payload)) == payload
 
 
-@pytest.mark.asyncio
-async def test_get_by_id_failure_raises(fake_api_client):
-    """
-    Test get_by_id raises WidgetApiException on failure.
-    """
-    repo = WidgetApiRepository(fake_api_client)
-    fake_api_client.get.return_value = httpx.Response(status_code=404, text="Not found")
+@pytest.mark.parametrize(
+    "method, args, client_method, ok_status, payload, model, bad_status",
+    _SINGLE_ITEM_CASES,
+)
+async def test_single_item_failure_raises(
+    fake_api_client,
+    repo,
+    method,
+    args,
+    client_method,
+    ok_status,
+    payload,
+    model,
+    bad_status,
+):
+    """
+    Test repository methods raise WidgetApiException on a failed upstream response.
+    """
+    client_call = getattr(fake_api_client, client_method)
+    client_call.return_value = _resp(bad_status, text="Bad request")
 
     with pytest.raises(WidgetApiException):
-        await repo.get_by_id(999)
-
-
-@pytest.mark.asyncio
-async def test_widget_zap_success(fake_api_client):
-    """
-    Test successful widget_zap.
-    """
-    repo = WidgetApiRepository(fake_api_client)
-    payload = WidgetZap(duration=10)
-    mock_response = WidgetZapTask(
-        uuid="uuid-123",
-        state="PENDING",
-        widget_id=1,
-        duration=10,
-        runtime=0,
-    ).model_dump()
-
-    fake_api_client.post.return_value = httpx.Response(
-        status_code=202,
-        json=mock_response,
-    )
-    fake_api_client.post.return_value.json = lambda **kwargs: mock_response
-
-    task = await repo.widget_zap(1, payload)
-    assert isinstance(task, WidgetZapTask)
-    assert task.uuid == "uuid-123"
-
-
-@pytest.mark.asyncio
-async def test_widget_zap_failure_raises(fake_api_client):
-    """
-    Test widget_zap raises WidgetApiException on failure.
-    """
-    repo = WidgetApiRepository(fake_api_client)
-    payload = WidgetZap(duration=10)
+        await getattr(repo, method)(*args)
 
-    fake_api_client.post.return_value = httpx.Response(status_code=400, text="Bad zap")
+    # NOTE: client errors are not transient, so they must not be retried
+    client_call.assert_awaited_once()
 
-    with pytest.raises(WidgetApiException):
-        await repo.widget_zap(1, payload)
 
-
-@pytest.mark.asyncio
-async def test_widget_zap_history_success(fake_api_client):
+async def test_widget_zap_history_success(fake_api_client, repo):
     """
     Test successful widget_zap_history.
     """
-    repo = WidgetApiRepository(fake_api_client)
     mock_list = [
         {
             "task_uuid": "task-1",
@@ -164,10 +184,9 @@ async def test_widget_zap_history_success(fake_api_client):
         },
     ]
 
-    resp = httpx.Response(status_code=200, json=mock_list)
-    resp.json = lambda **kwargs: mock_list
-    resp.headers["X-Total-Count"] = "2"
-    fake_api_client.get.return_value = resp
+    fake_api_client.get.return_value = _resp(
+        200, mock_list, headers={"X-Total-Count": "2"}
+    )
 
     tasks, pagination = await repo.widget_zap_history(1)
     assert len(tasks) == 2
@@ -182,12 +201,10 @@ async def test_widget_zap_history_success(fake_api_client):
     assert pagination.sort_order == "desc"
 
 
-@pytest.mark.asyncio
-async def test_widget_zap_history_with_search(fake_api_client):
+async def test_widget_zap_history_with_search(fake_api_client, repo):
     """
     Test widget_zap_history passes search parameter.
     """
-    repo = WidgetApiRepository(fake_api_client)
     mock_list = [
         {
             "task_uuid": "task-3",
@@ -199,10 +216,9 @@ async def test_widget_zap_history_with_search(fake_api_client):
         }
     ]
 
-    resp = httpx.Response(status_code=200, json=mock_list)
-    resp.json = lambda **kwargs: mock_list
-    resp.headers["X-Total-Count"] = "1"
-    fake_api_client.get.return_value = resp
+    fake_api_client.get.return_value = _resp(
+        200, mock_list, headers={"X-Total-Count": "1"}
+    )
 
     tasks, pagination = await repo.widget_zap_history(1, search="FAILED")
     assert len(tasks) == 1
@@ -213,74 +229,25 @@ async def test_widget_zap_history_with_search(fake_api_client):
     assert call_kwargs.kwargs["params"]["sort_order"] == "desc"
 
 
-@pytest.mark.asyncio
-async def test_widget_zap_history_failure_raises(fake_api_client):
+async def test_widget_zap_history_failure_raises(fake_api_client, repo):
     """
     Test widget_zap_history raises WidgetApiException on failure.
     """
-    repo = WidgetApiRepository(fake_api_client)
-    fake_api_client.get.return_value = httpx.Response(
-        status_code=500, text="Server error"
-    )
+    fake_api_client.get.return_value = _resp(500, text="Server error")
 
     with pytest.raises(WidgetApiException):
         await repo.widget_zap_history(999)
 
 
-@pytest.mark.asyncio
-async def test_widget_zap_by_uuid_success(fake_api_client):
-    """
-    Test successful widget_zap_by_uuid.
-    """
-    repo = WidgetApiRepository(fake_api_client)
-    mock_response_data = WidgetZapTask(
-        uuid="uuid-456",
-        state="SUCCESS",
-        widget_id=1,
-        duration=10,
-        runtime=123,
-    ).model_dump()
-
-    fake_api_client.get.return_value = httpx.Response(
-        status_code=200,
-        json=mock_response_data,
-    )
-    fake_api_client.get.return_value.json = lambda **kwargs: mock_response_data
-
-    task = await repo.widget_zap_by_uuid(1, "uuid-456")
-
-    assert isinstance(task, WidgetZapTask)
-    assert task.uuid == "uuid-456"
-    assert task.state == "SUCCESS"
-
-
-@pytest.mark.asyncio
-async def test_widget_zap_by_uuid_failure_raises(fake_api_client):
-    """
-    Test widget_zap_by_uuid raises WidgetApiException on failure.
-    """
-    repo = WidgetApiRepository(fake_api_client)
-    fake_api_client.get.return_value = httpx.Response(status_code=404, text="Not found")
-
-    with pytest.raises(WidgetApiException):
-        await repo.widget_zap_by_uuid(1, "uuid-999")
-
-
-@pytest.mark.asyncio
-async def test_get_all_success(fake_api_client):
+async def test_get_all_success(fake_api_client, repo):
     """
     Test successful get_all with pagination.
     """
-    repo = WidgetApiRepository(fake_api_client)
-    mock_list = [
-        WidgetRead(id=1, name="a").model_dump(),
-        WidgetRead(id=2, name="b").model_dump(),
-    ]
+    mock_list = _WIDGET_PAGE
 
-    resp = httpx.Response(status_code=200, json=mock_list)
-    resp.json = lambda **kwargs: mock_list
-    resp.headers["X-Total-Count"] = "5"
-    fake_api_client.get.return_value = resp
+    fake_api_client.get.return_value = _resp(
+        200, mock_list, headers={"X-Total-Count": "5"}
+    )
 
     widgets, pagination = await repo.get_all(page=1, page_size=2)
     assert len(widgets) == 2
@@ -289,18 +256,15 @@ async def test_get_all_success(fake_api_client):
     assert pagination.page_size == 2
 
 
-@pytest.mark.asyncio
-async def test_get_all_with_search(fake_api_client):
+async def test_get_all_with_search(fake_api_client, repo):
     """
     Test get_all passes search parameter.
     """
-    repo = WidgetApiRepository(fake_api_client)
-    mock_list = [WidgetRead(id=1, name="match").model_dump()]
+    mock_list = _WIDGET_MATCHES
 
-    resp = httpx.Response(status_code=200, json=mock_list)
-    resp.json = lambda **kwargs: mock_list
-    resp.headers["X-Total-Count"] = "1"
-    fake_api_client.get.return_value = resp
+    fake_api_client.get.return_value = _resp(
+        200, mock_list, headers={"X-Total-Count": "1"}
+    )
 
     widgets, pagination = await repo.get_all(search="match")
     assert len(widgets) == 1
@@ -308,144 +272,104 @@ async def test_get_all_with_search(fake_api_client):
     assert call_kwargs.kwargs["params"]["search"] == "match"
 
 
-@pytest.mark.asyncio
-async def test_get_all_failure_raises(fake_api_client):
+async def test_get_all_failure_raises(fake_api_client, repo):
     """
     Test get_all raises WidgetApiException on failure.
     """
-    repo = WidgetApiRepository(fake_api_client)
-    fake_api_client.get.return_value = httpx.Response(
-        status_code=500, text="Server error"
-    )
+    fake_api_client.get.return_value = _resp(500, text="Server error")
 
     with pytest.raises(WidgetApiException):
         await repo.get_all()
 
 
-@pytest.mark.asyncio
-async def test_widget_update_success(fake_api_client):
+async def test_widget_update_success(fake_api_client, repo):
     """
     Test successful widget update.
     """
-    repo = WidgetApiRepository(fake_api_client)
     data = WidgetUpdate(name="updated")
-    mock_response = WidgetRead(id=1, name="updated").model_dump()
+    mock_response = _WIDGET_UPDATED
 
-    fake_api_client.patch.return_value = httpx.Response(
-        status_code=200,
-        json=mock_response,
-    )
-    fake_api_client.patch.return_value.json = lambda **kwargs: mock_response
+    fake_api_client.patch.return_value = _resp(200, mock_response)
 
     widget = await repo.widget_update(1, data)
     assert isinstance(widget, WidgetRead)
     assert widget.name == "updated"
 
 
-@pytest.mark.asyncio
-async def test_widget_update_failure_raises(fake_api_client):
+async def test_widget_update_failure_raises(fake_api_client, repo):
     """
     Test widget_update raises WidgetApiException on failure.
     """
-    repo = WidgetApiRepository(fake_api_client)
     data = WidgetUpdate(name="fail")
 
-    fake_api_client.patch.return_value = httpx.Response(
-        status_code=400, text="Bad request"
-    )
+    fake_api_client.patch.return_value = _resp(400, text="Bad request")
 
     with pytest.raises(WidgetApiException):
         await repo.widget_update(1, data)
 
 
-@pytest.mark.asyncio
-async def test_widget_delete_success(fake_api_client):
+async def test_widget_delete_success(fake_api_client, repo):
     """
     Test successful widget delete.
     """
-    repo = WidgetApiRepository(fake_api_client)
-    fake_api_client.delete.return_value = httpx.Response(status_code=204)
+    fake_api_client.delete.return_value = _resp(204)
 
     await repo.widget_delete(1)
     fake_api_client.delete.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_widget_delete_failure_raises(fake_api_client):
+async def test_widget_delete_failure_raises(fake_api_client, repo):
     """
     Test widget_delete raises WidgetApiException on failure.
     """
-    repo = WidgetApiRepository(fake_api_client)
-    fake_api_client.delete.return_value = httpx.Response(
-        status_code=404, text="Not found"
-    )
+    fake_api_client.delete.return_value = _resp(404, text="Not found")
 
     with pytest.raises(WidgetApiException):
         await repo.widget_delete(999)
 
 
-@pytest.mark.asyncio
-async def test_widget_bulk_delete_success(fake_api_client):
+async def test_widget_bulk_delete_success(fake_api_client, repo):
     """
     Test successful bulk delete.
     """
-    repo = WidgetApiRepository(fake_api_client)
     mock_response = {"deleted": 3}
 
-    fake_api_client.post.return_value = httpx.Response(
-        status_code=200,
-        json=mock_response,
-    )
-    fake_api_client.post.return_value.json = lambda **kwargs: mock_response
+    fake_api_client.post.return_value = _resp(200, mock_response)
 
     deleted = await repo.widget_bulk_delete([1, 2, 3])
     assert deleted == 3
 
 
-@pytest.mark.asyncio
-async def test_widget_bulk_delete_failure_raises(fake_api_client):
+async def test_widget_bulk_delete_failure_raises(fake_api_client, repo):
     """
     Test widget_bulk_delete raises WidgetApiException on failure.
     """
-    repo = WidgetApiRepository(fake_api_client)
-    fake_api_client.post.return_value = httpx.Response(
-        status_code=400, text="Bad request"
-    )
+    fake_api_client.post.return_value = _resp(400, text="Bad request")
 
     with pytest.raises(WidgetApiException):
         await repo.widget_bulk_delete([1])
 
 
-@pytest.mark.asyncio
-async def test_widget_bulk_update_success(fake_api_client):
+async def test_widget_bulk_update_success(fake_api_client, repo):
     """
     Test successful bulk update.
     """
-    repo = WidgetApiRepository(fake_api_client)
     data = WidgetUpdate(name="bulk")
     mock_response = {"updated": 2}
 
-    fake_api_client.post.return_value = httpx.Response(
-        status_code=200,
-        json=mock_response,
-    )
-    fake_api_client.post.return_value.json = lambda **kwargs: mock_response
+    fake_api_client.post.return_value = _resp(200, mock_response)
 
     updated = await repo.widget_bulk_update([1, 2], data)
     assert updated == 2
 
 
-@pytest.mark.asyncio
-async def test_widget_bulk_update_failure_raises(fake_api_client):
+async def test_widget_bulk_update_failure_raises(fake_api_client, repo):
     """
     Test widget_bulk_update raises WidgetApiException on failure.
     """
-    repo = WidgetApiRepository(fake_api_client)
     data = WidgetUpdate(name="fail")
 
-    fake_api_client.post.return_value = httpx.Response(
-        status_code=400, text="Bad request"
-    )
+    fake_api_client.post.return_value = _resp(400, text="Bad request")
 
     with pytest.raises(WidgetApiException):
         await repo.widget_bulk_update([1], data)
@@ -2,23 +2,54 @@
 # Copyright (c) 2025. All rights reserved.
 # Licensed under the MIT License. See LICENSE file in the project root for details.
 
-"""Tests for tenacity_retry_log helper."""
+"""Tests for tenacity retry helpers."""
 
 import logging
-from unittest.mock import MagicMock, PropertyMock
-
-from tenacity import Future, stop_after_attempt
-
-from nmtfast.retry.v1.tenacity import tenacity_retry_log
+from types import SimpleNamespace
+from typing import Callable
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import ResponseError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+from tenacity import Future, retry, stop_after_attempt
+from tenacity.stop import stop_base
+
+from nmtfast.errors.v1.exceptions import BaseUpstreamRepositoryException
+from nmtfast.retry.v1.tenacity import (
+    is_transient_upstream_error,
+    redis_retry,
+    tenacity_retry_log,
+)
+
+# NOTE: stop strategies are never mutated, so one instance serves every test
+_STOP_3 = stop_after_attempt(3)
+
+
+def _retry_state(
+    outcome: Future | None,
+    attempt_number: int = 1,
+    fn: Callable | None = None,
+    stop: stop_base | None = None,
+) -> SimpleNamespace:
+    """
+    Build a stand-in for the tenacity RetryCallState read by tenacity_retry_log.
+    """
+    return SimpleNamespace(
+        attempt_number=attempt_number,
+        outcome=outcome,
+        fn=fn,
+        retry_object=SimpleNamespace(stop=stop),
+    )
 
 
 def test_none_outcome(mock_logger):
     """
     Test when outcome is None.
     """
-    retry_state = MagicMock()
-    retry_state.attempt_number = 1
-    retry_state.outcome = None
+    retry_state = _retry_state(outcome=None)
 
     tenacity_retry_log(mock_logger)(retry_state)
 
@@ -27,55 +58,156 @@ def test_none_outcome(mock_logger):
     )
 
 
-def test_with_exception(mock_logger):
+def _raise_error(message: str) -> None:
     """
-    Test normal exception case.
+    Raise a ValueError, to produce a real traceback.
     """
-    # Create a simple mock exception
-    mock_exc = MagicMock(spec=Exception)
-    mock_exc.__str__.return_value = "Test error"
+    raise ValueError(message)
 
-    # Mock traceback as properties
-    type(mock_exc).__traceback__ = PropertyMock(
-        return_value=MagicMock(tb_frame=MagicMock(), tb_lineno=42)
-    )
 
-    outcome = MagicMock(spec=Future)
-    outcome.exception.return_value = mock_exc
+def _failed_outcome(message: str) -> Future:
+    """
+    Build a failed tenacity outcome holding a raised exception.
+    """
+    outcome = Future(attempt_number=1)
+    try:
+        _raise_error(message)
+    except ValueError as exc:
+        outcome.set_exception(exc)
+    return outcome
+
 
-    retry_state = MagicMock()
-    retry_state.attempt_number = 1
-    retry_state.outcome = outcome
-    retry_state.fn = None
-    retry_state.retry_object.stop = stop_after_attempt(3)
+def test_with_exception(mock_logger):
+    """
+    Test normal exception case.
+    """
+    retry_state = _retry_state(outcome=_failed_outcome("Test error"), stop=_STOP_3)
 
     tenacity_retry_log(mock_logger)(retry_state)
 
-    assert "Retry 1 of 3" in mock_logger.log.call_args[0][1]
-    assert "Test error" in mock_logger.log.call_args[0][1]
+    message = mock_logger.log.call_args[0][1]
+    assert "Retry 1 of 3" in message
+    assert "Test error" in message
+
+    # NOTE: without a decorated function, the raising function is the call site
+    assert f"while executing {__file__}:_raise_error," in message
 
 
 def test_with_decorated_function(mock_logger):
     """
     Test decorated function case.
     """
-    # Create mock exception with traceback chain
-    mock_exc = MagicMock(spec=Exception)
-    mock_exc.__str__.return_value = "Wrapper error"
 
-    # Setup traceback chain using PropertyMock
-    inner_tb = MagicMock(tb_frame=MagicMock(), tb_lineno=100)
-    outer_tb = MagicMock(tb_next=inner_tb)
-    type(mock_exc).__traceback__ = PropertyMock(return_value=outer_tb)
+    def some_function():
+        pass
+
+    # NOTE: passing fn signals a decorated function
+    retry_state = _retry_state(
+        outcome=_failed_outcome("Wrapper error"), fn=some_function
+    )
+
+    tenacity_retry_log(mock_logger)(retry_state)
+
+    message = mock_logger.log.call_args[0][1]
+    assert f"{__file__}:{some_function.__qualname__}," in message
+    lineno = _raise_error.__code__.co_firstlineno + 4
+    assert f"at line {lineno} of {__file__}" in message
+
 
-    outcome = MagicMock(spec=Future)
-    outcome.exception.return_value = mock_exc
+def test_with_successful_outcome(mock_logger):
+    """
+    Test retrying on a result (no exception) does not inspect a traceback.
+    """
+    outcome = Future(attempt_number=1)
+    outcome.set_result("not good enough")
 
-    retry_state = MagicMock()
-    retry_state.attempt_number = 1
-    retry_state.outcome = outcome
-    retry_state.fn = "some_function"  # signal decorated function
+    retry_state = _retry_state(outcome=outcome, attempt_number=2, stop=_STOP_3)
 
     tenacity_retry_log(mock_logger)(retry_state)
 
-    assert "line 100" in mock_logger.log.call_args[0][1]
+    assert mock_logger.log.call_args[0][1].startswith("Retry 2 of 3: ")
+
+
+def test_log_level_disabled(mock_logger):
+    """
+    Test nothing is inspected or logged when the log level is disabled.
+    """
+    mock_logger.isEnabledFor.return_value = False
+    retry_state = _retry_state(outcome=MagicMock())
+
+    tenacity_retry_log(mock_logger, logging.DEBUG)(retry_state)
+
+    mock_logger.isEnabledFor.assert_called_once_with(logging.DEBUG)
+    mock_logger.log.assert_not_called()
+    retry_state.outcome.exception.assert_not_called()
+
+
+def test_with_real_exception():
+    """
+    Test the logged call site from a real tenacity retry.
+    """
+    logger = MagicMock(spec=logging.Logger)
+    logger.isEnabledFor.return_value = True
+
+    @retry(reraise=True, stop=stop_after_attempt(2), after=tenacity_retry_log(logger))
+    def always_fails():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        always_fails()
+
+    message = logger.log.call_args_list[0][0][1]
+    assert message.startswith("Retry 1 of 2: while executing ")
+    assert f"{__file__}:{always_fails.__wrapped__.__qualname__}," in message
+    assert "boom" in message
+
+
+@pytest.mark.parametrize(
+    "exc, expected",
+    [
+        (httpx.ConnectError("connection refused"), True),
+        (httpx.ReadTimeout("read timed out"), True),
+        (BaseUpstreamRepositoryException(httpx.Response(500)), True),
+        (BaseUpstreamRepositoryException(httpx.Response(503)), True),
+        (BaseUpstreamRepositoryException(httpx.Response(429)), True),
+        (BaseUpstreamRepositoryException(httpx.Response(400)), False),
+        (BaseUpstreamRepositoryException(httpx.Response(404)), False),
+        (ValueError("bad value"), False),
+    ],
+)
+def test_is_transient_upstream_error(exc, expected):
+    """
+    Test only transient upstream errors are considered retryable.
+    """
+    assert is_transient_upstream_error(exc) is expected
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        RedisConnectionError("connection refused"),
+        RedisTimeoutError("timed out"),
+        ConnectionError("connection reset"),
+        TimeoutError("timed out"),
+    ],
+)
+def test_redis_retry_retries_connection_errors(exc):
+    """
+    Test redis_retry retries connection errors and timeouts, up to 5 attempts.
+    """
+    calls = MagicMock(side_effect=exc)
+    with pytest.raises(type(exc)):
+        redis_retry(calls)()
+
+    assert calls.call_count == 5
+
+
+def test_redis_retry_does_not_retry_other_errors():
+    """
+    Test redis_retry fails fast on errors that will not go away by retrying.
+    """
+    calls = MagicMock(side_effect=ResponseError("WRONGTYPE"))
+    with pytest.raises(ResponseError):
+        redis_retry(calls)()
+
+    assert calls.call_count == 1
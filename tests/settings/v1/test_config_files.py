@@ -4,40 +4,89 @@
 
 """Unit tests for settings functions."""
 
-import tempfile
+import logging
 from pathlib import Path
+from typing import Callable
+from unittest.mock import patch
 
+import pytest
 import yaml
 
 from nmtfast.settings.v1.config_files import (
+    clear_config_files_cache,
     deep_merge,
     get_config_files,
     load_config,
+    load_config_lazy,
     load_yaml,
 )
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
 
-def create_temp_yaml(data: dict) -> Path:
+_DEFAULT_CONFIG_FILES: tuple[str, ...] = (
+    "./src/nmtfast-config-default.yaml",
+    "./nmtfast-config-default.yaml",
+    "./conf/nmtfast-config.yaml",
+    "./nmtfast-config.yaml",
+    "../nmtfast-config.yaml",
+)
+
+
+@pytest.fixture
+def yaml_writer(tmp_path: Path) -> Callable[..., Path]:
     """
-    Helper function to create a temporary YAML file.
+    Fixture returning a helper that writes data to a YAML file under tmp_path.
     """
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".yaml")
 
-    with open(temp_file.name, "w") as f:
-        yaml.dump(data, f)
+    def write(data: dict, name: str = "config.yaml") -> Path:
+        yaml_file = tmp_path / name
+        yaml_file.write_text(yaml.dump(data, Dumper=_SafeDumper))
+        return yaml_file
 
-    return Path(temp_file.name)
+    return write
 
 
-def test_load_yaml():
+def test_load_yaml(yaml_writer):
     """
     Test that load_yaml correctly loads a YAML file into a dictionary.
     """
     test_data = {"key": "value", "nested": {"subkey": "subvalue"}}
-    temp_yaml = create_temp_yaml(test_data)
+    temp_yaml = yaml_writer(test_data)
 
     assert load_yaml(temp_yaml) == test_data
-    temp_yaml.unlink()  # Clean up temp file
+
+
+def test_load_yaml_is_cached(tmp_path):
+    """
+    Test that load_yaml only re-parses a file after it changes.
+    """
+    yaml_file = tmp_path / "config.yaml"
+    yaml_file.write_text("key: value")
+
+    with patch("nmtfast.settings.v1.config_files.yaml.load") as mock_load:
+        mock_load.return_value = {"key": "value"}
+        assert load_yaml(yaml_file) == {"key": "value"}
+        assert load_yaml(yaml_file) == {"key": "value"}
+        mock_load.assert_called_once()
+
+        yaml_file.write_text("key: changed")
+        mock_load.return_value = {"key": "changed"}
+        assert load_yaml(yaml_file) == {"key": "changed"}
+        assert mock_load.call_count == 2
+
+
+def test_load_yaml_uses_safe_loader(tmp_path):
+    """
+    Test that load_yaml refuses to construct arbitrary Python objects.
+    """
+    yaml_file = tmp_path / "unsafe.yaml"
+    yaml_file.write_text("key: !!python/object/apply:os.getcwd []")
+
+    with pytest.raises(yaml.constructor.ConstructorError):
+        load_yaml(yaml_file)
 
 
 def test_load_yaml_nonexistent():
@@ -58,7 +107,50 @@ def test_deep_merge():
     assert deep_merge(dict1, dict2) == expected
 
 
-def test_load_config():
+def test_deep_merge_does_not_modify_inputs():
+    """
+    Test that deep_merge leaves both input dictionaries untouched.
+    """
+    dict1 = {"b": {"x": 10}}
+    dict2 = {"b": {"y": 25}, "c": {"z": 30}}
+
+    merged = deep_merge(dict1, dict2)
+    merged["b"]["x"] = 0
+    merged["c"]["z"] = 0
+
+    assert dict1 == {"b": {"x": 10}}
+    assert dict2 == {"b": {"y": 25}, "c": {"z": 30}}
+
+
+def test_load_yaml_returns_copies(tmp_path):
+    """
+    Test that modifying the result of load_yaml does not affect later calls.
+    """
+    yaml_file = tmp_path / "config.yaml"
+    yaml_file.write_text("nested:\n  items: [1, 2]")
+
+    contents = load_yaml(yaml_file)
+    contents["nested"]["items"].append(3)
+    contents["added"] = True
+
+    assert load_yaml(yaml_file) == {"nested": {"items": [1, 2]}}
+
+
+def test_load_config_does_not_modify_cached_yaml(tmp_path):
+    """
+    Test that merging config files does not modify the cached YAML contents.
+    """
+    base_yaml = tmp_path / "base.yaml"
+    base_yaml.write_text("nested:\n  key1: value1")
+    override_yaml = tmp_path / "override.yaml"
+    override_yaml.write_text("nested:\n  key1: override")
+
+    load_config([str(base_yaml), str(override_yaml)])
+
+    assert load_yaml(base_yaml) == {"nested": {"key1": "value1"}}
+
+
+def test_load_config(yaml_writer):
     """
     Test that load_config loads and merges multiple YAML files in order.
     """
@@ -66,9 +158,9 @@ def test_load_config():
     env_config = {"nested": {"key1": "override", "key2": "added"}}
     service_config = {"service_specific": True}
 
-    base_yaml = create_temp_yaml(base_config)
-    env_yaml = create_temp_yaml(env_config)
-    service_yaml = create_temp_yaml(service_config)
+    base_yaml = yaml_writer(base_config, "base.yaml")
+    env_yaml = yaml_writer(env_config, "env.yaml")
+    service_yaml = yaml_writer(service_config, "service.yaml")
 
     config_files = [str(base_yaml), str(env_yaml), str(service_yaml)]
     merged_config = load_config(config_files)
@@ -80,48 +172,127 @@ def test_load_config():
 
     assert merged_config == expected_config
 
-    for temp_yaml in [base_yaml, env_yaml, service_yaml]:
-        temp_yaml.unlink()  # Clean up temp files
-
 
 def test_get_config_files(monkeypatch):
     """
     Test that get_config_files respects APP_CONFIG_FILES environment variable.
     """
+    clear_config_files_cache()
     monkeypatch.setenv("APP_CONFIG_FILES", "/custom/path1.yaml,/custom/path2.yaml")
     assert get_config_files() == ["/custom/path1.yaml", "/custom/path2.yaml"]
 
+    # the result is cached until clear_config_files_cache() is called
     monkeypatch.delenv("APP_CONFIG_FILES", raising=False)
-    assert get_config_files() == [
-        "./src/nmtfast-config-default.yaml",
-        "./nmtfast-config-default.yaml",
-        "./conf/nmtfast-config.yaml",
-        "./nmtfast-config.yaml",
-        "../nmtfast-config.yaml",
-    ]
+    assert get_config_files() == ["/custom/path1.yaml", "/custom/path2.yaml"]
 
+    clear_config_files_cache()
+    assert tuple(get_config_files()) == _DEFAULT_CONFIG_FILES
 
-def test_load_config_file_existence_handling(tmp_path, capsys):
+    # callers get their own list, so modifying it does not change the cached result
+    get_config_files().append("/extra.yaml")
+    assert tuple(get_config_files()) == _DEFAULT_CONFIG_FILES
+
+
+def test_load_config_file_existence_handling(tmp_path, caplog):
     """
     Test that load_config properly handles both existing and non-existent files,
-    specifically covering the Path(file).exists() conditional.
+    specifically covering the os.path.isfile() conditional.
     """
     # create one real file
     existing_file = tmp_path / "existing.yaml"
     existing_file.write_text("key: value")
 
-    # use one non-existent file
+    # use one non-existent file, and one path which is not a file
     non_existent_file = tmp_path / "nonexistent.yaml"
+    directory = tmp_path / "directory.yaml"
+    directory.mkdir()
 
-    # run with both files
-    result = load_config([str(existing_file), str(non_existent_file)])
+    # run with all paths
+    with caplog.at_level(logging.DEBUG, logger="nmtfast.settings.v1.config_files"):
+        result = load_config(
+            [str(existing_file), str(non_existent_file), str(directory)]
+        )
 
     # verify the merge still occurred with just the existing file
     assert result == {"key": "value"}
 
-    # verify the print output shows we only loaded the existing file
-    captured = capsys.readouterr()
-    assert f"Looking for config file: {existing_file} ..." in captured.out
-    assert f"Loading config file: {existing_file}" in captured.out
-    assert f"Looking for config file: {non_existent_file} ..." in captured.out
-    assert f"Loading config file: {non_existent_file}" not in captured.out
+    # verify the log output shows we only loaded the existing file
+    messages = caplog.messages
+    assert f"Looking for config file: {existing_file} ..." in messages
+    assert f"Loading config file: {existing_file}" in messages
+    assert f"Looking for config file: {non_existent_file} ..." in messages
+    assert f"Loading config file: {non_existent_file}" not in messages
+    assert f"Loading config file: {directory}" not in messages
+
+
+def test_load_config_uses_cache_file(tmp_path, monkeypatch, caplog):
+    """
+    Test that load_config reuses APP_CONFIG_CACHE until a config file changes.
+    """
+    cache_file = tmp_path / "config.cache.json"
+    monkeypatch.setenv("APP_CONFIG_CACHE", str(cache_file))
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("key: value")
+    missing_file = tmp_path / "missing.yaml"
+    config_files = [str(config_file), str(missing_file)]
+
+    assert load_config(config_files) == {"key": "value"}
+    assert cache_file.read_text().startswith("# fp=")
+
+    with (
+        patch("nmtfast.settings.v1.config_files.load_yaml") as mock_load_yaml,
+        caplog.at_level(logging.INFO, logger="nmtfast.settings.v1.config_files"),
+    ):
+        assert load_config(config_files) == {"key": "value"}
+        mock_load_yaml.assert_not_called()
+    assert f"Loading cached config: {cache_file}" in caplog.text
+
+    # creating a previously missing file invalidates the cache
+    missing_file.write_text("other: 1")
+    assert load_config(config_files) == {"key": "value", "other": 1}
+
+
+def test_load_config_skips_cache_for_non_json_config(tmp_path, monkeypatch):
+    """
+    Test that configs which cannot round-trip through JSON are not cached.
+    """
+    cache_file = tmp_path / "config.cache.json"
+    monkeypatch.setenv("APP_CONFIG_CACHE", str(cache_file))
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("1: one\nday: 2025-01-01")
+
+    config = load_config([str(config_file)])
+
+    assert config[1] == "one"
+    assert not cache_file.exists()
+
+
+def test_load_config_lazy(tmp_path):
+    """
+    Test that load_config_lazy merges like load_config but parses files on demand.
+    """
+    base_yaml = tmp_path / "base.yaml"
+    base_yaml.write_text("name: base\nnested:\n  key1: value1\n  key2: value2")
+    override_yaml = tmp_path / "override.yaml"
+    override_yaml.write_text("name: override\nnested:\n  key1: override")
+    config_files = [str(base_yaml), str(override_yaml), str(tmp_path / "none.yaml")]
+
+    with patch(
+        "nmtfast.settings.v1.config_files.load_yaml", side_effect=load_yaml
+    ) as mock_load_yaml:
+        config = load_config_lazy(config_files)
+        mock_load_yaml.assert_not_called()
+
+        # a scalar in the highest precedence file does not need the other files
+        assert config["name"] == "override"
+        mock_load_yaml.assert_called_once_with(override_yaml)
+
+        assert config["nested"] == {"key1": "override", "key2": "value2"}
+        assert mock_load_yaml.call_count == 2
+
+    assert "missing" not in config
+    assert sorted(config) == ["name", "nested"]
+    assert len(config) == 2
+    assert config.materialize() == load_config(config_files)
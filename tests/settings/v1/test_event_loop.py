@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""Unit tests for event loop helpers."""
+
+import asyncio
+import sys
+import types
+from unittest.mock import MagicMock
+
+from nmtfast.settings.v1.event_loop import install_uvloop
+
+
+def test_install_uvloop_not_installed(monkeypatch):
+    """
+    Test install_uvloop leaves the event loop policy alone without uvloop.
+    """
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    set_policy = MagicMock()
+    monkeypatch.setattr(asyncio, "set_event_loop_policy", set_policy)
+
+    assert install_uvloop() is False
+    set_policy.assert_not_called()
+
+
+def test_install_uvloop_installed(monkeypatch):
+    """
+    Test install_uvloop installs the uvloop event loop policy when available.
+    """
+    uvloop = types.ModuleType("uvloop")
+    uvloop.EventLoopPolicy = MagicMock(return_value="uvloop policy")  # type: ignore
+    monkeypatch.setitem(sys.modules, "uvloop", uvloop)
+    set_policy = MagicMock()
+    monkeypatch.setattr(asyncio, "set_event_loop_policy", set_policy)
+
+    assert install_uvloop() is True
+    set_policy.assert_called_once_with("uvloop policy")
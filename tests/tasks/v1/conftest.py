@@ -4,18 +4,24 @@
 
 """pytest fixtures for unit / integration tests."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
-from huey import Huey
 
 
 @pytest.fixture
-def mock_huey():
+def mock_huey() -> SimpleNamespace:
     """
     Fixture providing a mock Huey instance.
-    """
-    huey = MagicMock(spec=Huey)
-    huey.storage = MagicMock()
 
-    return huey
+    Only the attributes used by nmtfast.tasks.v1.huey are provided, which is much
+    cheaper than building MagicMock(spec=Huey) for every test.
+    """
+    return SimpleNamespace(
+        put=MagicMock(),
+        get=MagicMock(),
+        result=MagicMock(),
+        serializer=MagicMock(),
+        storage=MagicMock(),
+    )
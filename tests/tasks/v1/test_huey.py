@@ -6,9 +6,15 @@
 
 from unittest.mock import MagicMock
 
-from huey import Huey
+import pytest
 from huey.exceptions import TaskException
-from huey.storage import MemoryStorage, RedisStorage
+from huey.storage import (
+    BaseStorage,
+    MemoryStorage,
+    RedisExpireStorage,
+    RedisStorage,
+)
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from nmtfast.tasks.v1.huey import (
     fetch_task_metadata,
@@ -17,11 +23,22 @@ from nmtfast.tasks.v1.huey import (
 )
 
 
+def _bare_storage(storage_class: type[BaseStorage]) -> BaseStorage:
+    """
+    Create a real Huey storage instance without running its __init__.
+
+    The helpers branch on isinstance() against the storage classes, and this passes
+    those checks without connecting to anything or building a spec'd MagicMock;
+    tests set the few attributes (name, conn, ...) they need.
+    """
+    return object.__new__(storage_class)
+
+
 def test_store_task_metadata(mock_huey):
     """
     Test storing metadata with Redis storage.
     """
-    mock_huey.storage = MagicMock(spec=RedisStorage)
+    mock_huey.storage = _bare_storage(RedisStorage)
     mock_huey.storage.name = "test_app"
     mock_huey.storage.conn = MagicMock()
 
@@ -32,18 +49,54 @@ def test_store_task_metadata(mock_huey):
     mock_huey.storage.conn.expire.assert_called_once()
 
 
-def test_store_task_metadata_non_redis():
+def test_store_task_metadata_redis_expire_storage(mock_huey):
+    """
+    Test storing metadata with RedisExpireStorage sets the TTL in one command.
+    """
+    mock_huey.storage = _bare_storage(RedisExpireStorage)
+    mock_huey.storage.result_key = lambda key: f"huey.r.test_app.{key}".encode()
+    mock_huey.storage.conn = MagicMock()
+    mock_huey.serializer.serialize.return_value = b"serialized"
+
+    result = store_task_metadata(mock_huey, "test123", {"status": "running"}, ttl=60)
+
+    assert result is True
+    mock_huey.serializer.serialize.assert_called_once_with({"status": "running"})
+    mock_huey.storage.conn.set.assert_called_once_with(
+        b"huey.r.test_app.md_test123", b"serialized", ex=60
+    )
+    mock_huey.storage.conn.expire.assert_not_called()
+    mock_huey.put.assert_not_called()
+
+
+@pytest.mark.parametrize("ttl", [0, -1])
+def test_store_task_metadata_redis_expire_storage_non_positive_ttl(mock_huey, ttl):
+    """
+    Test a non-positive TTL deletes the metadata instead of sending an invalid SET.
+    """
+    mock_huey.storage = _bare_storage(RedisExpireStorage)
+    mock_huey.storage.result_key = lambda key: f"huey.r.test_app.{key}".encode()
+    mock_huey.storage.conn = MagicMock()
+
+    result = store_task_metadata(mock_huey, "test123", {"status": "running"}, ttl=ttl)
+
+    assert result is True
+    mock_huey.storage.conn.delete.assert_called_once_with(b"huey.r.test_app.md_test123")
+    mock_huey.storage.conn.set.assert_not_called()
+    mock_huey.put.assert_not_called()
+
+
+def test_store_task_metadata_non_redis(mock_huey):
     """
     Test with explicit non-Redis storage.
     """
-    huey = MagicMock(spec=Huey)
-    huey.storage = MagicMock(spec=MemoryStorage)
+    mock_huey.storage = _bare_storage(MemoryStorage)
 
-    result = store_task_metadata(huey, "test123", {"status": "running"})
+    result = store_task_metadata(mock_huey, "test123", {"status": "running"})
 
     assert result is True
-    huey.put.assert_called_once()
-    assert not hasattr(huey.storage, "conn")
+    mock_huey.put.assert_called_once()
+    assert not hasattr(mock_huey.storage, "conn")
 
 
 def test_fetch_task_metadata_found(mock_huey):
@@ -94,3 +147,20 @@ def test_fetch_task_result_exception(mock_huey):
     assert result == {"error": "failed"}
     mock_huey.result.assert_called_once()
     mock_huey.get.assert_called_once()
+
+
+def test_fetch_task_metadata_retries_redis_connection_errors(mock_huey):
+    """
+    Test that Redis connection errors are retried, and other errors are not.
+    """
+    mock_huey.get.side_effect = [RedisConnectionError("down"), {"status": "ok"}]
+
+    assert fetch_task_metadata(mock_huey, "test123") == {"status": "ok"}
+    assert mock_huey.get.call_count == 2
+
+    mock_huey.get.reset_mock()
+    mock_huey.get.side_effect = TypeError("not retried")
+
+    with pytest.raises(TypeError):
+        fetch_task_metadata(mock_huey, "test123")
+    mock_huey.get.assert_called_once()